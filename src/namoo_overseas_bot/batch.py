@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import csv
+from dataclasses import asdict, dataclass, field, fields
+import glob
+import os
+from pathlib import Path
+import sys
+import time
+from typing import IO
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.cache import load_cached_candle_series
+from namoo_overseas_bot.market_data.csv_feed import load_candle_series
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+@dataclass(frozen=True)
+class BatchTask:
+    symbol: str
+    csv_path: str
+
+
+@dataclass(frozen=True)
+class BatchSettings:
+    short_window: int
+    long_window: int
+    quantity: int
+    initial_cash_usd: float
+    use_cache: bool = True
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    symbol: str
+    csv_path: str
+    bars: int
+    trades: int
+    cash: float
+    position_qty: int
+    last_price: float
+    equity: float
+    return_pct: float
+    seconds: float
+    error: str = ""
+
+
+@dataclass
+class BatchSummary:
+    """Running totals over the results seen so far."""
+
+    initial_cash_usd: float
+    symbols: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    bars: int = 0
+    trades: int = 0
+    total_equity: float = 0.0
+    winners: int = 0
+    losers: int = 0
+    best: tuple[str, float] | None = None
+    worst: tuple[str, float] | None = None
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def add(self, result: BatchResult) -> None:
+        self.symbols += 1
+        if result.error:
+            self.failed += 1
+            return
+        self.succeeded += 1
+        self.bars += result.bars
+        self.trades += result.trades
+        self.total_equity += result.equity
+        if result.return_pct > 0:
+            self.winners += 1
+        elif result.return_pct < 0:
+            self.losers += 1
+        if self.best is None or result.return_pct > self.best[1]:
+            self.best = (result.symbol, result.return_pct)
+        if self.worst is None or result.return_pct < self.worst[1]:
+            self.worst = (result.symbol, result.return_pct)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def total_return_pct(self) -> float:
+        invested = self.initial_cash_usd * self.succeeded
+        return (self.total_equity / invested - 1.0) * 100.0 if invested else 0.0
+
+
+def discover_tasks(sources: Iterable[str]) -> list[BatchTask]:
+    """
+    Expand directories (``*.csv`` inside), glob patterns and plain files into tasks.
+
+    The symbol is the upper-cased file stem (``data/us/aapl.csv`` -> ``AAPL``). When
+    two files map to the same symbol the first one wins.
+    """
+    paths: list[Path] = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            paths.extend(sorted(path.glob("*.csv")))
+        elif glob.has_magic(source):
+            paths.extend(Path(p) for p in sorted(glob.glob(source)))
+        elif path.is_file():
+            paths.append(path)
+        else:
+            raise FileNotFoundError(f"no CSV found for {source!r}")
+
+    tasks: dict[str, BatchTask] = {}
+    for path in paths:
+        symbol = path.stem.upper()
+        tasks.setdefault(symbol, BatchTask(symbol=symbol, csv_path=str(path)))
+    return list(tasks.values())
+
+
+def run_task(task: BatchTask, settings: BatchSettings) -> BatchResult:
+    """Backtest one symbol; errors are returned in the result so one bad file never stops a batch."""
+    started = time.perf_counter()
+    bars = 0
+    try:
+        if settings.use_cache:
+            candles = load_cached_candle_series(task.csv_path, symbol=task.symbol)
+        else:
+            candles = load_candle_series(task.csv_path, symbol=task.symbol)
+        bars = len(candles)
+        result = TradingEngine(
+            broker=PaperBroker(initial_cash_usd=settings.initial_cash_usd),
+            strategy=SmaCrossStrategy(
+                short_window=settings.short_window,
+                long_window=settings.long_window,
+            ),
+            symbol=task.symbol,
+            quantity=settings.quantity,
+        ).run(candles)
+    except Exception as exc:
+        return _failed_result(task, exc, bars=bars, seconds=time.perf_counter() - started)
+
+    cash = settings.initial_cash_usd
+    return BatchResult(
+        symbol=task.symbol,
+        csv_path=task.csv_path,
+        bars=bars,
+        trades=result.trades,
+        cash=result.cash,
+        position_qty=result.position_qty,
+        last_price=result.last_price,
+        equity=result.equity,
+        return_pct=(result.equity / cash - 1.0) * 100.0 if cash else 0.0,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _failed_result(task: BatchTask, exc: BaseException, *, bars: int = 0, seconds: float = 0.0) -> BatchResult:
+    return BatchResult(
+        symbol=task.symbol,
+        csv_path=task.csv_path,
+        bars=bars,
+        trades=0,
+        cash=0.0,
+        position_qty=0,
+        last_price=0.0,
+        equity=0.0,
+        return_pct=0.0,
+        seconds=seconds,
+        error=f"{type(exc).__name__}: {exc}",
+    )
+
+
+def run_batch(
+    tasks: Sequence[BatchTask],
+    settings: BatchSettings,
+    *,
+    workers: int | None = None,
+    max_tasks_per_child: int | None = 100,
+    max_in_flight: int | None = None,
+) -> Iterator[BatchResult]:
+    """
+    Yield one ``BatchResult`` per task in completion order; a task whose worker
+    crashed gets an error row like any other failure.
+
+    Each worker loads its own CSV, so only paths and small results cross process
+    boundaries, and at most ``max_in_flight`` tasks are queued at a time. On Python
+    3.11+ workers are replaced after ``max_tasks_per_child`` symbols, which bounds
+    the memory an allocator-fragmenting worker can hold on to.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield run_task(task, settings)
+        return
+
+    max_in_flight = max_in_flight or workers * 4
+    pool_kwargs: dict[str, int] = {}
+    if max_tasks_per_child and sys.version_info >= (3, 11):
+        pool_kwargs["max_tasks_per_child"] = max_tasks_per_child
+
+    pending = iter(tasks)
+    with ProcessPoolExecutor(max_workers=workers, **pool_kwargs) as executor:
+        in_flight: dict[Future[BatchResult], BatchTask] = {}
+        while True:
+            for task in pending:
+                try:
+                    in_flight[executor.submit(run_task, task, settings)] = task
+                except BrokenProcessPool as exc:
+                    # A crashed worker breaks the pool; report the rest instead of aborting.
+                    yield _failed_result(task, exc)
+                    continue
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                return
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    # The worker died (e.g. killed for memory) or the result could not be sent back.
+                    result = _failed_result(task, exc)
+                yield result
+
+
+class BatchCsvWriter:
+    """Appends each result as soon as it arrives, so a long batch can be watched while it runs."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self._writer = csv.DictWriter(stream, fieldnames=[f.name for f in fields(BatchResult)])
+        self._stream = stream
+        self._writer.writeheader()
+
+    def write(self, result: BatchResult) -> None:
+        self._writer.writerow(asdict(result))
+        self._stream.flush()
+
+
+def format_result(result: BatchResult, index: int, total: int) -> str:
+    prefix = f"[{index}/{total}] {result.symbol:<8}"
+    if result.error:
+        return f"{prefix} error: {result.error}"
+    return (
+        f"{prefix} bars={result.bars} trades={result.trades} "
+        f"equity={result.equity:.2f} return={result.return_pct:+.2f}%"
+    )
+
+
+def format_summary(summary: BatchSummary) -> str:
+    elapsed = summary.elapsed_seconds
+    lines = [
+        f"symbols: {summary.symbols} (ok={summary.succeeded}, failed={summary.failed})",
+        f"bars: {summary.bars}  trades: {summary.trades}",
+        f"total equity: ${summary.total_equity:.2f} ({summary.total_return_pct:+.2f}%)",
+        f"winners/losers: {summary.winners}/{summary.losers}",
+    ]
+    if summary.best and summary.worst:
+        lines.append(
+            f"best: {summary.best[0]} {summary.best[1]:+.2f}%  worst: {summary.worst[0]} {summary.worst[1]:+.2f}%"
+        )
+    rate = summary.symbols / elapsed if elapsed > 0 else 0.0
+    lines.append(f"elapsed: {elapsed:.1f}s ({rate:.1f} symbols/s)")
+    return "\n".join(lines)
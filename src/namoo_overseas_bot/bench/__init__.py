@@ -0,0 +1,26 @@
+from namoo_overseas_bot.bench.cases import CASES, BenchCase, synthetic_candles, write_synthetic_csv
+from namoo_overseas_bot.bench.runner import (
+    BenchResult,
+    Comparison,
+    compare,
+    load_results,
+    results_payload,
+    run_case,
+    run_suite,
+    write_results,
+)
+
+__all__ = [
+    "BenchCase",
+    "BenchResult",
+    "CASES",
+    "Comparison",
+    "compare",
+    "load_results",
+    "results_payload",
+    "run_case",
+    "run_suite",
+    "synthetic_candles",
+    "write_results",
+    "write_synthetic_csv",
+]
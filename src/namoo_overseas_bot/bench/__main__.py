@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from namoo_overseas_bot.bench.cases import CASES
+from namoo_overseas_bot.bench.runner import (
+    compare,
+    format_comparison,
+    format_results,
+    load_results,
+    results_payload,
+    run_suite,
+    write_results,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m namoo_overseas_bot.bench",
+        description="Benchmark the loader, strategy, bar aggregator, engine, bot tick, control API and bridge client",
+    )
+    parser.add_argument("--quick", action="store_true", help="small sizes for a fast smoke run")
+    parser.add_argument("--repeat", type=int, default=None, help="timed runs per case (default: 5, quick: 3)")
+    parser.add_argument(
+        "--case",
+        action="append",
+        default=[],
+        choices=[case.name for case in CASES],
+        help="run only this case (repeatable)",
+    )
+    parser.add_argument("--out", default="bench_results.json", help="JSON results path")
+    parser.add_argument("--baseline", default=None, help="saved results JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="allowed median slowdown vs baseline before failing (0.15 = 15%%)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    repeat = args.repeat or (3 if args.quick else 5)
+
+    results = run_suite(CASES, quick=args.quick, repeat=repeat, only=args.case)
+    write_results(args.out, results_payload(results, quick=args.quick))
+    print(format_results(results))
+    print(f"\nresults written to {args.out}")
+
+    if not args.baseline:
+        return 0
+    comparisons = compare(results, load_results(args.baseline), threshold=args.threshold)
+    print()
+    print(format_comparison(comparisons))
+    regressed = [c for c in comparisons if c.regressed]
+    if regressed:
+        print(f"\n{len(regressed)} case(s) slower than baseline by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import http.client
+from pathlib import Path
+import random
+import tempfile
+import threading
+
+from namoo_overseas_bot.brokers.bridge_standin import StandInBridge
+from namoo_overseas_bot.brokers.namoo_bridge import NamooBridgeBroker
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.aggregator import BarAggregator
+from namoo_overseas_bot.market_data.csv_feed import load_candle_series, load_candles
+from namoo_overseas_bot.market_data.series import DATETIME_FORMAT, CandleSeries
+from namoo_overseas_bot.models import Candle, Order, Side
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.api_server import BotApiServer
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+SYMBOL = "BENCH"
+SEED = 20240101
+SHORT_WINDOW = 5
+LONG_WINDOW = 20
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """
+    One benchmark. ``prepare(size)`` is a context manager whose setup and teardown
+    run untimed; it yields the timed callable, which performs ``size`` operations
+    of ``unit``.
+    """
+
+    name: str
+    unit: str
+    sizes: tuple[int, ...]
+    quick_sizes: tuple[int, ...]
+    prepare: Callable[[int], AbstractContextManager[Callable[[], object]]]
+
+
+def synthetic_candles(size: int, *, seed: int = SEED) -> list[Candle]:
+    """Seeded one-minute random walk, identical across runs and machines."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    price = 100.0
+    candles: list[Candle] = []
+    for idx in range(size):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0.0, 0.5))
+        high = max(open_, price) + rng.random() * 0.2
+        low = min(open_, price) - rng.random() * 0.2
+        candles.append(
+            Candle(
+                symbol=SYMBOL,
+                timestamp=(start + timedelta(minutes=idx)).strftime(DATETIME_FORMAT),
+                open=round(open_, 4),
+                high=round(high, 4),
+                low=round(low, 4),
+                close=round(price, 4),
+                volume=rng.randrange(1_000, 100_000),
+            )
+        )
+    return candles
+
+
+def write_synthetic_csv(path: Path, size: int) -> Path:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        f.write("timestamp,open,high,low,close,volume\n")
+        for c in synthetic_candles(size):
+            f.write(f"{c.timestamp},{c.open},{c.high},{c.low},{c.close},{c.volume}\n")
+    return path
+
+
+def _csv_path(size: int) -> Path:
+    # Generated once per size and process; the loader cases only read it.
+    path = Path(tempfile.gettempdir()) / f"namoo-bench-{SEED}-{size}.csv"
+    if not path.exists():
+        tmp = path.with_suffix(".tmp")
+        write_synthetic_csv(tmp, size)
+        tmp.replace(path)
+    return path
+
+
+@contextmanager
+def _prepare_load_candles(size: int) -> Iterator[Callable[[], object]]:
+    path = _csv_path(size)
+    yield lambda: load_candles(path, symbol=SYMBOL)
+
+
+@contextmanager
+def _prepare_load_candle_series(size: int) -> Iterator[Callable[[], object]]:
+    path = _csv_path(size)
+    yield lambda: load_candle_series(path, symbol=SYMBOL)
+
+
+@contextmanager
+def _prepare_strategy(size: int) -> Iterator[Callable[[], object]]:
+    closes = [c.close for c in synthetic_candles(size)]
+
+    def run() -> object:
+        strategy = SmaCrossStrategy(short_window=SHORT_WINDOW, long_window=LONG_WINDOW)
+        on_price = strategy.on_price
+        for close in closes:
+            on_price(close)
+        return strategy
+
+    yield run
+
+
+@contextmanager
+def _prepare_aggregator(size: int) -> Iterator[Callable[[], object]]:
+    series = CandleSeries.from_candles(synthetic_candles(size))
+    columns = (series.timestamps, series.open, series.high, series.low, series.close, series.volume)
+    bars = list(zip(*columns))
+
+    def run() -> object:
+        aggregator = BarAggregator(SYMBOL, ("5m", "1h", "1d"))
+        aggregator.subscribe("5m", lambda timeframe, bar, closed: None)
+        add_bar = aggregator.add_bar
+        for bar in bars:
+            add_bar(*bar)
+        return aggregator
+
+    yield run
+
+
+@contextmanager
+def _prepare_engine(size: int) -> Iterator[Callable[[], object]]:
+    series = CandleSeries.from_candles(synthetic_candles(size))
+
+    def run() -> object:
+        engine = TradingEngine(
+            broker=PaperBroker(initial_cash_usd=1_000_000_000.0),
+            strategy=SmaCrossStrategy(short_window=SHORT_WINDOW, long_window=LONG_WINDOW),
+            symbol=SYMBOL,
+            quantity=1,
+        )
+        return engine.run(series)
+
+    yield run
+
+
+def _bot(candles: CandleSeries | list[Candle]) -> PaperTradingBot:
+    return PaperTradingBot(
+        broker=PaperBroker(initial_cash_usd=1_000_000_000.0),
+        strategy=SmaCrossStrategy(short_window=SHORT_WINDOW, long_window=LONG_WINDOW),
+        notifier=NoOpNotifier(),
+        symbol=SYMBOL,
+        quantity=1,
+        candles=candles,
+        tick_seconds=1.0,
+        max_position_qty=1,
+    )
+
+
+@contextmanager
+def _prepare_process_next_candle(size: int) -> Iterator[Callable[[], object]]:
+    series = CandleSeries.from_candles(synthetic_candles(size))
+
+    def run() -> object:
+        bot = _bot(series)
+        step = bot.process_next_candle
+        for _ in range(size):
+            step()
+        return bot
+
+    yield run
+
+
+@contextmanager
+def _prepare_api_status(size: int) -> Iterator[Callable[[], object]]:
+    bot = _bot(synthetic_candles(100))
+    for _ in range(50):
+        bot.process_next_candle()
+    server = BotApiServer(
+        bot=bot,
+        host="127.0.0.1",
+        port=0,
+        status_snapshots=bot.status_publisher,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+
+    def run() -> object:
+        # The control API speaks HTTP/1.0, so every request is a fresh connection.
+        for _ in range(size):
+            conn = http.client.HTTPConnection(host, port, timeout=5)
+            conn.request("GET", "/status")
+            response = conn.getresponse()
+            response.read()
+            conn.close()
+            if response.status != 200:
+                raise RuntimeError(f"/status returned {response.status}")
+        return None
+
+    try:
+        yield run
+    finally:
+        server.shutdown()
+
+
+@contextmanager
+def _prepare_bridge_orders(size: int) -> Iterator[Callable[[], object]]:
+    bridge = StandInBridge(initial_cash_usd=1_000_000_000.0).start()
+    broker = NamooBridgeBroker(base_url=bridge.base_url, account_no="BENCH", product_code="01")
+    buy, sell = Order(SYMBOL, Side.BUY, 1), Order(SYMBOL, Side.SELL, 1)
+
+    def run() -> object:
+        # Keep-alive round trips: one connection for the whole run.
+        submit = broker.submit_order
+        for idx in range(size):
+            submit(sell if idx % 2 else buy, 100.0, "bench")
+        return None
+
+    try:
+        yield run
+    finally:
+        broker.close()
+        bridge.close()
+
+
+CASES: tuple[BenchCase, ...] = (
+    BenchCase("load_candles", "candle", (1_000, 10_000, 100_000), (500, 2_000), _prepare_load_candles),
+    BenchCase(
+        "load_candle_series",
+        "candle",
+        (1_000, 10_000, 100_000),
+        (500, 2_000),
+        _prepare_load_candle_series,
+    ),
+    BenchCase("strategy.on_price", "price", (1_000, 10_000, 100_000), (500, 2_000), _prepare_strategy),
+    BenchCase("aggregator.add_bar", "candle", (1_000, 10_000, 100_000), (500, 2_000), _prepare_aggregator),
+    BenchCase("engine.run", "candle", (1_000, 10_000, 100_000), (500, 2_000), _prepare_engine),
+    BenchCase(
+        "bot.process_next_candle",
+        "candle",
+        (1_000, 10_000, 50_000),
+        (500, 2_000),
+        _prepare_process_next_candle,
+    ),
+    BenchCase("api.get_status", "request", (200, 1_000), (50,), _prepare_api_status),
+    BenchCase("bridge.submit_order", "request", (200, 1_000), (50,), _prepare_bridge_orders),
+)
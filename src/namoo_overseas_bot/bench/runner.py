@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import gc
+import json
+from pathlib import Path
+import platform
+import statistics
+import time
+
+from namoo_overseas_bot.bench.cases import BenchCase
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class BenchResult:
+    name: str
+    size: int
+    unit: str
+    repeat: int
+    best_seconds: float
+    median_seconds: float
+
+    @property
+    def per_op_ns(self) -> float:
+        return self.median_seconds / self.size * 1e9
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.size / self.median_seconds if self.median_seconds else 0.0
+
+
+@dataclass
+class Comparison:
+    name: str
+    size: int
+    baseline_seconds: float
+    current_seconds: float
+    ratio: float
+    regressed: bool
+
+
+def run_case(case: BenchCase, size: int, *, repeat: int, warmup: int = 1) -> BenchResult:
+    timings: list[float] = []
+    with case.prepare(size) as run:
+        for _ in range(warmup):
+            run()
+        # Like timeit: keep collector pauses out of the measured region.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - started)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return BenchResult(
+        name=case.name,
+        size=size,
+        unit=case.unit,
+        repeat=repeat,
+        best_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+    )
+
+
+def run_suite(
+    cases: Iterable[BenchCase],
+    *,
+    quick: bool = False,
+    repeat: int = 5,
+    only: Sequence[str] = (),
+) -> list[BenchResult]:
+    results: list[BenchResult] = []
+    for case in cases:
+        if only and case.name not in only:
+            continue
+        for size in case.quick_sizes if quick else case.sizes:
+            results.append(run_case(case, size, repeat=repeat))
+    return results
+
+
+def results_payload(results: Sequence[BenchResult], *, quick: bool) -> dict[str, object]:
+    return {
+        "version": RESULTS_VERSION,
+        "created_at_utc": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "quick": quick,
+        "results": [
+            {**asdict(r), "per_op_ns": r.per_op_ns, "ops_per_second": r.ops_per_second}
+            for r in results
+        ],
+    }
+
+
+def write_results(path: str | Path, payload: Mapping[str, object]) -> None:
+    Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: str | Path) -> list[BenchResult]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if payload.get("version") != RESULTS_VERSION:
+        raise ValueError(f"unsupported benchmark results version in {path}")
+    return [
+        BenchResult(
+            name=str(row["name"]),
+            size=int(row["size"]),
+            unit=str(row["unit"]),
+            repeat=int(row["repeat"]),
+            best_seconds=float(row["best_seconds"]),
+            median_seconds=float(row["median_seconds"]),
+        )
+        for row in payload["results"]
+    ]
+
+
+def compare(
+    current: Sequence[BenchResult],
+    baseline: Sequence[BenchResult],
+    *,
+    threshold: float = 0.15,
+) -> list[Comparison]:
+    """Pair results by (name, size); a median slower by more than ``threshold`` regresses."""
+    previous = {(r.name, r.size): r for r in baseline}
+    comparisons: list[Comparison] = []
+    for result in current:
+        base = previous.get((result.name, result.size))
+        if base is None or base.median_seconds <= 0:
+            continue
+        ratio = result.median_seconds / base.median_seconds
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                size=result.size,
+                baseline_seconds=base.median_seconds,
+                current_seconds=result.median_seconds,
+                ratio=ratio,
+                regressed=ratio > 1.0 + threshold,
+            )
+        )
+    return comparisons
+
+
+def format_results(results: Sequence[BenchResult]) -> str:
+    header = f"{'case':<26} {'size':>8} {'median ms':>11} {'ns/op':>10} {'ops/s':>13}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.name:<26} {r.size:>8} {r.median_seconds * 1e3:>11.3f} "
+            f"{r.per_op_ns:>10.0f} {r.ops_per_second:>13,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(comparisons: Sequence[Comparison]) -> str:
+    header = f"{'case':<26} {'size':>8} {'baseline ms':>12} {'current ms':>11} {'change':>8}"
+    lines = [header, "-" * len(header)]
+    for c in comparisons:
+        flag = "  REGRESSED" if c.regressed else ""
+        lines.append(
+            f"{c.name:<26} {c.size:>8} {c.baseline_seconds * 1e3:>12.3f} "
+            f"{c.current_seconds * 1e3:>11.3f} {(c.ratio - 1) * 100:>+7.1f}%{flag}"
+        )
+    return "\n".join(lines)
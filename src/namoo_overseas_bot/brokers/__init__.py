@@ -1,4 +1,19 @@
 from namoo_overseas_bot.brokers.base import BrokerClient
+from namoo_overseas_bot.brokers.cached import CachedAccountBroker
+from namoo_overseas_bot.brokers.journal import FillJournal, JournalError, JournalState
+from namoo_overseas_bot.brokers.namoo_bridge import BridgeError, NamooBridgeBroker, OrderRejected
 from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.brokers.throttle import ThrottledBroker
 
-__all__ = ["BrokerClient", "PaperBroker"]
+__all__ = [
+    "BridgeError",
+    "BrokerClient",
+    "CachedAccountBroker",
+    "FillJournal",
+    "JournalError",
+    "JournalState",
+    "NamooBridgeBroker",
+    "OrderRejected",
+    "PaperBroker",
+    "ThrottledBroker",
+]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Any
 
-from namoo_overseas_bot.models import Fill, Order
+from namoo_overseas_bot.models import AccountSnapshot, Fill, Order
 
 
 class BrokerClient(ABC):
@@ -17,3 +19,40 @@ class BrokerClient(ABC):
     @abstractmethod
     def position_qty(self, symbol: str) -> int:
         raise NotImplementedError
+
+    def submit_orders(
+        self,
+        orders: Sequence[Order],
+        prices: Mapping[str, float],
+        timestamp: str,
+    ) -> list[Fill]:
+        """
+        Submit several orders in one call, each at ``prices[order.symbol]``.
+
+        The default sends them one by one and stops at the first rejection, so
+        earlier orders stay filled; brokers with a batch endpoint override this.
+        """
+        return [
+            self.submit_order(order, price=prices[order.symbol], timestamp=timestamp)
+            for order in orders
+        ]
+
+    @abstractmethod
+    def positions(self) -> dict[str, int]:
+        """Every non-zero position, keyed by symbol."""
+        raise NotImplementedError
+
+    def account_snapshot(self) -> AccountSnapshot:
+        """Cash and all positions; one round trip on brokers that support it."""
+        return AccountSnapshot(cash=self.cash_balance(), positions=self.positions())
+
+    def begin_tick(self) -> None:
+        """Called by the trading loop before each tick's reads; caching brokers refresh here."""
+        return
+
+    def export_state(self) -> dict[str, Any] | None:
+        """Local account state worth checkpointing; remote brokers keep theirs server-side."""
+        return None
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        return
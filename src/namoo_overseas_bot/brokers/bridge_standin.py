@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hmac
+import json
+import threading
+import time
+from typing import Any
+import urllib.parse
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.models import Order, Side
+
+
+class StandInBridge:
+    """
+    In-process stand-in for the Windows NH Open API bridge, backed by a ``PaperBroker``.
+
+    It speaks the same HTTP/1.1 keep-alive JSON protocol as ``NamooBridgeBroker``
+    expects, remembers every ``client_order_id`` so a retried order is answered
+    with its original result instead of filling twice, and can add latency or
+    drop responses to exercise the client's timeout and retry paths.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        initial_cash_usd: float = 10_000.0,
+        api_token: str = "",
+        latency_seconds: float = 0.0,
+    ) -> None:
+        self.broker = PaperBroker(initial_cash_usd=initial_cash_usd)
+        self.api_token = api_token
+        self.latency_seconds = latency_seconds
+
+        self._lock = threading.Lock()
+        self._results: dict[str, dict[str, Any]] = {}
+        self._drop_responses = 0
+        self.connections = 0
+        self.requests = 0
+        self.orders_executed = 0
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> StandInBridge:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="bridge-stand-in", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> StandInBridge:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def drop_next_responses(self, count: int) -> None:
+        """Process the next ``count`` requests but close the socket instead of answering."""
+        with self._lock:
+            self._drop_responses = count
+
+    def handle(self, method: str, path: str, headers: dict[str, str], body: bytes) -> tuple[int, dict[str, Any]]:
+        if self.api_token and not hmac.compare_digest(headers.get("x-api-token", ""), self.api_token):
+            return 401, {"error": "unauthorized"}
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "invalid json"}
+
+        route = urllib.parse.urlsplit(path).path
+        with self._lock:
+            self.requests += 1
+            if method == "GET" and route == "/health":
+                return 200, {"ok": True}
+            if method == "GET" and route == "/account":
+                snapshot = self.broker.account_snapshot()
+                return 200, {"cash": snapshot.cash, "positions": snapshot.positions}
+            if method == "POST" and route == "/orders":
+                return 200, self._execute(payload, payload.get("timestamp", ""))
+            if method == "POST" and route == "/orders/batch":
+                timestamp = payload.get("timestamp", "")
+                return 200, {"results": [self._execute(o, timestamp) for o in payload.get("orders", [])]}
+            if method == "POST" and route == "/orders/status":
+                unknown = {"status": "unknown"}
+                return 200, {
+                    "orders": {
+                        cid: self._results.get(cid, {**unknown, "client_order_id": cid})
+                        for cid in payload.get("client_order_ids", [])
+                    }
+                }
+        return 404, {"error": f"no route for {method} {route}"}
+
+    def _execute(self, request: dict[str, Any], timestamp: str) -> dict[str, Any]:
+        client_order_id = str(request.get("client_order_id", ""))
+        if not client_order_id:
+            return {"client_order_id": "", "status": "rejected", "reason": "client_order_id is required"}
+        previous = self._results.get(client_order_id)
+        if previous is not None:
+            return previous
+
+        try:
+            fill = self.broker.submit_order(
+                Order(symbol=request["symbol"], side=Side(request["side"]), qty=int(request["qty"])),
+                price=float(request["price"]),
+                timestamp=timestamp,
+            )
+        except (KeyError, ValueError) as exc:
+            result: dict[str, Any] = {
+                "client_order_id": client_order_id,
+                "status": "rejected",
+                "reason": str(exc),
+            }
+        else:
+            self.orders_executed += 1
+            result = {
+                "client_order_id": client_order_id,
+                "status": "filled",
+                "fill": {
+                    "symbol": fill.symbol,
+                    "side": fill.side.value,
+                    "qty": fill.qty,
+                    "price": fill.price,
+                    "timestamp": fill.timestamp,
+                },
+            }
+        self._results[client_order_id] = result
+        return result
+
+    def _take_drop(self) -> bool:
+        with self._lock:
+            if self._drop_responses <= 0:
+                return False
+            self._drop_responses -= 1
+            return True
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        bridge = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with bridge._lock:
+                    bridge.connections += 1
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A003
+                return
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._dispatch("GET")
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._dispatch("POST")
+
+            def _dispatch(self, method: str) -> None:
+                raw_length = self.headers.get("Content-Length") or "0"
+                if not raw_length.strip().isdecimal():
+                    # Without a length the body cannot be skipped, so the connection goes too.
+                    self.close_connection = True
+                    self._reply(400, {"error": f"invalid Content-Length {raw_length!r}"})
+                    return
+                body = self.rfile.read(int(raw_length))
+                if bridge.latency_seconds:
+                    time.sleep(bridge.latency_seconds)
+                headers = {name.lower(): value for name, value in self.headers.items()}
+                code, payload = bridge.handle(method, self.path, headers, body)
+                if bridge._take_drop():
+                    # The request took effect but the acknowledgement is lost.
+                    self.close_connection = True
+                    return
+                self._reply(code, payload)
+
+            def _reply(self, code: int, payload: dict[str, Any]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import threading
+from typing import Any
+
+from namoo_overseas_bot.brokers.base import BrokerClient
+from namoo_overseas_bot.models import AccountSnapshot, Fill, Order, Side
+
+
+@dataclass(frozen=True)
+class AccountCacheStats:
+    # Reads answered from the cache vs. account snapshots fetched from the broker.
+    hits: int
+    fetches: int
+    fills_applied: int
+    pushes: int
+    invalidations: int
+
+
+class CachedAccountBroker(BrokerClient):
+    """
+    Read-through cache of cash and positions in front of a (remote) broker.
+
+    The first read after ``begin_tick`` or ``invalidate`` fetches one
+    ``account_snapshot`` and every later read is answered locally. Orders go
+    straight to ``inner``: the cache is invalidated while an order is in flight
+    and, once it fills, patched from the fill instead of being fetched again. A
+    failed order leaves it invalidated because its effect is unknown.
+
+    With ``refresh_each_tick=False`` the cache is only refreshed when empty, which
+    suits brokers that push balance changes through ``apply_snapshot`` and
+    ``apply_fill``.
+    """
+
+    def __init__(self, inner: BrokerClient, *, refresh_each_tick: bool = True) -> None:
+        self.inner = inner
+        self.refresh_each_tick = refresh_each_tick
+        self._lock = threading.Lock()
+        self._cash = 0.0
+        self._positions: dict[str, int] | None = None
+        self._hits = 0
+        self._fetches = 0
+        self._fills_applied = 0
+        self._pushes = 0
+        self._invalidations = 0
+
+    def begin_tick(self) -> None:
+        if self.refresh_each_tick:
+            self.invalidate()
+        self.inner.begin_tick()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._positions = None
+            self._invalidations += 1
+
+    def submit_order(self, order: Order, price: float, timestamp: str) -> Fill:
+        cached = self._take_for_update()
+        fill = self.inner.submit_order(order, price=price, timestamp=timestamp)
+        self._restore_with_fills(cached, [fill])
+        return fill
+
+    def submit_orders(
+        self,
+        orders: Sequence[Order],
+        prices: Mapping[str, float],
+        timestamp: str,
+    ) -> list[Fill]:
+        cached = self._take_for_update()
+        fills = self.inner.submit_orders(orders, prices, timestamp)
+        self._restore_with_fills(cached, fills)
+        return fills
+
+    def cash_balance(self) -> float:
+        return self._read()[0]
+
+    def position_qty(self, symbol: str) -> int:
+        return self._read()[1].get(symbol, 0)
+
+    def positions(self) -> dict[str, int]:
+        return dict(self._read()[1])
+
+    def account_snapshot(self) -> AccountSnapshot:
+        cash, positions = self._read()
+        return AccountSnapshot(cash=cash, positions=dict(positions))
+
+    def apply_snapshot(self, snapshot: AccountSnapshot) -> None:
+        """Push update: replace the cached account with ``snapshot``."""
+        with self._lock:
+            self._cash = snapshot.cash
+            self._positions = {s: q for s, q in snapshot.positions.items() if q}
+            self._pushes += 1
+
+    def apply_fill(self, fill: Fill) -> None:
+        """Push update for a fill this wrapper did not submit (e.g. a manual order)."""
+        with self._lock:
+            if self._positions is not None:
+                self._apply(fill)
+            self._pushes += 1
+
+    def export_state(self) -> dict[str, Any] | None:
+        return self.inner.export_state()
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        self.inner.restore_state(state)
+        self.invalidate()
+
+    def stats(self) -> AccountCacheStats:
+        with self._lock:
+            return AccountCacheStats(
+                hits=self._hits,
+                fetches=self._fetches,
+                fills_applied=self._fills_applied,
+                pushes=self._pushes,
+                invalidations=self._invalidations,
+            )
+
+    def _read(self) -> tuple[float, dict[str, int]]:
+        with self._lock:
+            if self._positions is not None:
+                self._hits += 1
+                return self._cash, self._positions
+        # Fetch outside the lock; a concurrent push simply wins or loses the race.
+        snapshot = self.inner.account_snapshot()
+        positions = {s: q for s, q in snapshot.positions.items() if q}
+        with self._lock:
+            self._fetches += 1
+            self._cash = snapshot.cash
+            self._positions = positions
+            return snapshot.cash, positions
+
+    def _take_for_update(self) -> tuple[float, dict[str, int]] | None:
+        with self._lock:
+            cached = None if self._positions is None else (self._cash, self._positions)
+            self._positions = None
+            return cached
+
+    def _restore_with_fills(self, cached: tuple[float, dict[str, int]] | None, fills: Sequence[Fill]) -> None:
+        if cached is None:
+            return
+        with self._lock:
+            if self._positions is not None:
+                # Fetched or pushed while the order was in flight; it may predate the fill.
+                self._positions = None
+                return
+            self._cash, self._positions = cached[0], dict(cached[1])
+            for fill in fills:
+                self._apply(fill)
+
+    def _apply(self, fill: Fill) -> None:
+        assert self._positions is not None
+        notional = fill.qty * fill.price
+        if fill.side == Side.BUY:
+            self._cash -= notional
+            qty = self._positions.get(fill.symbol, 0) + fill.qty
+        else:
+            self._cash += notional
+            qty = self._positions.get(fill.symbol, 0) - fill.qty
+        if qty:
+            self._positions[fill.symbol] = qty
+        else:
+            self._positions.pop(fill.symbol, None)
+        self._fills_applied += 1
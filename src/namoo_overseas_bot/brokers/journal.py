@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+from namoo_overseas_bot.models import Fill, Side
+
+
+class JournalError(RuntimeError):
+    pass
+
+
+@dataclass
+class JournalState:
+    """Account state rebuilt from disk: the latest snapshot plus the fills logged after it."""
+
+    seq: int
+    cash: float
+    positions: dict[str, int]
+    fills: list[Fill] = field(default_factory=list)
+
+
+@dataclass
+class JournalStats:
+    seq: int
+    durable_seq: int
+    pending: int
+    commits: int
+    records_written: int
+    snapshots: int
+    fills_since_snapshot: int
+    last_commit_seconds: float
+    last_error: str
+
+
+@dataclass(frozen=True)
+class _SnapshotRequest:
+    seq: int
+    cash: float
+    positions: dict[str, int]
+
+
+class FillJournal:
+    """
+    Append-only journal of paper fills with group commit and snapshot compaction.
+
+    ``append`` only encodes the record and hands it to a writer thread, which
+    writes everything queued since its last pass with one ``write`` and one
+    ``fsync`` (group commit), so ``submit_order`` never waits on the disk. A fill
+    is durable once ``flush`` returns True; a crash can lose at most the records
+    of the commit in flight.
+
+    If a write or ``fsync`` fails, the partial line is cut off and the unwritten
+    records stay queued, in order, and are retried every ``retry_seconds``.
+    ``durable_seq`` only ever covers records that reached the disk.
+
+    Every ``compact_every`` fills the owner hands over its full state. The writer
+    stores it atomically in ``<path>.snapshot`` and truncates the journal, so a
+    restore reads one snapshot plus at most ``compact_every`` records regardless
+    of how long the account has been trading.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        compact_every: int = 1000,
+        fsync: bool = True,
+        retry_seconds: float = 0.5,
+    ) -> None:
+        if compact_every <= 0:
+            raise ValueError("compact_every must be positive")
+        if retry_seconds <= 0:
+            raise ValueError("retry_seconds must be positive")
+        self.path = Path(path)
+        self.snapshot_path = self.path.with_name(self.path.name + ".snapshot")
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.retry_seconds = retry_seconds
+
+        self._cond = threading.Condition()
+        self._pending: list[tuple[int, bytes] | _SnapshotRequest] = []
+        self._in_flight = False
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._fd: int | None = None
+        # Journal size up to the last committed record; bytes past it are a torn write.
+        self._end = 0
+        self._torn = False
+
+        self._seq = 0
+        self._durable_seq = 0
+        self._fills_since_snapshot = 0
+        self._commits = 0
+        self._records_written = 0
+        self._snapshots = 0
+        self._last_commit_seconds = 0.0
+        self._last_error = ""
+
+    def restore(self, initial_cash_usd: float) -> JournalState:
+        """Load the account from disk; a new journal starts from ``initial_cash_usd``."""
+        if self._fd is not None:
+            raise JournalError("journal is already open")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.snapshot_path.exists():
+            raw = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            state = JournalState(
+                seq=int(raw["seq"]),
+                cash=float(raw["cash"]),
+                positions={str(k): int(v) for k, v in raw["positions"].items()},
+            )
+        else:
+            # Pin the starting cash so a later config change cannot rewrite history.
+            state = JournalState(seq=0, cash=initial_cash_usd, positions={})
+            self._write_snapshot(_SnapshotRequest(0, initial_cash_usd, {}))
+
+        if self.path.exists():
+            self._replay_into(state)
+
+        self._seq = self._durable_seq = state.seq
+        self._fills_since_snapshot = len(state.fills)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._end = os.fstat(self._fd).st_size
+        return state
+
+    def append(self, fill: Fill) -> int:
+        if self._fd is None:
+            raise JournalError("call restore() before appending")
+        with self._cond:
+            self._seq += 1
+            line = json.dumps(
+                {
+                    "seq": self._seq,
+                    "symbol": fill.symbol,
+                    "side": fill.side.value,
+                    "qty": fill.qty,
+                    "price": fill.price,
+                    "timestamp": fill.timestamp,
+                },
+                separators=(",", ":"),
+            )
+            self._pending.append((self._seq, line.encode("utf-8") + b"\n"))
+            self._fills_since_snapshot += 1
+            self._cond.notify_all()
+            seq = self._seq
+        if self._thread is None:
+            self._start()
+        return seq
+
+    def due_for_compaction(self) -> bool:
+        return self._fills_since_snapshot >= self.compact_every
+
+    def compact(self, cash: float, positions: Mapping[str, int]) -> None:
+        """Queue a snapshot of the state as of the last appended fill."""
+        with self._cond:
+            held = {symbol: qty for symbol, qty in positions.items() if qty}
+            self._pending.append(_SnapshotRequest(self._seq, cash, held))
+            self._fills_since_snapshot = 0
+            self._cond.notify_all()
+        if self._thread is None:
+            self._start()
+
+    def flush(self, *, timeout: float = 5.0) -> bool:
+        """Wait until every appended fill is on disk."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not (self._thread and self._thread.is_alive()):
+                    return False
+                self._cond.wait(remaining)
+            return self._durable_seq >= self._seq
+
+    def close(self, *, timeout: float = 5.0) -> None:
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(timeout=timeout)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def stats(self) -> dict[str, object]:
+        with self._cond:
+            return asdict(
+                JournalStats(
+                    seq=self._seq,
+                    durable_seq=self._durable_seq,
+                    pending=len(self._pending),
+                    commits=self._commits,
+                    records_written=self._records_written,
+                    snapshots=self._snapshots,
+                    fills_since_snapshot=self._fills_since_snapshot,
+                    last_commit_seconds=self._last_commit_seconds,
+                    last_error=self._last_error,
+                )
+            )
+
+    def _start(self) -> None:
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="fill-journal", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+                self._in_flight = True
+
+            started = time.perf_counter()
+            done, durable, written, snapshots, error = self._write_batch(batch)
+
+            with self._cond:
+                self._in_flight = False
+                self._commits += 1
+                self._records_written += written
+                self._snapshots += snapshots
+                self._last_commit_seconds = time.perf_counter() - started
+                self._durable_seq = durable
+                if error:
+                    self._last_error = error
+                    # Retry the unwritten records ahead of anything appended since.
+                    self._pending[:0] = batch[done:]
+                self._cond.notify_all()
+                if error:
+                    retry_at = time.monotonic() + self.retry_seconds
+                    while not self._stopping:
+                        remaining = retry_at - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    if self._stopping:
+                        return
+
+    def _write_batch(
+        self, batch: list[tuple[int, bytes] | _SnapshotRequest]
+    ) -> tuple[int, int, int, int, str]:
+        """Write ``batch`` in order, stopping at the first error; returns how far it got."""
+        done = written = snapshots = 0
+        durable = self._durable_seq
+        try:
+            while done < len(batch):
+                item = batch[done]
+                if isinstance(item, _SnapshotRequest):
+                    self._write_snapshot(item)
+                    # Everything logged so far is now covered by the snapshot.
+                    assert self._fd is not None
+                    os.ftruncate(self._fd, 0)
+                    self._end = 0
+                    self._torn = False
+                    snapshots += 1
+                    done += 1
+                    continue
+                records: list[tuple[int, bytes]] = []
+                while done + len(records) < len(batch):
+                    record = batch[done + len(records)]
+                    if isinstance(record, _SnapshotRequest):
+                        break
+                    records.append(record)
+                self._commit([line for _, line in records])
+                written += len(records)
+                durable = records[-1][0]
+                done += len(records)
+        except OSError as exc:
+            return done, durable, written, snapshots, str(exc)
+        return done, durable, written, snapshots, ""
+
+    def _commit(self, chunk: list[bytes]) -> None:
+        assert self._fd is not None
+        if self._torn:
+            # Cut a partial line from a failed write so the retry starts a clean record.
+            os.ftruncate(self._fd, self._end)
+            self._torn = False
+        data = b"".join(chunk)
+        self._torn = True
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view) :]
+        if self.fsync:
+            os.fsync(self._fd)
+        self._torn = False
+        self._end += len(data)
+
+    def _write_snapshot(self, request: _SnapshotRequest) -> None:
+        payload = {"seq": request.seq, "cash": request.cash, "positions": request.positions}
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh)
+            fh.flush()
+            if self.fsync:
+                os.fsync(fh.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        if self.fsync:
+            _fsync_dir(self.snapshot_path.parent)
+
+    def _replay_into(self, state: JournalState) -> None:
+        valid_end = 0
+        with open(self.path, "rb") as fh:
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    # Torn tail from a crash mid-write; the fill was never acknowledged as durable.
+                    break
+                try:
+                    raw = json.loads(line)
+                    seq = int(raw["seq"])
+                    fill = Fill(
+                        symbol=raw["symbol"],
+                        side=Side(raw["side"]),
+                        qty=int(raw["qty"]),
+                        price=float(raw["price"]),
+                        timestamp=raw["timestamp"],
+                    )
+                except (ValueError, KeyError, TypeError) as exc:
+                    raise JournalError(f"corrupt journal record at byte {valid_end}: {exc}") from exc
+                valid_end += len(line)
+                # Records older than the snapshot survive a crash between snapshot and truncate.
+                if seq <= state.seq:
+                    continue
+                state.fills.append(fill)
+                state.seq = seq
+
+        if valid_end < self.path.stat().st_size:
+            os.truncate(self.path, valid_end)
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
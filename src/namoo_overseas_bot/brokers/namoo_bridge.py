@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+import itertools
+import json
+import secrets
+import threading
+import time
+from typing import Any
+
+from namoo_overseas_bot.brokers.base import BrokerClient
+from namoo_overseas_bot.brokers.namoo_stub import build_order_batch
+from namoo_overseas_bot.http_pool import HttpPoolError, KeepAliveHttpClient
+from namoo_overseas_bot.models import AccountSnapshot, Fill, Order, Side
+
+# Statuses worth retrying: the bridge (or the API behind it) was busy or restarting.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class BridgeError(RuntimeError):
+    """The bridge could not be reached or answered with an error."""
+
+
+class OrderRejected(ValueError):
+    """The broker refused an order. ``fills`` holds the orders of a batch that did fill."""
+
+    def __init__(self, message: str, *, fills: Sequence[Fill] = ()) -> None:
+        super().__init__(message)
+        self.fills = list(fills)
+
+
+@dataclass(frozen=True)
+class OrderStatus:
+    client_order_id: str
+    # filled | rejected | unknown
+    status: str
+    fill: Fill | None = None
+    reason: str = ""
+
+
+@dataclass(frozen=True)
+class BridgeStats:
+    requests: int
+    retries: int
+    connections_opened: int
+
+
+class NamooBridgeBroker(BrokerClient):
+    """
+    Namoo (NH) overseas broker that talks to the Windows Open API bridge over HTTP.
+
+    Requests share a pooled keep-alive client. Every order carries a client order
+    ID generated here, and a retry after a timeout or dropped connection resends
+    the same ID, so the bridge answers with the original result instead of placing
+    the order twice.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        account_no: str,
+        product_code: str,
+        api_token: str = "",
+        timeout_seconds: float = 5.0,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 0.1,
+        http_client: KeepAliveHttpClient | None = None,
+        order_id_prefix: str | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.account_no = account_no
+        self.product_code = product_code
+        self.api_token = api_token
+        self.timeout_seconds = timeout_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.http_client = http_client or KeepAliveHttpClient(base_url, timeout_seconds=timeout_seconds)
+        # Random per instance so IDs stay unique across restarts of the bot.
+        self.order_id_prefix = order_id_prefix or f"nob-{secrets.token_hex(4)}"
+        self._order_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+
+    def new_client_order_id(self) -> str:
+        with self._lock:
+            return f"{self.order_id_prefix}-{next(self._order_ids):08d}"
+
+    def submit_order(
+        self,
+        order: Order,
+        price: float,
+        timestamp: str,
+        *,
+        client_order_id: str | None = None,
+    ) -> Fill:
+        payload = build_order_batch(
+            [order],
+            {order.symbol: price},
+            timestamp,
+            account_no=self.account_no,
+            product_code=self.product_code,
+        )
+        request = {
+            **payload["orders"][0],
+            "client_order_id": client_order_id or self.new_client_order_id(),
+            "account_no": self.account_no,
+            "product_code": self.product_code,
+            "timestamp": timestamp,
+        }
+        status = _parse_status(self._call("POST", "/orders", request))
+        if status.fill is None:
+            raise OrderRejected(f"order {status.client_order_id} {status.status}: {status.reason}")
+        return status.fill
+
+    def submit_orders(
+        self,
+        orders: Sequence[Order],
+        prices: Mapping[str, float],
+        timestamp: str,
+    ) -> list[Fill]:
+        """
+        Send every order in one bridge request. Orders are placed independently, so
+        if any is rejected the others may still fill; ``OrderRejected.fills`` lists them.
+        """
+        if not orders:
+            return []
+        payload = build_order_batch(
+            orders, prices, timestamp, account_no=self.account_no, product_code=self.product_code
+        )
+        for item in payload["orders"]:
+            item["client_order_id"] = self.new_client_order_id()
+        statuses = [_parse_status(item) for item in self._call("POST", "/orders/batch", payload)["results"]]
+        fills = [s.fill for s in statuses if s.fill is not None]
+        rejected = [s for s in statuses if s.fill is None]
+        if rejected:
+            reasons = "; ".join(f"{s.client_order_id} {s.status}: {s.reason}" for s in rejected)
+            raise OrderRejected(f"{len(rejected)} of {len(statuses)} orders not filled: {reasons}", fills=fills)
+        return fills
+
+    def order_statuses(self, client_order_ids: Iterable[str]) -> dict[str, OrderStatus]:
+        """Look up many orders in one round trip, e.g. to reconcile after a crash."""
+        ids = list(client_order_ids)
+        if not ids:
+            return {}
+        orders = self._call("POST", "/orders/status", {"client_order_ids": ids})["orders"]
+        return {cid: _parse_status(orders[cid]) for cid in ids if cid in orders}
+
+    def cash_balance(self) -> float:
+        return self.account_snapshot().cash
+
+    def position_qty(self, symbol: str) -> int:
+        return self.account_snapshot().position_qty(symbol)
+
+    def positions(self) -> dict[str, int]:
+        return dict(self.account_snapshot().positions)
+
+    def account_snapshot(self) -> AccountSnapshot:
+        payload = self._call("GET", "/account")
+        return AccountSnapshot(
+            cash=float(payload["cash"]),
+            positions={symbol: int(qty) for symbol, qty in payload.get("positions", {}).items() if int(qty)},
+        )
+
+    def stats(self) -> BridgeStats:
+        with self._lock:
+            return BridgeStats(
+                requests=self._requests,
+                retries=self._retries,
+                connections_opened=self.http_client.connections_opened,
+            )
+
+    def close(self) -> None:
+        self.http_client.close()
+
+    def _call(self, method: str, path: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"}
+        if self.api_token:
+            headers["X-API-Token"] = self.api_token
+
+        last_error = ""
+        for attempt in range(self.max_attempts):
+            if attempt:
+                with self._lock:
+                    self._retries += 1
+                time.sleep(self.retry_backoff_seconds * 2 ** (attempt - 1))
+            with self._lock:
+                self._requests += 1
+            try:
+                response = self.http_client.request(
+                    method, path, body=body, headers=headers, timeout=self.timeout_seconds
+                )
+            except HttpPoolError as exc:
+                # Safe to resend: orders are deduplicated by client order ID.
+                last_error = str(exc)
+                continue
+            if response.status in _RETRY_STATUSES:
+                last_error = f"{method} {path} returned {response.status}"
+                continue
+            try:
+                data = response.json()
+            except ValueError as exc:
+                raise BridgeError(f"{method} {path} returned invalid JSON") from exc
+            if response.status >= 400 or not isinstance(data, dict):
+                detail = data.get("error", "") if isinstance(data, dict) else ""
+                raise BridgeError(f"{method} {path} returned {response.status}: {detail}")
+            return data
+        raise BridgeError(f"{method} {path} failed after {self.max_attempts} attempts: {last_error}")
+
+
+def _parse_status(payload: Mapping[str, Any]) -> OrderStatus:
+    fill_data = payload.get("fill")
+    fill = None
+    if payload.get("status") == "filled" and fill_data:
+        fill = Fill(
+            symbol=fill_data["symbol"],
+            side=Side(fill_data["side"]),
+            qty=int(fill_data["qty"]),
+            price=float(fill_data["price"]),
+            timestamp=fill_data["timestamp"],
+        )
+    return OrderStatus(
+        client_order_id=str(payload.get("client_order_id", "")),
+        status=str(payload.get("status", "unknown")),
+        fill=fill,
+        reason=str(payload.get("reason", "")),
+    )
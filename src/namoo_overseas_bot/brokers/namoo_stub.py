@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from typing import Any
+
 from namoo_overseas_bot.brokers.base import BrokerClient
 from namoo_overseas_bot.models import Fill, Order
 
@@ -8,7 +11,8 @@ class NamooOverseasBroker(BrokerClient):
     """
     Stub broker for Namoo (NH) overseas trading.
 
-    Replace this stub with the real NH Open API implementation.
+    Replace this stub with the real NH Open API implementation; ``NamooBridgeBroker``
+    implements the client side of the approach below.
     Suggested implementation approach:
     1) keep your strategy engine in Python (Linux/macOS 가능)
     2) run a small Windows bridge process for NH Open API calls
@@ -29,3 +33,31 @@ class NamooOverseasBroker(BrokerClient):
 
     def position_qty(self, symbol: str) -> int:
         raise NotImplementedError("Implement position query via NH Open API.")
+
+
+def build_order_batch(
+    orders: Sequence[Order],
+    prices: Mapping[str, float],
+    timestamp: str,
+    *,
+    account_no: str,
+    product_code: str,
+) -> dict[str, Any]:
+    """One bridge request body for several orders; limit orders at ``prices``."""
+    missing = sorted({order.symbol for order in orders} - set(prices))
+    if missing:
+        raise ValueError(f"no price for {', '.join(missing)}")
+    return {
+        "account_no": account_no,
+        "product_code": product_code,
+        "timestamp": timestamp,
+        "orders": [
+            {
+                "symbol": order.symbol,
+                "side": order.side.value,
+                "qty": order.qty,
+                "price": prices[order.symbol],
+            }
+            for order in orders
+        ],
+    }
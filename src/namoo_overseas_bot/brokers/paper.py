@@ -1,46 +1,118 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import Any
 
 from namoo_overseas_bot.brokers.base import BrokerClient
-from namoo_overseas_bot.models import Fill, Order, Side
+from namoo_overseas_bot.brokers.journal import FillJournal
+from namoo_overseas_bot.models import AccountSnapshot, Fill, Order, Side
 
 
 class PaperBroker(BrokerClient):
-    def __init__(self, initial_cash_usd: float) -> None:
+    def __init__(self, initial_cash_usd: float, *, journal: FillJournal | None = None) -> None:
         self._cash = initial_cash_usd
         self._positions: dict[str, int] = defaultdict(int)
+        self._journal = journal
+        if journal is not None:
+            state = journal.restore(initial_cash_usd)
+            self._cash = state.cash
+            self._positions.update(state.positions)
+            for fill in state.fills:
+                self._apply(fill.symbol, fill.side, fill.qty, fill.price)
+            if journal.due_for_compaction():
+                journal.compact(self._cash, self._positions)
 
     def submit_order(self, order: Order, price: float, timestamp: str) -> Fill:
-        notional = order.qty * price
-
-        if order.side == Side.BUY:
-            if notional > self._cash:
-                raise ValueError(
-                    f"insufficient cash: need {notional:.2f}, have {self._cash:.2f}"
-                )
-            self._cash -= notional
-            self._positions[order.symbol] += order.qty
-        elif order.side == Side.SELL:
-            if self._positions[order.symbol] < order.qty:
-                raise ValueError(
-                    f"insufficient position: trying to sell {order.qty}, have {self._positions[order.symbol]}"
-                )
-            self._cash += notional
-            self._positions[order.symbol] -= order.qty
-        else:
-            raise ValueError(f"unsupported side: {order.side}")
-
-        return Fill(
+        self._apply(order.symbol, order.side, order.qty, price)
+        fill = Fill(
             symbol=order.symbol,
             side=order.side,
             qty=order.qty,
             price=price,
             timestamp=timestamp,
         )
+        self._record([fill])
+        return fill
+
+    def submit_orders(
+        self,
+        orders: Sequence[Order],
+        prices: Mapping[str, float],
+        timestamp: str,
+    ) -> list[Fill]:
+        """All-or-nothing: if any order is rejected, none of the batch is applied."""
+        cash = self._cash
+        held: dict[str, int] = {}
+        fills: list[Fill] = []
+        for order in orders:
+            if order.symbol not in prices:
+                raise ValueError(f"no price for {order.symbol}")
+            price = prices[order.symbol]
+            current = held.get(order.symbol, self._positions.get(order.symbol, 0))
+            cash, held[order.symbol] = _settle(cash, current, order.side, order.qty, price)
+            fills.append(
+                Fill(
+                    symbol=order.symbol,
+                    side=order.side,
+                    qty=order.qty,
+                    price=price,
+                    timestamp=timestamp,
+                )
+            )
+
+        self._cash = cash
+        self._positions.update(held)
+        self._record(fills)
+        return fills
 
     def cash_balance(self) -> float:
         return self._cash
 
     def position_qty(self, symbol: str) -> int:
         return self._positions[symbol]
+
+    def positions(self) -> dict[str, int]:
+        return {symbol: qty for symbol, qty in self._positions.items() if qty}
+
+    def account_snapshot(self) -> AccountSnapshot:
+        return AccountSnapshot(cash=self._cash, positions=self.positions())
+
+    def export_state(self) -> dict[str, Any]:
+        return {"cash": self._cash, "positions": self.positions()}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        self._cash = float(state["cash"])
+        self._positions = defaultdict(int)
+        self._positions.update({str(k): int(v) for k, v in state["positions"].items()})
+        if self._journal is not None:
+            # Re-base the journal so a later restart does not bring back newer fills.
+            self._journal.compact(self._cash, self._positions)
+
+    def _apply(self, symbol: str, side: Side, qty: int, price: float) -> None:
+        self._cash, self._positions[symbol] = _settle(
+            self._cash, self._positions[symbol], side, qty, price
+        )
+
+    def _record(self, fills: list[Fill]) -> None:
+        if self._journal is None:
+            return
+        for fill in fills:
+            self._journal.append(fill)
+        if self._journal.due_for_compaction():
+            self._journal.compact(self._cash, self._positions)
+
+
+def _settle(cash: float, held: int, side: Side, qty: int, price: float) -> tuple[float, int]:
+    """Cash and position after one fill; raises ValueError if the account cannot cover it."""
+    notional = qty * price
+
+    if side == Side.BUY:
+        if notional > cash:
+            raise ValueError(f"insufficient cash: need {notional:.2f}, have {cash:.2f}")
+        return cash - notional, held + qty
+    if side == Side.SELL:
+        if held < qty:
+            raise ValueError(f"insufficient position: trying to sell {qty}, have {held}")
+        return cash + notional, held - qty
+    raise ValueError(f"unsupported side: {side}")
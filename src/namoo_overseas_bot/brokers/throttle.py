@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any
+
+from namoo_overseas_bot.brokers.base import BrokerClient
+from namoo_overseas_bot.metrics import Histogram
+from namoo_overseas_bot.models import AccountSnapshot, Fill, Order
+
+ORDER = "order"
+QUERY = "query"
+
+
+@dataclass(frozen=True)
+class ThrottleStats:
+    kind: str
+    calls: int
+    # Calls that had to wait for a token.
+    delayed: int
+    waiting: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.calls if self.calls else 0.0
+
+
+class TokenBucket:
+    """``rate`` tokens per second, holding at most ``burst``. Callers provide the locking."""
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def wait_seconds(self, now: float) -> float:
+        """How long until one token is available; 0 if one is available now."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return 0.0 if self._tokens >= 1.0 else (1.0 - self._tokens) / self.rate
+
+    def take(self) -> None:
+        self._tokens -= 1.0
+
+
+class _Lane:
+    __slots__ = ("bucket", "calls", "delayed", "max_wait", "queue", "total_wait")
+
+    def __init__(self, bucket: TokenBucket | None) -> None:
+        self.bucket = bucket
+        self.queue: deque[object] = deque()
+        self.calls = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class ThrottledBroker(BrokerClient):
+    """
+    Paces calls to ``inner`` with token buckets instead of rejecting them.
+
+    Orders (``submit_order``/``submit_orders``) and queries (balances, positions,
+    snapshots) draw from separate buckets, so query traffic never spends order
+    capacity. ``requests_per_second`` adds a bucket shared by both, for APIs with
+    one account-wide limit; queries then wait while any order is queued. Orders
+    only go before queries when that shared bucket is configured; with separate
+    buckets alone the two kinds never wait on each other. Callers of the same kind
+    are served first in, first out. A rate of ``None`` leaves that bucket out.
+    """
+
+    def __init__(
+        self,
+        inner: BrokerClient,
+        *,
+        orders_per_second: float | None = None,
+        queries_per_second: float | None = None,
+        requests_per_second: float | None = None,
+        burst: float | None = None,
+        wait_histogram: Histogram | None = None,
+    ) -> None:
+        self.inner = inner
+        self._lanes = {
+            ORDER: _Lane(TokenBucket(orders_per_second, burst) if orders_per_second else None),
+            QUERY: _Lane(TokenBucket(queries_per_second, burst) if queries_per_second else None),
+        }
+        self._shared = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self._cond = threading.Condition()
+        self._wait_histogram = wait_histogram
+
+    def submit_order(self, order: Order, price: float, timestamp: str) -> Fill:
+        self._acquire(ORDER)
+        return self.inner.submit_order(order, price=price, timestamp=timestamp)
+
+    def submit_orders(
+        self,
+        orders: Sequence[Order],
+        prices: Mapping[str, float],
+        timestamp: str,
+    ) -> list[Fill]:
+        # One token per call: bulk brokers send the batch as a single request.
+        self._acquire(ORDER)
+        return self.inner.submit_orders(orders, prices, timestamp)
+
+    def cash_balance(self) -> float:
+        self._acquire(QUERY)
+        return self.inner.cash_balance()
+
+    def position_qty(self, symbol: str) -> int:
+        self._acquire(QUERY)
+        return self.inner.position_qty(symbol)
+
+    def positions(self) -> dict[str, int]:
+        self._acquire(QUERY)
+        return self.inner.positions()
+
+    def account_snapshot(self) -> AccountSnapshot:
+        self._acquire(QUERY)
+        return self.inner.account_snapshot()
+
+    def begin_tick(self) -> None:
+        self.inner.begin_tick()
+
+    def export_state(self) -> dict[str, Any] | None:
+        return self.inner.export_state()
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        self.inner.restore_state(state)
+
+    def queue_depth(self, kind: str) -> int:
+        with self._cond:
+            return len(self._lanes[kind].queue)
+
+    def stats(self) -> dict[str, ThrottleStats]:
+        with self._cond:
+            return {
+                kind: ThrottleStats(
+                    kind=kind,
+                    calls=lane.calls,
+                    delayed=lane.delayed,
+                    waiting=len(lane.queue),
+                    total_wait_seconds=lane.total_wait,
+                    max_wait_seconds=lane.max_wait,
+                )
+                for kind, lane in self._lanes.items()
+            }
+
+    def _acquire(self, kind: str) -> None:
+        lane = self._lanes[kind]
+        if lane.bucket is None and self._shared is None:
+            with self._cond:
+                lane.calls += 1
+            return
+
+        ticket = object()
+        started = time.monotonic()
+        with self._cond:
+            lane.queue.append(ticket)
+            try:
+                while True:
+                    timeout = self._wait_seconds(kind, lane, ticket)
+                    if timeout == 0.0:
+                        break
+                    self._cond.wait(timeout)
+                if lane.bucket is not None:
+                    lane.bucket.take()
+                if self._shared is not None:
+                    self._shared.take()
+            finally:
+                lane.queue.remove(ticket)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            lane.calls += 1
+            # Sub-millisecond waits are lock hand-offs, not throttling.
+            if waited > 0.001:
+                lane.delayed += 1
+            lane.total_wait += waited
+            lane.max_wait = max(lane.max_wait, waited)
+        if self._wait_histogram is not None:
+            self._wait_histogram.labels(kind=kind).observe(waited)
+
+    def _wait_seconds(self, kind: str, lane: _Lane, ticket: object) -> float | None:
+        """0 when ``ticket`` may proceed, otherwise how long to wait (``None``: until notified)."""
+        if lane.queue[0] is not ticket:
+            return None
+        if kind == QUERY and self._shared is not None and self._lanes[ORDER].queue:
+            return None
+        now = time.monotonic()
+        wait = lane.bucket.wait_seconds(now) if lane.bucket is not None else 0.0
+        if self._shared is not None:
+            wait = max(wait, self._shared.wait_seconds(now))
+        return wait
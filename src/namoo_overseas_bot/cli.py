@@ -1,18 +1,107 @@
 from __future__ import annotations
 
 import argparse
+import cProfile
+import pstats
+import sys
 
+from namoo_overseas_bot import batch
 from namoo_overseas_bot.brokers.paper import PaperBroker
 from namoo_overseas_bot.config import BotConfig
-from namoo_overseas_bot.engine import TradingEngine
-from namoo_overseas_bot.market_data.csv_feed import load_candles
+from namoo_overseas_bot.engine import EngineResult, TradingEngine
+from namoo_overseas_bot.market_data.cache import load_cached_candle_series
+from namoo_overseas_bot.market_data.csv_feed import iter_candles, load_candle_series
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.models import Fill
 from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.sweep import build_grid, format_table, parse_grid, run_sweep, write_results_csv
+from namoo_overseas_bot.tracing import StageTracer, format_summary
+from namoo_overseas_bot.vectorized import VectorizedSmaBacktest
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Namoo overseas stock bot (paper mode)")
     parser.add_argument("--csv", default="data/sample_us_stock.csv", help="OHLCV CSV path")
     parser.add_argument("--symbol", default=None, help="ticker symbol")
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="run the numpy array backtest instead of the bar-by-bar engine",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read the CSV row by row at constant memory and print fills as they happen",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always parse the CSV instead of using its binary sidecar cache",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        default=None,
+        help="run the backtest under cProfile, dump stats to PATH and print the top functions",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="record per-bar stage timings (fetch/strategy/risk/broker) and print a summary",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    sweep = subparsers.add_parser(
+        "sweep",
+        help="backtest a grid of short/long windows and quantities in parallel",
+    )
+    # SUPPRESS keeps values given before the subcommand (namoo-bot --csv x sweep).
+    sweep.add_argument("--csv", default=argparse.SUPPRESS, help="OHLCV CSV path")
+    sweep.add_argument("--symbol", default=argparse.SUPPRESS, help="ticker symbol")
+    sweep.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="always parse the CSV instead of using its binary sidecar cache",
+    )
+    sweep.add_argument("--short", required=True, help='short windows, e.g. "2:20" or "3,5,8"')
+    sweep.add_argument("--long", required=True, help='long windows, e.g. "10:200:5"')
+    sweep.add_argument("--quantities", default=None, help="order quantities (default: BOT_QUANTITY)")
+    sweep.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    sweep.add_argument("--chunksize", type=int, default=None, help="grid points per worker task")
+    sweep.add_argument(
+        "--engine",
+        choices=["auto", "loop", "vectorized"],
+        default="auto",
+        help="backtest implementation per grid point (auto: vectorized if numpy is installed)",
+    )
+    sweep.add_argument("--out", default="sweep_results.csv", help="ranked results CSV path")
+    sweep.add_argument("--top", type=int, default=10, help="rows to print")
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="backtest many per-symbol CSVs (directory, glob or files) in parallel worker processes",
+    )
+    batch_parser.add_argument(
+        "sources",
+        nargs="+",
+        help='directories of <SYMBOL>.csv files, glob patterns ("data/us/*.csv") or CSV paths',
+    )
+    batch_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="always parse the CSV instead of using its binary sidecar cache",
+    )
+    batch_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    batch_parser.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=100,
+        help="replace a worker after this many symbols to cap its memory (Python 3.11+; 0 disables)",
+    )
+    batch_parser.add_argument("--out", default="batch_results.csv", help="per-symbol results CSV, written as results arrive")
+    batch_parser.add_argument("--quiet", action="store_true", help="print only the summary")
     return parser
 
 
@@ -21,28 +110,145 @@ def main() -> None:
     config = BotConfig.from_env()
     symbol = args.symbol or config.symbol
 
+    if args.command == "sweep":
+        _run_sweep(args, config, symbol)
+        return
+    if args.command == "batch":
+        _run_batch(args, config)
+        return
+
+    if args.vectorized and args.stream:
+        raise ValueError("--vectorized needs the whole series in memory; drop --stream")
+    if args.vectorized and args.trace:
+        raise ValueError("--trace times the bar-by-bar engine; drop --vectorized")
+
+    # Keep every bar for the summary; the ring buffer only matters for long-running bots.
+    tracer = StageTracer(capacity=10_000_000) if args.trace else None
+    if args.profile:
+        profiler = cProfile.Profile()
+        result = profiler.runcall(_run_backtest, args, config, symbol, tracer)
+        profiler.dump_stats(args.profile)
+    else:
+        result = _run_backtest(args, config, symbol, tracer)
+
+    print("=== Namoo Overseas Bot (Paper) ===")
+    print(f"symbol: {symbol}")
+    print(f"trades: {result.trades}")
+    print(f"cash: ${result.cash:.2f}")
+    print(f"position: {result.position_qty} shares")
+    print(f"last_price: ${result.last_price:.2f}")
+    print(f"equity: ${result.equity:.2f}")
+
+    if tracer is not None:
+        print()
+        print(format_summary(tracer.summary()))
+    if args.profile:
+        print(f"\nprofile written to {args.profile}")
+        pstats.Stats(args.profile).sort_stats("cumulative").print_stats(20)
+
+
+def _run_backtest(
+    args: argparse.Namespace,
+    config: BotConfig,
+    symbol: str,
+    tracer: StageTracer | None,
+) -> EngineResult:
+    if args.vectorized:
+        candles = _load_series(args, symbol)
+        return VectorizedSmaBacktest(
+            short_window=config.short_window,
+            long_window=config.long_window,
+            quantity=config.quantity,
+            initial_cash_usd=config.initial_cash_usd,
+        ).run(candles)
+
     strategy = SmaCrossStrategy(
         short_window=config.short_window,
         long_window=config.long_window,
     )
     broker = PaperBroker(initial_cash_usd=config.initial_cash_usd)
-    candles = load_candles(args.csv, symbol=symbol)
-
     engine = TradingEngine(
         broker=broker,
         strategy=strategy,
         symbol=symbol,
         quantity=config.quantity,
+        tracer=tracer,
     )
-    result = engine.run(candles)
+    if args.stream:
+        return engine.run(iter_candles(args.csv, symbol=symbol), on_fill=_print_fill)
+    return engine.run(_load_series(args, symbol))
 
-    print("=== Namoo Overseas Bot (Paper) ===")
+
+def _load_series(args: argparse.Namespace, symbol: str) -> CandleSeries:
+    if args.no_cache:
+        return load_candle_series(args.csv, symbol=symbol)
+    return load_cached_candle_series(args.csv, symbol=symbol)
+
+
+def _print_fill(fill: Fill) -> None:
+    print(f"fill: {fill.timestamp} {fill.side.value} {fill.qty} {fill.symbol} @ {fill.price:.2f}", flush=True)
+
+
+def _run_sweep(args: argparse.Namespace, config: BotConfig, symbol: str) -> None:
+    quantities = parse_grid(args.quantities) if args.quantities else [config.quantity]
+    grid = build_grid(parse_grid(args.short), parse_grid(args.long), quantities)
+    if not grid:
+        raise ValueError("parameter grid is empty (short windows must be smaller than long windows)")
+
+    candles = _load_series(args, symbol)
+    vectorized = {"auto": None, "loop": False, "vectorized": True}[args.engine]
+    results = run_sweep(
+        candles,
+        grid,
+        symbol=symbol,
+        initial_cash_usd=config.initial_cash_usd,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        vectorized=vectorized,
+    )
+    write_results_csv(results, args.out)
+
+    print("=== Namoo Overseas Bot Sweep (Paper) ===")
     print(f"symbol: {symbol}")
-    print(f"trades: {result.trades}")
-    print(f"cash: ${result.cash:.2f}")
-    print(f"position: {result.position_qty} shares")
-    print(f"last_price: ${result.last_price:.2f}")
-    print(f"equity: ${result.equity:.2f}")
+    print(f"combinations: {len(results)}")
+    print(f"results: {args.out}")
+    print(format_table(results, limit=args.top))
+
+
+def _run_batch(args: argparse.Namespace, config: BotConfig) -> None:
+    tasks = batch.discover_tasks(args.sources)
+    if not tasks:
+        raise ValueError("no CSV files matched")
+    settings = batch.BatchSettings(
+        short_window=config.short_window,
+        long_window=config.long_window,
+        quantity=config.quantity,
+        initial_cash_usd=config.initial_cash_usd,
+        use_cache=not args.no_cache,
+    )
+
+    print("=== Namoo Overseas Bot Batch (Paper) ===")
+    print(f"symbols: {len(tasks)}", flush=True)
+    summary = batch.BatchSummary(initial_cash_usd=config.initial_cash_usd)
+    with open(args.out, "w", newline="", encoding="utf-8") as out:
+        writer = batch.BatchCsvWriter(out)
+        results = batch.run_batch(
+            tasks,
+            settings,
+            workers=args.workers,
+            max_tasks_per_child=args.max_tasks_per_child or None,
+        )
+        for index, result in enumerate(results, start=1):
+            writer.write(result)
+            summary.add(result)
+            if not args.quiet:
+                print(batch.format_result(result, index, len(tasks)), flush=True)
+
+    print()
+    print(batch.format_summary(summary))
+    print(f"results: {args.out}")
+    if summary.failed:
+        print(f"{summary.failed} symbol(s) failed; see the error column", file=sys.stderr)
 
 
 if __name__ == "__main__":
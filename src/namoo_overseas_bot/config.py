@@ -8,6 +8,7 @@ import os
 @dataclass(frozen=True)
 class BotConfig:
     symbol: str = "AAPL"
+    symbols: tuple[str, ...] = ()
     quantity: int = 1
     short_window: int = 5
     long_window: int = 20
@@ -16,12 +17,25 @@ class BotConfig:
     max_position_qty: int = 5
     server_host: str = "127.0.0.1"
     server_port: int = 8080
+    runtime_mode: str = "thread"
     api_token: str = ""
     telegram_enabled: bool = False
     telegram_bot_token: str = ""
     telegram_chat_id: str = ""
     telegram_commands_enabled: bool = True
     telegram_poll_seconds: float = 1.0
+    notify_queue_size: int = 1000
+    notify_min_interval_seconds: float = 1.0
+    trace_enabled: bool = False
+    trace_capacity: int = 1000
+    journal_path: str = ""
+    journal_compact_every: int = 1000
+    checkpoint_path: str = ""
+    checkpoint_seconds: float = 30.0
+    broker_orders_per_second: float = 0.0
+    broker_queries_per_second: float = 0.0
+    broker_requests_per_second: float = 0.0
+    broker_account_cache: bool = True
 
     @classmethod
     def from_env(cls) -> "BotConfig":
@@ -29,6 +43,7 @@ class BotConfig:
             _load_dotenv_if_exists(".env")
         return cls(
             symbol=os.getenv("BOT_SYMBOL", "AAPL"),
+            symbols=_env_list("BOT_SYMBOLS"),
             quantity=int(os.getenv("BOT_QUANTITY", "1")),
             short_window=int(os.getenv("BOT_SHORT_WINDOW", "5")),
             long_window=int(os.getenv("BOT_LONG_WINDOW", "20")),
@@ -37,6 +52,7 @@ class BotConfig:
             max_position_qty=int(os.getenv("BOT_MAX_POSITION_QTY", "5")),
             server_host=os.getenv("BOT_SERVER_HOST", "127.0.0.1"),
             server_port=int(os.getenv("BOT_SERVER_PORT", "8080")),
+            runtime_mode=os.getenv("BOT_RUNTIME_MODE", "thread").strip().lower(),
             api_token=os.getenv("BOT_API_TOKEN", ""),
             telegram_enabled=_env_bool("TELEGRAM_ENABLED", default=False),
             telegram_bot_token=_first_env(
@@ -54,6 +70,20 @@ class BotConfig:
                 default=True,
             ),
             telegram_poll_seconds=float(os.getenv("TELEGRAM_POLL_SECONDS", "1.0")),
+            notify_queue_size=int(os.getenv("BOT_NOTIFY_QUEUE_SIZE", "1000")),
+            notify_min_interval_seconds=float(
+                os.getenv("BOT_NOTIFY_MIN_INTERVAL_SECONDS", "1.0")
+            ),
+            trace_enabled=_env_bool("BOT_TRACE_ENABLED", default=False),
+            trace_capacity=int(os.getenv("BOT_TRACE_CAPACITY", "1000")),
+            journal_path=os.getenv("BOT_JOURNAL_PATH", "").strip(),
+            journal_compact_every=int(os.getenv("BOT_JOURNAL_COMPACT_EVERY", "1000")),
+            checkpoint_path=os.getenv("BOT_CHECKPOINT_PATH", "").strip(),
+            checkpoint_seconds=float(os.getenv("BOT_CHECKPOINT_SECONDS", "30")),
+            broker_orders_per_second=float(os.getenv("BOT_BROKER_ORDERS_PER_SECOND", "0")),
+            broker_queries_per_second=float(os.getenv("BOT_BROKER_QUERIES_PER_SECOND", "0")),
+            broker_requests_per_second=float(os.getenv("BOT_BROKER_REQUESTS_PER_SECOND", "0")),
+            broker_account_cache=_env_bool("BOT_BROKER_ACCOUNT_CACHE", default=True),
         )
 
 
@@ -64,6 +94,11 @@ def _env_bool(name: str, *, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_list(name: str) -> tuple[str, ...]:
+    raw = os.getenv(name, "")
+    return tuple(item.strip() for item in raw.split(",") if item.strip())
+
+
 def _first_env(*names: str, default: str = "") -> str:
     for name in names:
         raw = os.getenv(name)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 
 from namoo_overseas_bot.brokers.base import BrokerClient
-from namoo_overseas_bot.models import Candle, Order, Side, Signal
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.models import Candle, Fill, Order, Side, Signal
 from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.tracing import NULL_SPAN, StageTracer
 
 
 @dataclass
@@ -14,6 +17,7 @@ class EngineResult:
     position_qty: int
     last_price: float
     equity: float
+    equity_curve: Sequence[float] | None = None
 
 
 class TradingEngine:
@@ -24,35 +28,78 @@ class TradingEngine:
         strategy: SmaCrossStrategy,
         symbol: str,
         quantity: int,
+        tracer: StageTracer | None = None,
     ) -> None:
         self.broker = broker
         self.strategy = strategy
         self.symbol = symbol
         self.quantity = quantity
+        self.tracer = tracer
 
-    def run(self, candles: list[Candle]) -> EngineResult:
+    def run(
+        self,
+        candles: Iterable[Candle] | CandleSeries,
+        *,
+        record_equity: bool = False,
+        on_fill: Callable[[Fill], None] | None = None,
+    ) -> EngineResult:
         trades = 0
         last_price = 0.0
+        equity_curve: list[float] | None = [] if record_equity else None
+
+        # Columnar input is walked column-wise; timestamps are only formatted for orders.
+        if isinstance(candles, CandleSeries):
+            bars = zip(candles.close, candles.timestamps)
+            format_timestamp = candles.format_timestamp
+        else:
+            bars = ((candle.close, candle.timestamp) for candle in candles)
+            format_timestamp = str
 
-        for candle in candles:
-            last_price = candle.close
-            signal = self.strategy.on_price(candle.close)
+        tracer = self.tracer
+        # A span opened at the end of one bar charges the next iterator step to "fetch".
+        span = tracer.span(self.symbol) if tracer is not None else NULL_SPAN
+        for close, timestamp in bars:
+            span.lap("fetch")
+            last_price = close
+            signal = self.strategy.on_price(close)
+            span.lap("strategy")
 
             if signal == Signal.BUY:
-                self.broker.submit_order(
+                fill = self.broker.submit_order(
                     Order(symbol=self.symbol, side=Side.BUY, qty=self.quantity),
-                    price=candle.close,
-                    timestamp=candle.timestamp,
+                    price=close,
+                    timestamp=format_timestamp(timestamp),
                 )
+                span.lap("broker")
                 trades += 1
+                if on_fill is not None:
+                    on_fill(fill)
+                    span.lap("notify")
 
-            if signal == Signal.SELL and self.broker.position_qty(self.symbol) >= self.quantity:
-                self.broker.submit_order(
-                    Order(symbol=self.symbol, side=Side.SELL, qty=self.quantity),
-                    price=candle.close,
-                    timestamp=candle.timestamp,
+            if signal == Signal.SELL:
+                allowed = self.broker.position_qty(self.symbol) >= self.quantity
+                span.lap("risk")
+                if allowed:
+                    fill = self.broker.submit_order(
+                        Order(symbol=self.symbol, side=Side.SELL, qty=self.quantity),
+                        price=close,
+                        timestamp=format_timestamp(timestamp),
+                    )
+                    span.lap("broker")
+                    trades += 1
+                    if on_fill is not None:
+                        on_fill(fill)
+                        span.lap("notify")
+
+            if equity_curve is not None:
+                equity_curve.append(
+                    self.broker.cash_balance() + self.broker.position_qty(self.symbol) * close
                 )
-                trades += 1
+                span.lap("state")
+
+            if tracer is not None:
+                span.finish(candle_timestamp=format_timestamp(timestamp), signal=signal.value)
+                span = tracer.span(self.symbol)
 
         position_qty = self.broker.position_qty(self.symbol)
         cash = self.broker.cash_balance()
@@ -63,4 +110,5 @@ class TradingEngine:
             position_qty=position_qty,
             last_price=last_price,
             equity=equity,
+            equity_curve=equity_curve,
         )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import http.client
+import json
+import select
+import threading
+import urllib.parse
+
+# Errors meaning the server dropped an idle keep-alive connection before answering.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+# Methods that are safe to send twice if the first attempt may have been processed.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+class HttpPoolError(RuntimeError):
+    pass
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> object:
+        return json.loads(self.body.decode("utf-8"))
+
+
+class KeepAliveHttpClient:
+    """
+    Thread-safe HTTP(S) client that reuses persistent connections to one host.
+
+    Idle connections are kept in a small LIFO pool, so a long-poll on one thread and
+    a send on another each get their own socket. Idle connections the server has
+    already closed are discarded before use. A reused connection that still fails is
+    retried once on a fresh one if the request could not have reached the server
+    (it failed while being written) or its method is idempotent; a POST that may have
+    been processed is never sent twice.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout_seconds: float = 10.0,
+        max_idle_connections: int = 4,
+    ) -> None:
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+            raise ValueError(f"unsupported base url: {base_url}")
+        self.base_url = base_url.rstrip("/")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.path_prefix = parsed.path.rstrip("/")
+        self.timeout_seconds = timeout_seconds
+        self.max_idle_connections = max_idle_connections
+
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        full_path = self.path_prefix + path
+        request_headers = {"Connection": "keep-alive", **(headers or {})}
+        conn, reused = self._acquire()
+        try:
+            try:
+                self._write(conn, method, full_path, body, request_headers, timeout)
+            except _STALE_CONNECTION_ERRORS:
+                # Writing failed, so the server never saw a full request; any method may go again.
+                conn.close()
+                if not reused:
+                    raise
+                conn, reused = self._connect(), False
+                self._write(conn, method, full_path, body, request_headers, timeout)
+            try:
+                response = self._read(conn)
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused or method.upper() not in _IDEMPOTENT_METHODS:
+                    raise
+                conn = self._connect()
+                self._write(conn, method, full_path, body, request_headers, timeout)
+                response = self._read(conn)
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise HttpPoolError(f"{method} {self.host}{path} failed: {exc}") from exc
+
+        with self._lock:
+            self.requests_sent += 1
+        status, data, response_headers, will_close = response
+        if will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return HttpResponse(status=status, body=data, headers=response_headers)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _write(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> None:
+        conn.timeout = self.timeout_seconds if timeout is None else timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(conn.timeout)
+        conn.request(method, path, body=body, headers=headers)
+
+    def _read(self, conn: http.client.HTTPConnection) -> tuple[int, bytes, dict[str, str], bool]:
+        response = conn.getresponse()
+        # The body must be drained before the connection can carry another request.
+        data = response.read()
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        return response.status, data, response_headers, response.will_close
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if not _is_dropped(conn):
+                return conn, True
+            conn.close()
+        return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle_connections:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout_seconds)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout_seconds)
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket has nothing to read; readable means EOF or a stray reply.
+    if conn.sock is None:
+        return True
+    readable, _, _ = select.select([conn.sock], [], [], 0)
+    return bool(readable)
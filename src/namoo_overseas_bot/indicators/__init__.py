@@ -0,0 +1,21 @@
+from namoo_overseas_bot.indicators.momentum import RelativeStrengthIndex
+from namoo_overseas_bot.indicators.moving_average import (
+    ExponentialMovingAverage,
+    SimpleMovingAverage,
+)
+from namoo_overseas_bot.indicators.volatility import (
+    AverageTrueRange,
+    BollingerBands,
+    BollingerValue,
+    RollingVariance,
+)
+
+__all__ = [
+    "AverageTrueRange",
+    "BollingerBands",
+    "BollingerValue",
+    "ExponentialMovingAverage",
+    "RelativeStrengthIndex",
+    "RollingVariance",
+    "SimpleMovingAverage",
+]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+
+class RelativeStrengthIndex:
+    """Wilder RSI: average gain/loss seeded over ``window`` changes, then smoothed."""
+
+    def __init__(self, window: int = 14) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._prev: float | None = None
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @property
+    def value(self) -> float | None:
+        if not self._ready:
+            return None
+        if self._avg_loss == 0.0:
+            return 100.0 if self._avg_gain > 0.0 else 50.0
+        rs = self._avg_gain / self._avg_loss
+        return 100.0 - 100.0 / (1.0 + rs)
+
+    def update(self, value: float) -> float | None:
+        prev = self._prev
+        self._prev = value
+        if prev is None:
+            return None
+
+        change = value - prev
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        if self._ready:
+            self._avg_gain += (gain - self._avg_gain) / self.window
+            self._avg_loss += (loss - self._avg_loss) / self.window
+            return self.value
+
+        self._count += 1
+        self._avg_gain += gain
+        self._avg_loss += loss
+        if self._count == self.window:
+            self._avg_gain /= self.window
+            self._avg_loss /= self.window
+            self._ready = True
+        return self.value
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Any
+
+
+class SimpleMovingAverage:
+    """Running-sum SMA with O(1) updates.
+
+    The running sum is rebuilt from the window with ``math.fsum`` once every
+    ``window`` updates so floating-point drift never accumulates over long series.
+    """
+
+    def __init__(self, window: int) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._values: deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        self._since_resync = 0
+
+    @property
+    def ready(self) -> bool:
+        return len(self._values) == self.window
+
+    @property
+    def value(self) -> float | None:
+        if not self.ready:
+            return None
+        return self._sum / self.window
+
+    def update(self, value: float) -> float | None:
+        if len(self._values) == self.window:
+            self._sum -= self._values[0]
+        self._values.append(value)
+        self._sum += value
+
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._sum = math.fsum(self._values)
+            self._since_resync = 0
+        return self.value
+
+    def export_state(self) -> dict[str, Any]:
+        return {
+            "window": self.window,
+            "values": list(self._values),
+            "sum": self._sum,
+            "since_resync": self._since_resync,
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        if state["window"] != self.window:
+            raise ValueError(f"state is for window {state['window']}, not {self.window}")
+        values = [float(v) for v in state["values"]]
+        if len(values) > self.window:
+            raise ValueError("state holds more values than the window")
+        self._values = deque(values, maxlen=self.window)
+        self._sum = float(state["sum"])
+        self._since_resync = int(state["since_resync"])
+
+
+class ExponentialMovingAverage:
+    """EMA seeded with the SMA of the first ``window`` values."""
+
+    def __init__(self, window: int, *, alpha: float | None = None) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.alpha = alpha if alpha is not None else 2.0 / (window + 1)
+        if not 0.0 < self.alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self._count = 0
+        self._seed_sum = 0.0
+        self._value: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._value is not None
+
+    @property
+    def value(self) -> float | None:
+        return self._value
+
+    def update(self, value: float) -> float | None:
+        if self._value is not None:
+            self._value += self.alpha * (value - self._value)
+            return self._value
+
+        self._count += 1
+        self._seed_sum += value
+        if self._count == self.window:
+            self._value = self._seed_sum / self.window
+        return self._value
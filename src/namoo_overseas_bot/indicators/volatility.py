@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import math
+
+
+class RollingVariance:
+    """Population variance over a sliding window (Welford add/remove updates).
+
+    Mean and M2 are recomputed from the window once every ``window`` updates,
+    like :class:`SimpleMovingAverage`, to keep drift bounded.
+    """
+
+    def __init__(self, window: int) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._values: deque[float] = deque(maxlen=window)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+
+    @property
+    def ready(self) -> bool:
+        return len(self._values) == self.window
+
+    @property
+    def mean(self) -> float | None:
+        if not self.ready:
+            return None
+        return self._mean
+
+    @property
+    def value(self) -> float | None:
+        if not self.ready:
+            return None
+        return max(self._m2, 0.0) / self.window
+
+    @property
+    def stddev(self) -> float | None:
+        variance = self.value
+        if variance is None:
+            return None
+        return math.sqrt(variance)
+
+    def update(self, value: float) -> float | None:
+        if len(self._values) == self.window:
+            old = self._values[0]
+            new_mean = self._mean + (value - old) / self.window
+            self._m2 += (value - old) * (value - new_mean + old - self._mean)
+            self._mean = new_mean
+            self._values.append(value)
+        else:
+            self._values.append(value)
+            delta = value - self._mean
+            self._mean += delta / len(self._values)
+            self._m2 += delta * (value - self._mean)
+
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._mean = math.fsum(self._values) / len(self._values)
+            self._m2 = math.fsum((v - self._mean) ** 2 for v in self._values)
+            self._since_resync = 0
+        return self.value
+
+
+@dataclass(frozen=True)
+class BollingerValue:
+    middle: float
+    upper: float
+    lower: float
+
+
+class BollingerBands:
+    def __init__(self, window: int = 20, num_std: float = 2.0) -> None:
+        self.num_std = num_std
+        self._variance = RollingVariance(window)
+
+    @property
+    def window(self) -> int:
+        return self._variance.window
+
+    @property
+    def ready(self) -> bool:
+        return self._variance.ready
+
+    @property
+    def value(self) -> BollingerValue | None:
+        middle = self._variance.mean
+        stddev = self._variance.stddev
+        if middle is None or stddev is None:
+            return None
+        width = self.num_std * stddev
+        return BollingerValue(middle=middle, upper=middle + width, lower=middle - width)
+
+    def update(self, value: float) -> BollingerValue | None:
+        self._variance.update(value)
+        return self.value
+
+
+class AverageTrueRange:
+    """Wilder ATR: seeded with the mean true range, then smoothed by 1/window."""
+
+    def __init__(self, window: int = 14) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._prev_close: float | None = None
+        self._count = 0
+        self._seed_sum = 0.0
+        self._value: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._value is not None
+
+    @property
+    def value(self) -> float | None:
+        return self._value
+
+    def update(self, high: float, low: float, close: float) -> float | None:
+        if self._prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+
+        if self._value is not None:
+            self._value += (true_range - self._value) / self.window
+            return self._value
+
+        self._count += 1
+        self._seed_sum += true_range
+        if self._count == self.window:
+            self._value = self._seed_sum / self.window
+        return self._value
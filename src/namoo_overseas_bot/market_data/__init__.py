@@ -1,3 +1,45 @@
-from namoo_overseas_bot.market_data.csv_feed import load_candles
+from namoo_overseas_bot.market_data.aggregator import (
+    AggregatorStats,
+    BarAggregator,
+    parse_timeframe,
+    resample,
+    resample_with_stats,
+)
+from namoo_overseas_bot.market_data.cache import load_cached_candle_series
+from namoo_overseas_bot.market_data.csv_feed import (
+    iter_candle_chunks,
+    iter_candles,
+    load_candle_series,
+    load_candles,
+)
+from namoo_overseas_bot.market_data.feed import (
+    HttpFeedServer,
+    MarketDataFeed,
+    QueueFeed,
+    ReplayFeed,
+    SyntheticFeed,
+)
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.market_data.shared import SharedCandleSeries, SharedSeriesHandle, attach_series
 
-__all__ = ["load_candles"]
+__all__ = [
+    "AggregatorStats",
+    "BarAggregator",
+    "CandleSeries",
+    "HttpFeedServer",
+    "MarketDataFeed",
+    "QueueFeed",
+    "ReplayFeed",
+    "SharedCandleSeries",
+    "SharedSeriesHandle",
+    "SyntheticFeed",
+    "attach_series",
+    "iter_candle_chunks",
+    "iter_candles",
+    "load_cached_candle_series",
+    "load_candle_series",
+    "load_candles",
+    "parse_timeframe",
+    "resample",
+    "resample_with_stats",
+]
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Protocol
+
+from namoo_overseas_bot.market_data.series import (
+    DATE_FORMAT,
+    DATETIME_FORMAT,
+    CandleSeries,
+    format_timestamp,
+    parse_timestamp,
+)
+from namoo_overseas_bot.models import Candle, Signal
+
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# (timeframe, bar, closed): ``closed`` is False for in-progress (partial) bars.
+BarListener = Callable[[str, Candle, bool], None]
+
+
+class PriceStrategy(Protocol):
+    def on_price(self, price: float) -> Signal: ...
+
+
+def parse_timeframe(timeframe: str) -> int:
+    """Length of a timeframe such as ``"30s"``, ``"5m"``, ``"1h"`` or ``"1d"`` in seconds."""
+    text = timeframe.strip().lower()
+    unit = _UNIT_SECONDS.get(text[-1:])
+    if unit is None or not text[:-1].isdigit() or int(text[:-1]) <= 0:
+        raise ValueError(f"unsupported timeframe: {timeframe!r} (use e.g. 30s, 5m, 1h, 1d)")
+    return int(text[:-1]) * unit
+
+
+@dataclass(frozen=True)
+class AggregatorStats:
+    updates: int
+    bars_closed: int
+    # Updates older than the shortest timeframe's open bar; dropped from every timeframe.
+    late: int
+
+
+class _OpenBar:
+    __slots__ = ("close", "high", "low", "open", "start", "volume")
+
+    def __init__(self, start: int, open_: float, high: float, low: float, close: float, volume: float) -> None:
+        self.start = start
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+
+class _Timeframe:
+    __slots__ = ("bar", "closed_listeners", "name", "partial_listeners", "seconds")
+
+    def __init__(self, name: str, seconds: int) -> None:
+        self.name = name
+        self.seconds = seconds
+        self.bar: _OpenBar | None = None
+        self.closed_listeners: list[BarListener] = []
+        self.partial_listeners: list[BarListener] = []
+
+
+class BarAggregator:
+    """
+    Builds OHLCV bars for several timeframes at once from ticks or finer bars.
+
+    Buckets are aligned to UTC epoch multiples of the timeframe (so ``1d`` starts at
+    UTC midnight) and a bar's timestamp is its bucket start. Each update costs O(1)
+    per timeframe. A bar is emitted closed when the first update of a later bucket
+    arrives or on ``flush``; buckets with no updates produce no bar. Lateness is
+    decided once per update: one older than the shortest timeframe's open bar is
+    dropped from every timeframe and counted once. Every timeframe must be a whole
+    multiple of the shortest, so no longer bar can be late when the shortest is not.
+    Input bars are assigned by their (start) timestamp, so they should evenly divide
+    the timeframes.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframes: Iterable[str],
+        *,
+        timestamp_format: str = DATETIME_FORMAT,
+    ) -> None:
+        frames = {name: parse_timeframe(name) for name in timeframes}
+        if not frames:
+            raise ValueError("timeframes must not be empty")
+        shortest = min(frames.values())
+        uneven = [name for name, seconds in frames.items() if seconds % shortest]
+        if uneven:
+            raise ValueError(f"timeframes {uneven} are not multiples of the shortest ({shortest}s)")
+        self.symbol = symbol
+        self.timestamp_format = timestamp_format
+        # Shortest first, so listeners see a 5m close before the 1h bar it completes.
+        self._frames = {
+            name: _Timeframe(name, seconds) for name, seconds in sorted(frames.items(), key=lambda item: item[1])
+        }
+        self._shortest = next(iter(self._frames.values()))
+        self._updates = 0
+        self._bars_closed = 0
+        self._late = 0
+
+    @property
+    def timeframes(self) -> list[str]:
+        return list(self._frames)
+
+    def subscribe(self, timeframe: str, listener: BarListener, *, partial: bool = False) -> None:
+        """Call ``listener`` with each closed bar, and with every update of the open bar if ``partial``."""
+        frame = self._frame(timeframe)
+        frame.closed_listeners.append(listener)
+        if partial:
+            frame.partial_listeners.append(listener)
+
+    def subscribe_strategy(
+        self,
+        timeframe: str,
+        strategy: PriceStrategy,
+        on_signal: Callable[[Candle, Signal], None] | None = None,
+    ) -> None:
+        """Feed ``strategy`` the close of every closed ``timeframe`` bar."""
+
+        def feed(_: str, bar: Candle, closed: bool) -> None:
+            signal = strategy.on_price(bar.close)
+            if on_signal is not None:
+                on_signal(bar, signal)
+
+        self.subscribe(timeframe, feed)
+
+    def add_tick(self, timestamp: int, price: float, size: float = 0.0) -> None:
+        """One trade at ``timestamp`` (UTC epoch seconds)."""
+        self.add_bar(timestamp, price, price, price, price, size)
+
+    def add_candle(self, candle: Candle) -> None:
+        if candle.symbol != self.symbol:
+            raise ValueError(f"aggregator is for {self.symbol}, got a {candle.symbol} bar")
+        self.add_bar(
+            parse_timestamp(candle.timestamp),
+            candle.open,
+            candle.high,
+            candle.low,
+            candle.close,
+            candle.volume,
+        )
+
+    def add_bar(
+        self,
+        timestamp: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """One finer bar starting at ``timestamp`` (UTC epoch seconds)."""
+        self._updates += 1
+        shortest = self._shortest
+        if shortest.bar is not None and timestamp - timestamp % shortest.seconds < shortest.bar.start:
+            self._late += 1
+            return
+        for frame in self._frames.values():
+            start = timestamp - timestamp % frame.seconds
+            bar = frame.bar
+            if bar is not None and start == bar.start:
+                if high > bar.high:
+                    bar.high = high
+                if low < bar.low:
+                    bar.low = low
+                bar.close = close
+                bar.volume += volume
+            else:
+                if bar is not None:
+                    self._close(frame, bar)
+                bar = frame.bar = _OpenBar(start, open_, high, low, close, volume)
+            if frame.partial_listeners:
+                partial = self._candle(bar)
+                for listener in frame.partial_listeners:
+                    listener(frame.name, partial, False)
+
+    def flush(self) -> None:
+        """Close every open bar, e.g. at the end of the data or the session."""
+        for frame in self._frames.values():
+            if frame.bar is not None:
+                bar, frame.bar = frame.bar, None
+                self._close(frame, bar)
+
+    def open_bar(self, timeframe: str) -> Candle | None:
+        """The in-progress bar of ``timeframe``, if any."""
+        bar = self._frame(timeframe).bar
+        return self._candle(bar) if bar is not None else None
+
+    def stats(self) -> AggregatorStats:
+        return AggregatorStats(updates=self._updates, bars_closed=self._bars_closed, late=self._late)
+
+    def _close(self, frame: _Timeframe, bar: _OpenBar) -> None:
+        self._bars_closed += 1
+        if frame.closed_listeners:
+            closed = self._candle(bar)
+            for listener in frame.closed_listeners:
+                listener(frame.name, closed, True)
+
+    def _candle(self, bar: _OpenBar) -> Candle:
+        return Candle(
+            symbol=self.symbol,
+            timestamp=format_timestamp(bar.start, self.timestamp_format),
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=bar.volume,
+        )
+
+    def _frame(self, timeframe: str) -> _Timeframe:
+        frame = self._frames.get(timeframe)
+        if frame is None:
+            raise ValueError(f"unknown timeframe {timeframe!r}; aggregating {list(self._frames)}")
+        return frame
+
+
+def resample(series: CandleSeries, timeframe: str) -> CandleSeries:
+    """Aggregate a whole series into ``timeframe`` bars, bucketed like ``BarAggregator``."""
+    return resample_with_stats(series, timeframe)[0]
+
+
+def resample_with_stats(series: CandleSeries, timeframe: str) -> tuple[CandleSeries, AggregatorStats]:
+    """``resample`` plus counts; rows older than the bar being built are dropped and counted as late."""
+    seconds = parse_timeframe(timeframe)
+    # Daily and longer bars of a date-only series stay date-only.
+    keep_dates = series.timestamp_format == DATE_FORMAT and seconds % 86400 == 0
+    out = CandleSeries.empty(series.symbol, timestamp_format=DATE_FORMAT if keep_dates else DATETIME_FORMAT)
+    bar: _OpenBar | None = None
+    late = 0
+    columns = (series.timestamps, series.open, series.high, series.low, series.close, series.volume)
+    for timestamp, open_, high, low, close, volume in zip(*columns):
+        start = timestamp - timestamp % seconds
+        if bar is not None and start == bar.start:
+            bar.high = max(bar.high, high)
+            bar.low = min(bar.low, low)
+            bar.close = close
+            bar.volume += volume
+        elif bar is None or start > bar.start:
+            if bar is not None:
+                _append(out, bar)
+            bar = _OpenBar(start, open_, high, low, close, volume)
+        else:
+            late += 1
+    if bar is not None:
+        _append(out, bar)
+    return out, AggregatorStats(updates=len(series), bars_closed=len(out), late=late)
+
+
+def _append(series: CandleSeries, bar: _OpenBar) -> None:
+    series.append(
+        timestamp=bar.start,
+        open=bar.open,
+        high=bar.high,
+        low=bar.low,
+        close=bar.close,
+        volume=bar.volume,
+    )
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+import struct
+import sys
+
+from namoo_overseas_bot.market_data.csv_feed import load_candle_series
+from namoo_overseas_bot.market_data.series import COLUMNS, CandleSeries
+
+CACHE_SUFFIX = ".colcache"
+
+# Layout: fixed 128-byte header, then one little-endian 8-byte column after another
+# (int64 timestamps, float64 open/high/low/close/volume), each ``rows`` long.
+_MAGIC = b"NAMOOCOL"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIQQq16s32s")
+_HEADER_SIZE = 128
+_FINGERPRINT_BLOCK = 64 * 1024
+
+
+def cache_path_for(csv_path: str | Path) -> Path:
+    path = Path(csv_path)
+    return path.with_name(path.name + CACHE_SUFFIX)
+
+
+def load_cached_candle_series(
+    csv_path: str | Path,
+    symbol: str,
+    *,
+    cache_path: str | Path | None = None,
+) -> CandleSeries:
+    """
+    Load ``csv_path`` through a sidecar columnar cache.
+
+    A cache whose recorded source size, mtime and head/tail fingerprint still match
+    is memory-mapped, so start-up cost no longer depends on history length. Otherwise
+    the CSV is parsed and the cache rewritten; cache I/O errors fall back to the CSV.
+    """
+    source = Path(csv_path)
+    cache = Path(cache_path) if cache_path is not None else cache_path_for(source)
+
+    series = read_cache(cache, source, symbol)
+    if series is not None:
+        return series
+
+    series = load_candle_series(source, symbol)
+    if series.timestamp_labels is not None:
+        # Per-row timestamp strings have no column in the cache; such files are always parsed.
+        return series
+    try:
+        write_cache(cache, source, series)
+    except OSError:
+        pass
+    return series
+
+
+def read_cache(cache: Path, source: Path, symbol: str) -> CandleSeries | None:
+    if sys.byteorder != "little":
+        return None
+    try:
+        stat = source.stat()
+        with cache.open("rb") as f:
+            header = f.read(_HEADER_SIZE)
+            if len(header) < _HEADER_SIZE:
+                return None
+            magic, version, rows, size, mtime_ns, fingerprint, raw_format = _HEADER.unpack_from(header)
+            if magic != _MAGIC or version != _VERSION:
+                return None
+            if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+                return None
+            if fingerprint != _fingerprint(source, stat.st_size):
+                return None
+            if os.fstat(f.fileno()).st_size != _HEADER_SIZE + rows * 8 * len(COLUMNS):
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, struct.error):
+        return None
+
+    view = memoryview(mapped)
+    columns = {}
+    offset = _HEADER_SIZE
+    for name in COLUMNS:
+        typecode = "q" if name == "timestamps" else "d"
+        columns[name] = view[offset : offset + rows * 8].cast(typecode)
+        offset += rows * 8
+
+    return CandleSeries(
+        symbol=symbol,
+        timestamp_format=raw_format.rstrip(b"\0").decode("utf-8"),
+        backing=mapped,
+        **columns,
+    )
+
+
+def write_cache(cache: Path, source: Path, series: CandleSeries) -> None:
+    if sys.byteorder != "little":
+        return
+    stat = source.stat()
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        len(series),
+        stat.st_size,
+        stat.st_mtime_ns,
+        _fingerprint(source, stat.st_size),
+        series.timestamp_format.encode("utf-8"),
+    ).ljust(_HEADER_SIZE, b"\0")
+
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(header)
+            for name in COLUMNS:
+                f.write(getattr(series, name))
+        os.replace(tmp, cache)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _fingerprint(source: Path, size: int) -> bytes:
+    # Head and tail blocks catch in-place edits that keep size and mtime, without
+    # hashing the whole file on every start.
+    digest = hashlib.blake2b(str(size).encode("ascii"), digest_size=16)
+    with source.open("rb") as f:
+        digest.update(f.read(_FINGERPRINT_BLOCK))
+        if size > _FINGERPRINT_BLOCK:
+            f.seek(max(_FINGERPRINT_BLOCK, size - _FINGERPRINT_BLOCK))
+            digest.update(f.read(_FINGERPRINT_BLOCK))
+    return digest.digest()
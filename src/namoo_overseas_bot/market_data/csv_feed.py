@@ -1,25 +1,131 @@
 from __future__ import annotations
 
+from array import array
 import csv
+from collections.abc import Iterator
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 
+from namoo_overseas_bot.market_data.series import (
+    CandleSeries,
+    TimestampFormatCheck,
+    parse_timestamp,
+)
 from namoo_overseas_bot.models import Candle
 
+FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+DEFAULT_CHUNK_SIZE = 65_536
+_READ_BUFFER_BYTES = 1 << 20
+
 
 def load_candles(csv_path: str | Path, symbol: str) -> list[Candle]:
-    candles: list[Candle] = []
-    with Path(csv_path).open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            candles.append(
-                Candle(
-                    symbol=symbol,
-                    timestamp=row["timestamp"],
-                    open=float(row["open"]),
-                    high=float(row["high"]),
-                    low=float(row["low"]),
-                    close=float(row["close"]),
-                    volume=float(row["volume"]),
-                )
-            )
-    return candles
+    return list(iter_candles(csv_path, symbol))
+
+
+def iter_candles(csv_path: str | Path, symbol: str) -> Iterator[Candle]:
+    """Yield candles one row at a time; memory use does not depend on file size."""
+    for ts, o, h, l, c, v in _iter_fields(csv_path):
+        yield Candle(
+            symbol=symbol,
+            timestamp=ts,
+            open=float(o),
+            high=float(h),
+            low=float(l),
+            close=float(c),
+            volume=float(v),
+        )
+
+
+def iter_candle_chunks(
+    csv_path: str | Path,
+    symbol: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[CandleSeries]:
+    """Yield ``CandleSeries`` column chunks of at most ``chunk_size`` rows."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    rows: list[tuple[str, ...]] = []
+    # The first row fixes the format; a chunk with rows written any other way keeps their strings.
+    format_check: TimestampFormatCheck | None = None
+    for fields in _iter_fields(csv_path):
+        rows.append(fields)
+        if len(rows) == chunk_size:
+            format_check = format_check or TimestampFormatCheck.for_first(rows[0][0])
+            yield _rows_to_series(rows, symbol, format_check)
+            rows = []
+    if rows:
+        format_check = format_check or TimestampFormatCheck.for_first(rows[0][0])
+        yield _rows_to_series(rows, symbol, format_check)
+
+
+def load_candle_series(csv_path: str | Path, symbol: str) -> CandleSeries:
+    """Load an OHLCV CSV straight into columns without building per-row objects."""
+    series: CandleSeries | None = None
+    for chunk in iter_candle_chunks(csv_path, symbol):
+        if series is None:
+            series = chunk
+            continue
+        if chunk.timestamp_labels is not None or series.timestamp_labels is not None:
+            series.label_timestamps().extend(chunk.label_timestamps())
+        for name in ("timestamps", "open", "high", "low", "close", "volume"):
+            getattr(series, name).extend(getattr(chunk, name))
+    return series if series is not None else CandleSeries.empty(symbol)
+
+
+def _rows_to_series(rows: list[tuple[str, ...]], symbol: str, format_check: TimestampFormatCheck) -> CandleSeries:
+    ts, o, h, l, c, v = zip(*rows)
+    return CandleSeries(
+        symbol=symbol,
+        timestamps=array("q", map(parse_timestamp, ts)),
+        open=array("d", map(float, o)),
+        high=array("d", map(float, h)),
+        low=array("d", map(float, l)),
+        close=array("d", map(float, c)),
+        volume=array("d", map(float, v)),
+        timestamp_format=format_check.timestamp_format,
+        timestamp_labels=None if format_check.matches(ts) else list(ts),
+    )
+
+
+def _iter_fields(csv_path: str | Path) -> Iterator[tuple[str, ...]]:
+    """Yield ``FIELDS`` for every data row, in that order.
+
+    Plain lines are split on commas directly, which is several times cheaper than
+    ``csv.DictReader``. From the first line containing a quote on, the rest of the
+    stream goes through ``csv.reader``, since quoted fields may span lines.
+    """
+    with Path(csv_path).open("r", newline="", encoding="utf-8", buffering=_READ_BUFFER_BYTES) as f:
+        header_line = f.readline()
+        if not header_line:
+            return
+        if '"' in header_line:
+            rows = csv.reader(chain([header_line], f))
+            pick = _header_picker(next(rows), csv_path)
+            yield from _picked_rows(rows, pick)
+            return
+        pick = _header_picker(header_line.rstrip("\r\n").split(","), csv_path)
+
+        for line in f:
+            if '"' in line:
+                yield from _picked_rows(csv.reader(chain([line], f)), pick)
+                return
+            if not line.strip():
+                continue
+            yield pick(line.rstrip("\r\n").split(","))
+
+
+def _header_picker(header: list[str], csv_path: str | Path) -> itemgetter:
+    names = [name.strip() for name in header]
+    try:
+        return itemgetter(*(names.index(name) for name in FIELDS))
+    except ValueError as exc:
+        raise ValueError(f"{csv_path}: CSV header must contain {', '.join(FIELDS)}") from exc
+
+
+def _picked_rows(rows: Iterator[list[str]], pick: itemgetter) -> Iterator[tuple[str, ...]]:
+    for fields in rows:
+        # Blank and whitespace-only lines are skipped, as on the fast path.
+        if any(field.strip() for field in fields):
+            yield pick(fields)
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hmac
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import threading
+import time
+from typing import Any
+
+from namoo_overseas_bot.market_data.series import DATETIME_FORMAT, CandleSeries
+from namoo_overseas_bot.models import Candle
+
+FeedListener = Callable[[], None]
+
+
+class MarketDataFeed(ABC):
+    """
+    Source of bars for one symbol.
+
+    Consumers take bars with ``poll`` (never blocks). Pull feeds (``live = False``)
+    always have the next bar ready, so the consumer paces them, one bar per tick.
+    Live feeds deliver bars when they arrive: ``add_listener`` callbacks fire from
+    the producer's thread so a consumer can wake up and drain them immediately.
+    """
+
+    live = False
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+
+    @abstractmethod
+    def poll(self) -> Candle | None:
+        """The next bar, or ``None`` if none is ready (or the feed is exhausted)."""
+
+    def add_listener(self, listener: FeedListener) -> None:
+        """Call ``listener`` (from any thread) whenever a bar becomes available."""
+        return
+
+    @property
+    def exhausted(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        return
+
+
+class ReplayFeed(MarketDataFeed):
+    """Replays a candle list or ``CandleSeries``, wrapping around when ``loop`` is set."""
+
+    def __init__(
+        self,
+        candles: Sequence[Candle] | CandleSeries,
+        *,
+        symbol: str | None = None,
+        loop: bool = True,
+    ) -> None:
+        if not candles:
+            raise ValueError("candles must not be empty")
+        super().__init__(symbol or candles[0].symbol)
+        self.candles = candles
+        self.loop = loop
+        self.cursor = 0
+
+    def poll(self) -> Candle | None:
+        if self.exhausted:
+            return None
+        candle = self.candles[self.cursor % len(self.candles)]
+        self.cursor += 1
+        return candle
+
+    @property
+    def exhausted(self) -> bool:
+        return not self.loop and self.cursor >= len(self.candles)
+
+
+class SyntheticFeed(MarketDataFeed):
+    """Endless seeded random walk with one bar every ``bar_seconds`` of market time."""
+
+    def __init__(
+        self,
+        symbol: str,
+        *,
+        seed: int = 0,
+        start_price: float = 100.0,
+        volatility: float = 0.5,
+        bar_seconds: int = 60,
+        start: datetime | None = None,
+    ) -> None:
+        super().__init__(symbol)
+        self._rng = random.Random(seed)
+        self._price = start_price
+        self._volatility = volatility
+        self._step = timedelta(seconds=bar_seconds)
+        self._next_time = start or datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def poll(self) -> Candle:
+        rng = self._rng
+        open_ = self._price
+        close = max(0.01, open_ + rng.gauss(0.0, self._volatility))
+        self._price = close
+        timestamp = self._next_time.strftime(DATETIME_FORMAT)
+        self._next_time += self._step
+        return Candle(
+            symbol=self.symbol,
+            timestamp=timestamp,
+            open=round(open_, 4),
+            high=round(max(open_, close) + rng.random() * self._volatility * 0.4, 4),
+            low=round(max(0.01, min(open_, close) - rng.random() * self._volatility * 0.4), 4),
+            close=round(close, 4),
+            volume=float(rng.randrange(1_000, 100_000)),
+        )
+
+
+@dataclass(frozen=True)
+class QueueFeedStats:
+    published: int
+    dropped: int
+    queue_depth: int
+    # Seconds between publish and poll, i.e. how long bars waited for the consumer.
+    max_wait_seconds: float
+    last_wait_seconds: float
+
+
+class QueueFeed(MarketDataFeed):
+    """
+    Live feed that producers ``publish`` bars into from any thread.
+
+    Bars wait in a bounded queue until polled; when it is full the oldest bar is
+    dropped, since a trading loop that fell behind wants the newest prices.
+    """
+
+    live = True
+
+    def __init__(self, symbol: str, *, max_queue_size: int = 10_000) -> None:
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be positive")
+        super().__init__(symbol)
+        self.max_queue_size = max_queue_size
+        self._queue: deque[tuple[float, Candle]] = deque()
+        self._cond = threading.Condition()
+        self._listeners: list[FeedListener] = []
+        self._closed = False
+        self._published = 0
+        self._dropped = 0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    def publish(self, candle: Candle) -> None:
+        if candle.symbol != self.symbol:
+            raise ValueError(f"feed is for {self.symbol}, got a {candle.symbol} bar")
+        with self._cond:
+            if self._closed:
+                raise ValueError("feed is closed")
+            if len(self._queue) >= self.max_queue_size:
+                self._queue.popleft()
+                self._dropped += 1
+            self._queue.append((time.monotonic(), candle))
+            self._published += 1
+            self._cond.notify_all()
+        for listener in self._listeners:
+            listener()
+
+    def poll(self) -> Candle | None:
+        with self._cond:
+            if not self._queue:
+                return None
+            published_at, candle = self._queue.popleft()
+            self._last_wait = time.monotonic() - published_at
+            self._max_wait = max(self._max_wait, self._last_wait)
+            return candle
+
+    def next_candle(self, timeout: float | None = None) -> Candle | None:
+        """Blocking ``poll``: wait up to ``timeout`` seconds for a bar."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._queue or self._closed, timeout)
+        return self.poll()
+
+    def add_listener(self, listener: FeedListener) -> None:
+        self._listeners.append(listener)
+
+    @property
+    def exhausted(self) -> bool:
+        with self._cond:
+            return self._closed and not self._queue
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for listener in self._listeners:
+            listener()
+
+    def stats(self) -> QueueFeedStats:
+        with self._cond:
+            return QueueFeedStats(
+                published=self._published,
+                dropped=self._dropped,
+                queue_depth=len(self._queue),
+                max_wait_seconds=self._max_wait,
+                last_wait_seconds=self._last_wait,
+            )
+
+
+class HttpFeedServer:
+    """
+    Local stand-in for a live market data source.
+
+    ``POST /candles`` with one bar or a list of bars (``timestamp``, ``open``,
+    ``high``, ``low``, ``close``, ``volume``; ``symbol`` defaults to the feed's)
+    publishes them into ``feed``. Useful to drive a running bot by hand or from a
+    replay script. With ``api_token`` set, requests must carry it like the control
+    API's (``Authorization: Bearer <token>`` or ``X-API-Token``).
+    """
+
+    def __init__(
+        self,
+        feed: QueueFeed,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        api_token: str = "",
+    ) -> None:
+        self.feed = feed
+        self.api_token = api_token
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> HttpFeedServer:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="http-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def is_authorized(self, authorization: str, x_api_token: str) -> bool:
+        if not self.api_token:
+            return True
+        if authorization and hmac.compare_digest(authorization.strip(), f"Bearer {self.api_token}"):
+            return True
+        return bool(x_api_token) and hmac.compare_digest(x_api_token.strip(), self.api_token)
+
+    def publish_json(self, payload: Any) -> int:
+        items = payload if isinstance(payload, list) else [payload]
+        candles = [self._to_candle(item) for item in items]
+        for candle in candles:
+            self.feed.publish(candle)
+        return len(candles)
+
+    def _to_candle(self, item: Any) -> Candle:
+        if not isinstance(item, dict):
+            raise ValueError("each bar must be a JSON object")
+        symbol = str(item.get("symbol", self.feed.symbol))
+        if symbol != self.feed.symbol:
+            raise ValueError(f"feed is for {self.feed.symbol}, got a {symbol} bar")
+        close = float(item["close"])
+        return Candle(
+            symbol=symbol,
+            timestamp=str(item["timestamp"]),
+            open=float(item.get("open", close)),
+            high=float(item.get("high", close)),
+            low=float(item.get("low", close)),
+            close=close,
+            volume=float(item.get("volume", 0.0)),
+        )
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A003
+                return
+
+            def do_POST(self) -> None:  # noqa: N802
+                # Replies sent before the body is read end the connection so the
+                # unread body is not parsed as the next request.
+                if self.path.split("?", 1)[0] != "/candles":
+                    self.close_connection = True
+                    self._reply(404, {"error": "not found"})
+                    return
+                if not server.is_authorized(
+                    self.headers.get("Authorization", ""), self.headers.get("X-API-Token", "")
+                ):
+                    self.close_connection = True
+                    self._reply(401, {"error": "unauthorized"})
+                    return
+                try:
+                    body = self.rfile.read(_content_length(self.headers))
+                    accepted = server.publish_json(json.loads(body))
+                except (KeyError, TypeError, ValueError) as exc:
+                    self.close_connection = True
+                    self._reply(400, {"error": str(exc)})
+                    return
+                self._reply(200, {"accepted": accepted})
+
+            def _reply(self, code: int, payload: dict[str, Any]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def _content_length(headers: Mapping[str, str]) -> int:
+    raw = headers.get("Content-Length") or "0"
+    if not raw.strip().isdecimal():
+        raise ValueError(f"invalid Content-Length {raw!r}")
+    return int(raw)
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+import functools
+import re
+from typing import overload
+
+from namoo_overseas_bot.models import Candle
+
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+COLUMNS = ("timestamps", "open", "high", "low", "close", "volume")
+
+
+def parse_timestamp(raw: str) -> int:
+    """Parse an ISO-8601 date or datetime into UTC epoch seconds (naive means UTC)."""
+    text = raw.strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+_DATE_SHAPE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Date, "T" or space, hours and minutes, optional seconds and fraction, then "Z",
+# a fixed offset or nothing (naive, read as UTC).
+_TIMESTAMP_SHAPE = re.compile(r"\d{4}-\d{2}-\d{2}([T ])\d{2}:\d{2}(:\d{2})?(\.\d+)?(Z|[+-]\d{2}:\d{2})?")
+_OFFSET_SUFFIX = re.compile(r"([+-])(\d{2}):(\d{2})$")
+_FRACTION = re.compile(r"(?<=:\d{2})\.\d+")
+
+
+def detect_timestamp_format(raw: str) -> str:
+    """
+    strftime pattern that writes ``raw``'s epoch back as exactly ``raw``.
+
+    The separator, seconds and zone suffix (``Z``, a fixed offset such as
+    ``+09:00``, or none) are kept. Timestamps are stored as whole seconds, so
+    sub-second values cannot round-trip and raise ``ValueError``.
+    """
+    text = raw.strip()
+    if _DATE_SHAPE.fullmatch(text):
+        return DATE_FORMAT
+    match = _TIMESTAMP_SHAPE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"unsupported timestamp {raw!r}: expected an ISO-8601 date or datetime")
+    separator, seconds, fraction, zone = match.groups()
+    if fraction:
+        raise ValueError(f"unsupported timestamp {raw!r}: sub-second precision is not kept")
+    return f"%Y-%m-%d{separator}%H:%M{':%S' if seconds else ''}{zone or ''}"
+
+
+class TimestampFormatCheck:
+    """Tells whether timestamps are written exactly the way ``timestamp_format`` writes them back."""
+
+    __slots__ = ("_seen", "timestamp_format")
+
+    def __init__(self, timestamp_format: str) -> None:
+        self.timestamp_format = timestamp_format
+        self._seen: set[tuple[int, str, str]] = set()
+
+    @classmethod
+    def for_first(cls, raw: str) -> "TimestampFormatCheck":
+        """
+        Check against the format of ``raw``, the first timestamp of a series.
+
+        A sub-second first timestamp uses its whole-second format; anything else
+        that has no format (e.g. basic ISO ``20240308``) falls back to UTC ``Z``.
+        """
+        try:
+            return cls(detect_timestamp_format(_FRACTION.sub("", raw.strip(), count=1)))
+        except ValueError:
+            return cls(DATETIME_FORMAT)
+
+    def matches(self, raw_timestamps: Iterable[str]) -> bool:
+        # Rows of one format share length, separator and zone; only new shapes are parsed.
+        shapes = {(len(raw), raw[10:11], raw[16:]): raw for raw in raw_timestamps}
+        for shape, raw in shapes.items():
+            if shape in self._seen:
+                continue
+            try:
+                if detect_timestamp_format(raw) != self.timestamp_format:
+                    return False
+            except ValueError:
+                return False
+            self._seen.add(shape)
+        return True
+
+
+@functools.lru_cache(maxsize=32)
+def _format_zone(timestamp_format: str) -> timezone:
+    match = _OFFSET_SUFFIX.search(timestamp_format)
+    if match is None:
+        return timezone.utc
+    sign, hours, minutes = match.groups()
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-offset if sign == "-" else offset)
+
+
+def format_timestamp(epoch_seconds: int, timestamp_format: str = DATETIME_FORMAT) -> str:
+    """Format in the zone the pattern names: its trailing fixed offset, otherwise UTC."""
+    return datetime.fromtimestamp(epoch_seconds, _format_zone(timestamp_format)).strftime(timestamp_format)
+
+
+class CandleSeries:
+    """
+    Columnar OHLCV series for one symbol.
+
+    Prices/volume are contiguous float64 columns and timestamps are int64 UTC epoch
+    seconds, so a series costs 48 bytes per bar. Columns are anything indexable with
+    the buffer protocol (``array.array`` or a cast ``memoryview``), which lets numpy
+    wrap them without copying. Indexing returns ``Candle`` objects built on demand.
+
+    Timestamps are written back with ``timestamp_format``. When the source rows do
+    not share one format (a UTC offset that changes across DST, sub-second values),
+    ``timestamp_labels`` keeps every row's original string instead.
+    """
+
+    __slots__ = ("symbol", "timestamp_format", *COLUMNS, "timestamp_labels", "_backing")
+
+    def __init__(
+        self,
+        *,
+        symbol: str,
+        timestamps: Sequence[int],
+        open: Sequence[float],  # noqa: A002
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float],
+        volume: Sequence[float],
+        timestamp_format: str = DATETIME_FORMAT,
+        timestamp_labels: list[str] | None = None,
+        backing: object = None,
+    ) -> None:
+        n = len(timestamps)
+        if any(len(col) != n for col in (open, high, low, close, volume)):
+            raise ValueError("all candle columns must have the same length")
+        if timestamp_labels is not None and len(timestamp_labels) != n:
+            raise ValueError("timestamp_labels must have one label per candle")
+        self.symbol = symbol
+        self.timestamp_format = timestamp_format
+        self.timestamp_labels = timestamp_labels
+        self.timestamps = timestamps
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        # Keeps whatever owns the column memory (e.g. an mmap) alive with the series.
+        self._backing = backing
+
+    @classmethod
+    def empty(cls, symbol: str, *, timestamp_format: str = DATETIME_FORMAT) -> "CandleSeries":
+        return cls(
+            symbol=symbol,
+            timestamps=array("q"),
+            open=array("d"),
+            high=array("d"),
+            low=array("d"),
+            close=array("d"),
+            volume=array("d"),
+            timestamp_format=timestamp_format,
+        )
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[Candle], *, symbol: str | None = None) -> "CandleSeries":
+        series: CandleSeries | None = None
+        format_check: TimestampFormatCheck | None = None
+        raw_timestamps: list[str] = []
+        for candle in candles:
+            if series is None or format_check is None:
+                format_check = TimestampFormatCheck.for_first(candle.timestamp)
+                series = cls.empty(symbol or candle.symbol, timestamp_format=format_check.timestamp_format)
+            raw_timestamps.append(candle.timestamp)
+            series.append(
+                timestamp=parse_timestamp(candle.timestamp),
+                open=candle.open,
+                high=candle.high,
+                low=candle.low,
+                close=candle.close,
+                volume=candle.volume,
+            )
+        if series is None or format_check is None:
+            return cls.empty(symbol or "")
+        if not format_check.matches(raw_timestamps):
+            series.timestamp_labels = raw_timestamps
+        return series
+
+    def append(
+        self,
+        *,
+        timestamp: int,
+        open: float,  # noqa: A002
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        self.timestamps.append(timestamp)
+        self.open.append(open)
+        self.high.append(high)
+        self.low.append(low)
+        self.close.append(close)
+        self.volume.append(volume)
+        if self.timestamp_labels is not None:
+            self.timestamp_labels.append(self.format_timestamp(timestamp))
+
+    def label_timestamps(self) -> list[str]:
+        """Switch to per-row labels if not already on, e.g. before joining a labelled series."""
+        if self.timestamp_labels is None:
+            self.timestamp_labels = [self.format_timestamp(epoch) for epoch in self.timestamps]
+        return self.timestamp_labels
+
+    def format_timestamp(self, epoch_seconds: int) -> str:
+        return format_timestamp(epoch_seconds, self.timestamp_format)
+
+    def timestamp_at(self, index: int) -> str:
+        if self.timestamp_labels is not None:
+            return self.timestamp_labels[index]
+        return self.format_timestamp(self.timestamps[index])
+
+    def __reduce__(self) -> tuple[object, ...]:
+        # Mapped columns cannot be pickled; ship plain arrays to other processes.
+        return (
+            _rebuild_series,
+            (
+                self.symbol,
+                self.timestamp_format,
+                *(_as_array(getattr(self, name), "q" if name == "timestamps" else "d") for name in COLUMNS),
+                self.timestamp_labels,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CandleSeries": ...
+
+    def __getitem__(self, index: int | slice) -> Candle | CandleSeries:
+        if isinstance(index, slice):
+            return CandleSeries(
+                symbol=self.symbol,
+                timestamps=self.timestamps[index],
+                open=self.open[index],
+                high=self.high[index],
+                low=self.low[index],
+                close=self.close[index],
+                volume=self.volume[index],
+                timestamp_format=self.timestamp_format,
+                timestamp_labels=self.timestamp_labels[index] if self.timestamp_labels is not None else None,
+                backing=self._backing,
+            )
+        return Candle(
+            symbol=self.symbol,
+            timestamp=self.timestamp_at(index),
+            open=self.open[index],
+            high=self.high[index],
+            low=self.low[index],
+            close=self.close[index],
+            volume=self.volume[index],
+        )
+
+    def __iter__(self) -> Iterator[Candle]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"CandleSeries(symbol={self.symbol!r}, len={len(self)})"
+
+
+def _as_array(column: Sequence[float] | Sequence[int], typecode: str) -> array:
+    if isinstance(column, array):
+        return column
+    copied = array(typecode)
+    copied.frombytes(memoryview(column).cast("B"))
+    return copied
+
+
+def _rebuild_series(
+    symbol: str,
+    timestamp_format: str,
+    timestamps: array,
+    open: array,  # noqa: A002
+    high: array,
+    low: array,
+    close: array,
+    volume: array,
+    timestamp_labels: list[str] | None = None,
+) -> CandleSeries:
+    return CandleSeries(
+        symbol=symbol,
+        timestamps=timestamps,
+        open=open,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+        timestamp_format=timestamp_format,
+        timestamp_labels=timestamp_labels,
+    )
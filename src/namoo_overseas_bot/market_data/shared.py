@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+import sys
+from typing import Any
+import weakref
+
+from namoo_overseas_bot.market_data.series import COLUMNS, CandleSeries
+
+_ITEM_SIZE = 8
+
+
+@dataclass(frozen=True)
+class SharedSeriesHandle:
+    """What a worker needs to attach to a published series; cheap to pickle."""
+
+    name: str
+    symbol: str
+    timestamp_format: str
+    rows: int
+    timestamp_labels: tuple[str, ...] | None = None
+
+
+class _AttachedMemory(shared_memory.SharedMemory):
+    def __del__(self) -> None:
+        # Column views (and numpy arrays over them) can outlive this object at
+        # interpreter exit; the mapping goes away with the process anyway.
+        with contextlib.suppress(BufferError, OSError):
+            self.close()
+
+
+def _release(shm: shared_memory.SharedMemory) -> None:
+    shm.close()
+    with contextlib.suppress(FileNotFoundError):
+        shm.unlink()
+
+
+class SharedCandleSeries:
+    """
+    One copy of a ``CandleSeries`` in shared memory for worker processes.
+
+    The publisher copies the six columns into a single block; workers call
+    ``attach_series(handle)`` to get a ``CandleSeries`` whose columns are views
+    into it. Only the publisher unlinks the block: on ``close``, when garbage
+    collected, or at interpreter exit. If the publisher is killed, the
+    multiprocessing resource tracker unlinks it instead. Attach from processes
+    the publisher started (e.g. a ``ProcessPoolExecutor``), which share its
+    resource tracker.
+    """
+
+    def __init__(self, series: CandleSeries) -> None:
+        rows = len(series)
+        block = rows * _ITEM_SIZE
+        # A zero-size block is not allowed; an empty series still gets one byte.
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, block * len(COLUMNS)))
+        for index, column in enumerate(COLUMNS):
+            offset = index * block
+            self._shm.buf[offset : offset + block] = memoryview(getattr(series, column)).cast("B")
+        self.handle = SharedSeriesHandle(
+            name=self._shm.name,
+            symbol=series.symbol,
+            timestamp_format=series.timestamp_format,
+            rows=rows,
+            timestamp_labels=tuple(series.timestamp_labels) if series.timestamp_labels is not None else None,
+        )
+        self._finalizer = weakref.finalize(self, _release, self._shm)
+
+    @property
+    def nbytes(self) -> int:
+        return self.handle.rows * _ITEM_SIZE * len(COLUMNS)
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Unmap and unlink the block; series attached elsewhere must be done with it."""
+        self._finalizer()
+
+    def __enter__(self) -> SharedCandleSeries:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def attach_series(handle: SharedSeriesHandle) -> CandleSeries:
+    """Zero-copy ``CandleSeries`` over a block published by ``SharedCandleSeries``."""
+    kwargs: dict[str, Any] = {"track": False} if sys.version_info >= (3, 13) else {}
+    shm = _AttachedMemory(name=handle.name, **kwargs)
+    view = shm.buf
+    block = handle.rows * _ITEM_SIZE
+    columns = {
+        column: view[index * block : (index + 1) * block].cast("q" if column == "timestamps" else "d")
+        for index, column in enumerate(COLUMNS)
+    }
+    return CandleSeries(
+        symbol=handle.symbol,
+        timestamp_format=handle.timestamp_format,
+        timestamp_labels=list(handle.timestamp_labels) if handle.timestamp_labels is not None else None,
+        backing=shm,
+        **columns,
+    )
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+import math
+import threading
+
+# Seconds; spans sub-microsecond strategy updates up to slow remote API calls.
+DEFAULT_LATENCY_BUCKETS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Family:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], object] = {}
+
+    def _child(self, labels: dict[str, str], factory: Callable[[], object]) -> object:
+        try:
+            if len(labels) != len(self.labelnames):
+                raise KeyError
+            key = tuple([labels[name] for name in self.labelnames])
+        except KeyError:
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            ) from None
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, factory())
+        return child
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class _CounterValue:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Family):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        # Unlabelled metrics skip the per-call child lookup.
+        self._default = None if self.labelnames else self.labels()
+
+    def labels(self, **labels: str) -> _CounterValue:
+        return self._child(labels, _CounterValue)  # type: ignore[return-value]
+
+    def inc(self, amount: float = 1.0) -> None:
+        (self._default or self.labels()).inc(amount)
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for key, child in sorted(self._children.items()):
+            assert isinstance(child, _CounterValue)
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+
+class _HistogramValue:
+    __slots__ = ("_bounds", "_counts", "_lock", "count", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+
+    def snapshot(self) -> tuple[list[int], int, float]:
+        with self._lock:
+            return list(self._counts), self.count, self.total
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+        self._default = None if self.labelnames else self.labels()
+
+    def labels(self, **labels: str) -> _HistogramValue:
+        return self._child(labels, lambda: _HistogramValue(self.buckets))  # type: ignore[return-value]
+
+    def observe(self, value: float) -> None:
+        (self._default or self.labels()).observe(value)
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        bounds = (*self.buckets, math.inf)
+        for key, child in sorted(self._children.items()):
+            assert isinstance(child, _HistogramValue)
+            counts, count, total = child.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Gauge(_Family):
+    """Gauge read from ``source`` at scrape time, so nothing is updated on the hot path."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, source: Callable[[], float]) -> None:
+        super().__init__(name, help_text, ())
+        self.source = source
+
+    def render(self) -> list[str]:
+        return [*self.header(), f"{self.name} {_format_value(float(self.source()))}"]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._families: dict[str, _Family] = {}
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help_text: str, source: Callable[[], float]) -> Gauge:
+        return self._register(Gauge(name, help_text, source))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            families = list(self._families.values())
+        lines: list[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, family: _Family) -> _Family:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is not None:
+                if type(existing) is not type(family):
+                    raise ValueError(f"metric {family.name} already registered as {existing.kind}")
+                return existing
+            self._families[family.name] = family
+            return family
+
+
+class BotMetrics:
+    """The trading runtime's instruments; one instance is shared by every bot of a server."""
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.tick_seconds = r.histogram(
+            "namoo_process_next_candle_seconds", "Time spent processing one candle."
+        )
+        self.strategy_seconds = r.histogram(
+            "namoo_strategy_on_price_seconds", "Time spent in strategy.on_price."
+        )
+        self.broker_seconds = r.histogram(
+            "namoo_broker_submit_order_seconds", "Time spent in broker.submit_order."
+        )
+        self.notifier_seconds = r.histogram(
+            "namoo_notifier_send_seconds", "Time the trading loop spends in notifier.send."
+        )
+        self.throttle_wait_seconds = r.histogram(
+            "namoo_broker_throttle_wait_seconds",
+            "Time broker calls waited for a rate-limit token.",
+            ("kind",),
+        )
+        self.signals = r.counter("namoo_signals_total", "Non-HOLD strategy signals.", ("symbol", "signal"))
+        self.fills = r.counter("namoo_fills_total", "Filled orders.", ("symbol", "side"))
+        self.errors = r.counter("namoo_errors_total", "Swallowed runtime errors.", ("source",))
+        self.loop_iterations = r.counter(
+            "namoo_loop_iterations_total", "Scheduler loop iterations that waited a full tick."
+        )
+        self.loop_drift = r.counter(
+            "namoo_loop_drift_seconds_total",
+            "Accumulated lateness of scheduler wake-ups past their tick deadline.",
+        )
+
+    def record_loop_drift(self, late_seconds: float) -> None:
+        self.loop_iterations.inc()
+        if late_seconds > 0:
+            self.loop_drift.inc(late_seconds)
+
+    def render(self) -> str:
+        return self.registry.render()
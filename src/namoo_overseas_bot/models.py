@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -40,3 +40,13 @@ class Fill:
     qty: int
     price: float
     timestamp: str
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    cash: float
+    # Only symbols with a non-zero position.
+    positions: dict[str, int] = field(default_factory=dict)
+
+    def position_qty(self, symbol: str) -> int:
+        return self.positions.get(symbol, 0)
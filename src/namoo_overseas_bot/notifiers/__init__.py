@@ -1,5 +1,6 @@
 from namoo_overseas_bot.notifiers.base import NotifierClient
 from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.notifiers.queued import QueuedNotifier
 from namoo_overseas_bot.notifiers.telegram import TelegramNotifier
 
-__all__ = ["NotifierClient", "NoOpNotifier", "TelegramNotifier"]
+__all__ = ["NotifierClient", "NoOpNotifier", "QueuedNotifier", "TelegramNotifier"]
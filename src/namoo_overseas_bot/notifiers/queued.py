@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+import threading
+import time
+
+from namoo_overseas_bot.notifiers.base import NotifierClient
+
+DROP_OLDEST = "oldest"
+DROP_NEWEST = "newest"
+
+# Telegram rejects messages over 4096 characters.
+TELEGRAM_MAX_MESSAGE_CHARS = 4096
+
+
+@dataclass
+class NotifierStats:
+    queue_depth: int
+    max_queue_size: int
+    enqueued: int
+    dropped: int
+    sent_messages: int
+    sent_batches: int
+    failed_batches: int
+    last_latency_seconds: float
+    avg_latency_seconds: float
+    max_latency_seconds: float
+    last_error: str
+
+
+class QueuedNotifier(NotifierClient):
+    """
+    Non-blocking notifier: ``send`` enqueues and returns, a background thread delivers.
+
+    Messages that pile up while the sender waits (rate limit or a slow call) are
+    joined into one message of at most ``max_batch_chars``. Sends are spaced at
+    least ``min_interval_seconds`` apart. When ``max_queue_size`` is reached the
+    ``drop_policy`` discards either the oldest queued message or the new one.
+    """
+
+    def __init__(
+        self,
+        inner: NotifierClient,
+        *,
+        max_queue_size: int = 1000,
+        drop_policy: str = DROP_OLDEST,
+        min_interval_seconds: float = 1.0,
+        max_batch_chars: int = TELEGRAM_MAX_MESSAGE_CHARS,
+        coalesce_seconds: float = 0.05,
+    ) -> None:
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be positive")
+        if drop_policy not in {DROP_OLDEST, DROP_NEWEST}:
+            raise ValueError(f"unsupported drop_policy: {drop_policy}")
+
+        self.inner = inner
+        self.max_queue_size = max_queue_size
+        self.drop_policy = drop_policy
+        self.min_interval_seconds = min_interval_seconds
+        self.max_batch_chars = max_batch_chars
+        self.coalesce_seconds = coalesce_seconds
+
+        self._queue: deque[tuple[float, str]] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._in_flight = 0
+        self._last_send_at = 0.0
+
+        self._enqueued = 0
+        self._dropped = 0
+        self._sent_messages = 0
+        self._sent_batches = 0
+        self._failed_batches = 0
+        self._latency_total = 0.0
+        self._last_latency = 0.0
+        self._max_latency = 0.0
+        self._last_error = ""
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="queued-notifier", daemon=True)
+            self._thread.start()
+
+    def stop(self, *, flush_timeout: float = 5.0) -> None:
+        """Deliver what is queued (bounded by ``flush_timeout``), then stop the sender."""
+        self.flush(timeout=flush_timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(timeout=flush_timeout)
+
+    def flush(self, *, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not (self._thread and self._thread.is_alive()):
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def send(self, message: str) -> None:
+        with self._cond:
+            if len(self._queue) >= self.max_queue_size:
+                self._dropped += 1
+                if self.drop_policy == DROP_NEWEST:
+                    return
+                self._queue.popleft()
+            self._queue.append((time.monotonic(), message))
+            self._enqueued += 1
+            self._cond.notify_all()
+        if self._thread is None:
+            self.start()
+
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict[str, object]:
+        with self._cond:
+            delivered = self._sent_messages
+            return asdict(
+                NotifierStats(
+                    queue_depth=len(self._queue),
+                    max_queue_size=self.max_queue_size,
+                    enqueued=self._enqueued,
+                    dropped=self._dropped,
+                    sent_messages=delivered,
+                    sent_batches=self._sent_batches,
+                    failed_batches=self._failed_batches,
+                    last_latency_seconds=self._last_latency,
+                    avg_latency_seconds=self._latency_total / delivered if delivered else 0.0,
+                    max_latency_seconds=self._max_latency,
+                    last_error=self._last_error,
+                )
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if not self._queue and self._stopping:
+                    return
+
+            # Respect the rate limit, then give a burst a moment to finish arriving.
+            wait = self._last_send_at + self.min_interval_seconds - time.monotonic()
+            time.sleep(max(wait, 0.0) + self.coalesce_seconds)
+
+            with self._cond:
+                batch = self._take_batch()
+                self._in_flight = len(batch)
+            if not batch:
+                continue
+
+            text = "\n".join(message for _, message in batch)
+            error = ""
+            try:
+                self.inner.send(text)
+            except Exception as exc:
+                # Notifications should never crash trading runtime.
+                error = str(exc)
+            sent_at = time.monotonic()
+            self._last_send_at = sent_at
+
+            with self._cond:
+                self._in_flight = 0
+                if error:
+                    self._failed_batches += 1
+                    self._last_error = error
+                else:
+                    self._sent_batches += 1
+                    self._sent_messages += len(batch)
+                    for enqueued_at, _ in batch:
+                        latency = sent_at - enqueued_at
+                        self._latency_total += latency
+                        self._max_latency = max(self._max_latency, latency)
+                        self._last_latency = latency
+                self._cond.notify_all()
+
+    def _take_batch(self) -> list[tuple[float, str]]:
+        batch: list[tuple[float, str]] = []
+        size = 0
+        while self._queue:
+            enqueued_at, message = self._queue[0]
+            if len(message) > self.max_batch_chars:
+                message = message[: self.max_batch_chars]
+            added = len(message) + (1 if batch else 0)
+            if batch and size + added > self.max_batch_chars:
+                break
+            self._queue.popleft()
+            batch.append((enqueued_at, message))
+            size += added
+        return batch
@@ -1,38 +1,55 @@
 from __future__ import annotations
 
 import json
-import urllib.error
-import urllib.request
 
+from namoo_overseas_bot.http_pool import HttpPoolError, KeepAliveHttpClient
 from namoo_overseas_bot.notifiers.base import NotifierClient
 
 
 class TelegramNotifier(NotifierClient):
-    def __init__(self, *, bot_token: str, chat_id: str, timeout_seconds: float = 10.0) -> None:
+    def __init__(
+        self,
+        *,
+        bot_token: str,
+        chat_id: str,
+        timeout_seconds: float = 10.0,
+        api_base_url: str = "https://api.telegram.org",
+        http_client: KeepAliveHttpClient | None = None,
+    ) -> None:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.timeout_seconds = timeout_seconds
+        self.api_base_url = api_base_url.rstrip("/")
+        # Reusing one TLS connection saves a handshake on every message.
+        self.http_client = http_client or KeepAliveHttpClient(
+            self.api_base_url, timeout_seconds=timeout_seconds
+        )
 
-    def send(self, message: str) -> None:
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-        payload = json.dumps(
+    def send_message_path(self) -> str:
+        return f"/bot{self.bot_token}/sendMessage"
+
+    def send_message_url(self) -> str:
+        return f"{self.api_base_url}{self.send_message_path()}"
+
+    def send_message_payload(self, message: str) -> bytes:
+        return json.dumps(
             {
                 "chat_id": self.chat_id,
                 "text": message,
                 "disable_web_page_preview": True,
             }
         ).encode("utf-8")
-        req = urllib.request.Request(
-            url=url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
 
+    def send(self, message: str) -> None:
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout_seconds) as response:
-                status = getattr(response, "status", 200)
-                if status >= 300:
-                    raise RuntimeError(f"telegram send failed with status={status}")
-        except urllib.error.URLError as exc:
+            response = self.http_client.request(
+                "POST",
+                self.send_message_path(),
+                body=self.send_message_payload(message),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout_seconds,
+            )
+        except HttpPoolError as exc:
             raise RuntimeError(f"telegram send failed: {exc}") from exc
+        if response.status >= 300:
+            raise RuntimeError(f"telegram send failed with status={response.status}")
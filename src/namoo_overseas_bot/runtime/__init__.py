@@ -1,13 +1,30 @@
-from namoo_overseas_bot.runtime.api_server import BotApiServer
+from namoo_overseas_bot.runtime.api_server import ApiRouter, BotApiServer
+from namoo_overseas_bot.runtime.async_runtime import AsyncBotRuntime, AsyncNotifierBridge
+from namoo_overseas_bot.runtime.checkpoint import CheckpointError, CheckpointStore
+from namoo_overseas_bot.runtime.clock import RealClock, VirtualClock
+from namoo_overseas_bot.runtime.multi_bot import MultiSymbolTradingBot
 from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.runtime.protocols import ControllableBot
+from namoo_overseas_bot.runtime.status_snapshot import StatusPublisher, StatusSnapshot
 from namoo_overseas_bot.runtime.telegram_commands import (
     TelegramCommandHandler,
     TelegramCommandPoller,
 )
 
 __all__ = [
+    "ApiRouter",
+    "AsyncBotRuntime",
+    "AsyncNotifierBridge",
     "BotApiServer",
+    "CheckpointError",
+    "CheckpointStore",
+    "ControllableBot",
+    "MultiSymbolTradingBot",
     "PaperTradingBot",
+    "RealClock",
+    "StatusPublisher",
+    "StatusSnapshot",
     "TelegramCommandHandler",
     "TelegramCommandPoller",
+    "VirtualClock",
 ]
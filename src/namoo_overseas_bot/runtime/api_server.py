@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 import hmac
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
 import threading
 from typing import Protocol
+import urllib.parse
 
-from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from namoo_overseas_bot.runtime.protocols import ControllableBot
+from namoo_overseas_bot.runtime.status_snapshot import StatusPublisher, StatusSnapshot
+from namoo_overseas_bot.tracing import StageTracer
+
+DEFAULT_LONG_POLL_SECONDS = 25.0
+MAX_LONG_POLL_SECONDS = 60.0
 
 
 class TelegramCommandsToggle(Protocol):
@@ -15,96 +23,242 @@ class TelegramCommandsToggle(Protocol):
     def set_commands_enabled(self, enabled: bool) -> None: ...
 
 
-def _make_handler(
-    bot: PaperTradingBot,
-    *,
-    telegram_commands: TelegramCommandsToggle | None,
-    api_token: str,
-) -> type[BaseHTTPRequestHandler]:
+class NotifierStatsSource(Protocol):
+    def stats(self) -> dict[str, object]: ...
+
+
+class MetricsSource(Protocol):
+    def render(self) -> str: ...
+
+
+class HeaderLookup(Protocol):
+    def get(self, name: str, default: str = "") -> str: ...
+
+
+@dataclass
+class ApiResponse:
+    code: int
+    payload: dict[str, object]
+    shutdown: bool = False
+    headers: dict[str, str] = field(default_factory=dict)
+    raw: bytes | None = None
+    content_type: str = "application/json"
+
+    def body(self) -> bytes:
+        if self.raw is not None:
+            return self.raw
+        return json.dumps(self.payload).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class StatusPoll:
+    since: int
+    timeout: float
+
+
+class ApiRouter:
+    """Transport-independent routing shared by the threaded and asyncio servers."""
+
+    def __init__(
+        self,
+        bot: ControllableBot,
+        *,
+        telegram_commands: TelegramCommandsToggle | None,
+        api_token: str,
+        notifier_stats: NotifierStatsSource | None = None,
+        status_snapshots: StatusPublisher | None = None,
+        metrics: MetricsSource | None = None,
+        tracer: StageTracer | None = None,
+    ) -> None:
+        self.bot = bot
+        self.telegram_commands = telegram_commands
+        self.api_token = api_token
+        self.notifier_stats = notifier_stats
+        self.status_snapshots = status_snapshots
+        self.metrics = metrics
+        self.tracer = tracer
+
+    def handle(
+        self, method: str, path: str, headers: HeaderLookup, *, wait: bool = True
+    ) -> ApiResponse:
+        """
+        Route one request. ``wait=False`` answers a ``/status?since=`` long-poll
+        with the current snapshot instead of blocking; the asyncio server waits on
+        its own and then calls back with it.
+        """
+        route, _, query = path.partition("?")
+        if method == "GET":
+            if route == "/status" and self.status_snapshots is not None:
+                if not self.is_authorized(headers):
+                    return ApiResponse(401, {"error": "unauthorized"})
+                return self._status_snapshot(query, headers, wait=wait)
+            if route == "/debug/trace":
+                return self._trace(query, headers)
+            return self._get(route, headers)
+        if method == "POST":
+            return self._post(route, headers)
+        return ApiResponse(405, {"error": "method not allowed"})
+
+    def pending_long_poll(self, method: str, path: str, headers: HeaderLookup) -> StatusPoll | None:
+        """Return the poll to wait on if this request is a long-poll with nothing new yet."""
+        route, _, query = path.partition("?")
+        snapshots = self.status_snapshots
+        if method != "GET" or route != "/status" or snapshots is None:
+            return None
+        if not self.is_authorized(headers):
+            return None
+        poll = _parse_status_poll(query)
+        if isinstance(poll, StatusPoll) and poll.since == snapshots.latest.version:
+            return poll
+        return None
+
+    def is_authorized(self, headers: HeaderLookup) -> bool:
+        if not self.api_token:
+            return True
+
+        auth_header = (headers.get("Authorization", "") or "").strip()
+        expected_bearer = f"Bearer {self.api_token}"
+        if auth_header and hmac.compare_digest(auth_header, expected_bearer):
+            return True
+
+        x_api_token = (headers.get("X-API-Token", "") or "").strip()
+        if x_api_token and hmac.compare_digest(x_api_token, self.api_token):
+            return True
+
+        return False
+
+    def _get(self, path: str, headers: HeaderLookup) -> ApiResponse:
+        bot = self.bot
+        telegram_commands = self.telegram_commands
+        if path == "/health":
+            return ApiResponse(200, {"status": "ok", "running": bot.status()["running"]})
+
+        if not self.is_authorized(headers):
+            return ApiResponse(401, {"error": "unauthorized"})
+
+        if path == "/status":
+            return ApiResponse(200, bot.status())
+        if path == "/telegram-commands":
+            enabled = telegram_commands.is_commands_enabled() if telegram_commands else False
+            return ApiResponse(
+                200,
+                {
+                    "available": telegram_commands is not None,
+                    "enabled": enabled,
+                },
+            )
+        if path == "/notifier":
+            if self.notifier_stats is None:
+                return ApiResponse(409, {"error": "notifier stats unavailable"})
+            return ApiResponse(200, self.notifier_stats.stats())
+        if path == "/metrics":
+            if self.metrics is None:
+                return ApiResponse(409, {"error": "metrics unavailable"})
+            return ApiResponse(
+                200,
+                {},
+                raw=self.metrics.render().encode("utf-8"),
+                content_type=METRICS_CONTENT_TYPE,
+            )
+        return ApiResponse(404, {"error": "not found"})
+
+    def _trace(self, query: str, headers: HeaderLookup) -> ApiResponse:
+        if not self.is_authorized(headers):
+            return ApiResponse(401, {"error": "unauthorized"})
+        if self.tracer is None:
+            return ApiResponse(409, {"error": "stage tracing is disabled (start with --trace)"})
+        raw_limit = urllib.parse.parse_qs(query).get("limit", ["100"])[0]
+        try:
+            limit = max(int(raw_limit), 0)
+        except ValueError:
+            return ApiResponse(400, {"error": "limit must be an integer"})
+        return ApiResponse(200, self.tracer.to_dict(limit=limit))
+
+    def _status_snapshot(self, query: str, headers: HeaderLookup, *, wait: bool) -> ApiResponse:
+        assert self.status_snapshots is not None
+        poll = _parse_status_poll(query)
+        if isinstance(poll, ApiResponse):
+            return poll
+        snapshot = self.status_snapshots.latest
+        if poll is not None and wait:
+            snapshot = self.status_snapshots.wait_for_change(poll.since, poll.timeout)
+        return _snapshot_response(snapshot, headers)
+
+    def _post(self, path: str, headers: HeaderLookup) -> ApiResponse:
+        bot = self.bot
+        telegram_commands = self.telegram_commands
+        if not self.is_authorized(headers):
+            return ApiResponse(401, {"error": "unauthorized"})
+
+        if path == "/pause":
+            bot.pause()
+            return ApiResponse(200, {"ok": True, "paused": True})
+        if path == "/resume":
+            bot.resume()
+            return ApiResponse(200, {"ok": True, "paused": False})
+        if path == "/stop":
+            bot.stop()
+            return ApiResponse(200, {"ok": True, "stopped": True}, shutdown=True)
+        if path == "/telegram-commands/enable":
+            if telegram_commands is None:
+                return ApiResponse(409, {"error": "telegram commands controller unavailable"})
+            telegram_commands.set_commands_enabled(True)
+            return ApiResponse(200, {"ok": True, "enabled": True})
+        if path == "/telegram-commands/disable":
+            if telegram_commands is None:
+                return ApiResponse(409, {"error": "telegram commands controller unavailable"})
+            telegram_commands.set_commands_enabled(False)
+            return ApiResponse(200, {"ok": True, "enabled": False})
+        return ApiResponse(404, {"error": "not found"})
+
+
+def _parse_status_poll(query: str) -> StatusPoll | ApiResponse | None:
+    params = urllib.parse.parse_qs(query)
+    if "since" not in params:
+        return None
+    try:
+        since = int(params["since"][0])
+        timeout = float(params.get("timeout", [DEFAULT_LONG_POLL_SECONDS])[0])
+    except ValueError:
+        return ApiResponse(400, {"error": "since must be an integer and timeout a number"})
+    return StatusPoll(since=since, timeout=min(max(timeout, 0.0), MAX_LONG_POLL_SECONDS))
+
+
+def _snapshot_response(snapshot: StatusSnapshot, headers: HeaderLookup) -> ApiResponse:
+    response_headers = {
+        "ETag": snapshot.etag,
+        "X-Status-Version": str(snapshot.version),
+        "Cache-Control": "no-cache",
+    }
+    if_none_match = headers.get("If-None-Match", "") or ""
+    if snapshot.etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return ApiResponse(304, {}, headers=response_headers, raw=b"")
+    return ApiResponse(200, {}, headers=response_headers, raw=snapshot.body)
+
+
+def _make_handler(router: ApiRouter) -> type[BaseHTTPRequestHandler]:
     class Handler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:  # noqa: N802
-            if self.path == "/health":
-                self._send_json(200, {"status": "ok", "running": bot.status()["running"]})
-                return
-
-            if not self._is_authorized():
-                self._send_json(401, {"error": "unauthorized"})
-                return
-
-            if self.path == "/status":
-                self._send_json(200, bot.status())
-                return
-            if self.path == "/telegram-commands":
-                enabled = telegram_commands.is_commands_enabled() if telegram_commands else False
-                self._send_json(
-                    200,
-                    {
-                        "available": telegram_commands is not None,
-                        "enabled": enabled,
-                    },
-                )
-                return
-            self._send_json(404, {"error": "not found"})
+            self._dispatch("GET")
 
         def do_POST(self) -> None:  # noqa: N802
-            if not self._is_authorized():
-                self._send_json(401, {"error": "unauthorized"})
-                return
-
-            if self.path == "/pause":
-                bot.pause()
-                self._send_json(200, {"ok": True, "paused": True})
-                return
-            if self.path == "/resume":
-                bot.resume()
-                self._send_json(200, {"ok": True, "paused": False})
-                return
-            if self.path == "/stop":
-                bot.stop()
-                self._send_json(200, {"ok": True, "stopped": True})
-                threading.Thread(target=self.server.shutdown, daemon=True).start()
-                return
-            if self.path == "/telegram-commands/enable":
-                if telegram_commands is None:
-                    self._send_json(409, {"error": "telegram commands controller unavailable"})
-                    return
-                telegram_commands.set_commands_enabled(True)
-                self._send_json(200, {"ok": True, "enabled": True})
-                return
-            if self.path == "/telegram-commands/disable":
-                if telegram_commands is None:
-                    self._send_json(409, {"error": "telegram commands controller unavailable"})
-                    return
-                telegram_commands.set_commands_enabled(False)
-                self._send_json(200, {"ok": True, "enabled": False})
-                return
-            self._send_json(404, {"error": "not found"})
+            self._dispatch("POST")
 
         def log_message(self, format: str, *args: object) -> None:  # noqa: A003
             return
 
-        def _send_json(self, code: int, payload: dict[str, object]) -> None:
-            data = json.dumps(payload).encode("utf-8")
-            self.send_response(code)
-            self.send_header("Content-Type", "application/json")
+        def _dispatch(self, method: str) -> None:
+            response = router.handle(method, self.path, self.headers)
+            data = response.body()
+            self.send_response(response.code)
+            self.send_header("Content-Type", response.content_type)
             self.send_header("Content-Length", str(len(data)))
+            for name, value in response.headers.items():
+                self.send_header(name, value)
             self.end_headers()
             self.wfile.write(data)
-
-        def _is_authorized(self) -> bool:
-            if not api_token:
-                return True
-
-            auth_header = self.headers.get("Authorization", "").strip()
-            expected_bearer = f"Bearer {api_token}"
-            if auth_header and hmac.compare_digest(auth_header, expected_bearer):
-                return True
-
-            x_api_token = self.headers.get("X-API-Token", "").strip()
-            if x_api_token and hmac.compare_digest(x_api_token, api_token):
-                return True
-
-            return False
+            if response.shutdown:
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
 
     return Handler
 
@@ -113,23 +267,29 @@ class BotApiServer:
     def __init__(
         self,
         *,
-        bot: PaperTradingBot,
+        bot: ControllableBot,
         host: str,
         port: int,
         telegram_commands: TelegramCommandsToggle | None = None,
         api_token: str = "",
+        notifier_stats: NotifierStatsSource | None = None,
+        status_snapshots: StatusPublisher | None = None,
+        metrics: MetricsSource | None = None,
+        tracer: StageTracer | None = None,
     ) -> None:
         self.bot = bot
         self.host = host
         self.port = port
-        self._server = ThreadingHTTPServer(
-            (host, port),
-            _make_handler(
-                bot,
-                telegram_commands=telegram_commands,
-                api_token=api_token,
-            ),
+        self.router = ApiRouter(
+            bot,
+            telegram_commands=telegram_commands,
+            api_token=api_token,
+            notifier_stats=notifier_stats,
+            status_snapshots=status_snapshots,
+            metrics=metrics,
+            tracer=tracer,
         )
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self.router))
 
     @property
     def server_address(self) -> tuple[str, int]:
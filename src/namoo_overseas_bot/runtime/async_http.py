@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ssl
+import urllib.parse
+
+
+class AsyncHttpError(RuntimeError):
+    pass
+
+
+async def http_request(
+    method: str,
+    url: str,
+    *,
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 10.0,
+) -> tuple[int, bytes]:
+    """Minimal HTTP/1.1 request over asyncio streams; returns ``(status, body)``.
+
+    One connection per call (``Connection: close``) keeps the parser trivial; it is
+    meant for the runtime's few control-plane calls, not bulk traffic.
+    """
+    return await asyncio.wait_for(
+        _request(method, url, body=body, headers=headers or {}),
+        timeout=timeout,
+    )
+
+
+async def _request(
+    method: str,
+    url: str,
+    *,
+    body: bytes | None,
+    headers: dict[str, str],
+) -> tuple[int, bytes]:
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in {"http", "https"} or not parts.hostname:
+        raise AsyncHttpError(f"unsupported url: {url}")
+    https = parts.scheme == "https"
+    port = parts.port or (443 if https else 80)
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+
+    reader, writer = await asyncio.open_connection(
+        parts.hostname,
+        port,
+        ssl=ssl.create_default_context() if https else None,
+    )
+    try:
+        lines = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            "Connection: close",
+            "Accept-Encoding: identity",
+        ]
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError) as exc:
+            raise AsyncHttpError(f"malformed status line: {status_line!r}") from exc
+
+        response_headers = await read_headers(reader)
+        if "content-length" in response_headers:
+            data = await reader.readexactly(int(response_headers["content-length"]))
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await _read_chunked(reader)
+        else:
+            data = await reader.read()
+        return status, data
+    finally:
+        writer.close()
+        with contextlib.suppress(Exception):
+            await writer.wait_closed()
+
+
+async def read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+    """Read header lines up to the blank line; names are lower-cased."""
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in {b"\r\n", b"\n", b""}:
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            await read_headers(reader)
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+from http import HTTPStatus
+import json
+from typing import Protocol
+
+from namoo_overseas_bot.metrics import BotMetrics
+from namoo_overseas_bot.notifiers.base import NotifierClient
+from namoo_overseas_bot.notifiers.telegram import TelegramNotifier
+from namoo_overseas_bot.runtime.api_server import ApiRouter, StatusPoll, TelegramCommandsToggle
+from namoo_overseas_bot.runtime.async_http import http_request, read_headers
+from namoo_overseas_bot.runtime.protocols import ControllableBot
+from namoo_overseas_bot.runtime.status_snapshot import StatusPublisher, StatusSnapshot
+from namoo_overseas_bot.runtime.telegram_commands import TelegramCommandPoller
+from namoo_overseas_bot.tracing import StageTracer
+
+_TELEGRAM_LONG_POLL_SECONDS = 20
+_CLIENT_READ_TIMEOUT_SECONDS = 10.0
+_SHUTDOWN_FLUSH_SECONDS = 5.0
+_SHUTDOWN_CANCEL_RETRY_SECONDS = 0.1
+
+
+class SteppableBot(ControllableBot, Protocol):
+    tick_seconds: float
+
+    @property
+    def stopped(self) -> bool: ...
+
+    def start(self, *, run_loop: bool = True) -> None: ...
+
+    def run_once(self) -> None: ...
+
+    def add_state_listener(self, listener: Callable[[], None]) -> None: ...
+
+
+class AsyncNotifierBridge(NotifierClient):
+    """
+    Notifier handed to the bot in asyncio mode.
+
+    ``send`` only enqueues (safe from any thread); the runtime's notification task
+    delivers messages through the wrapped notifier. Telegram is posted with the
+    non-blocking client so a slow Bot API call never stalls the event loop.
+    """
+
+    def __init__(self, inner: NotifierClient) -> None:
+        self.inner = inner
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[str] | None = None
+        self._pending: list[str] = []
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        for message in self._pending:
+            self._queue.put_nowait(message)
+        self._pending.clear()
+
+    def send(self, message: str) -> None:
+        loop, queue = self._loop, self._queue
+        if loop is None or queue is None:
+            self._pending.append(message)
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            queue.put_nowait(message)
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+    async def deliver_forever(self) -> None:
+        assert self._queue is not None
+        while True:
+            message = await self._queue.get()
+            try:
+                await self.deliver(message)
+            except Exception:
+                # Notifications should never crash trading runtime.
+                pass
+            finally:
+                self._queue.task_done()
+
+    async def flush(self, timeout: float) -> None:
+        if self._queue is None:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+
+    async def deliver(self, message: str) -> None:
+        inner = self.inner
+        if isinstance(inner, TelegramNotifier):
+            status, _ = await http_request(
+                "POST",
+                inner.send_message_url(),
+                body=inner.send_message_payload(message),
+                headers={"Content-Type": "application/json"},
+                timeout=inner.timeout_seconds,
+            )
+            if status >= 300:
+                raise RuntimeError(f"telegram send failed with status={status}")
+            return
+        inner.send(message)
+
+
+class _Headers:
+    def __init__(self, values: dict[str, str]) -> None:
+        self._values = values
+
+    def get(self, name: str, default: str = "") -> str:
+        return self._values.get(name.lower(), default)
+
+
+class AsyncBotRuntime:
+    """
+    Runs trading ticks, Telegram command polling, notification delivery and the
+    control API as tasks on one asyncio event loop.
+
+    Pause, resume and stop wake the trading task through the bot's state listener,
+    so they apply immediately instead of after the current ``tick_seconds`` sleep.
+    Each tick runs in a worker thread, so a tick that blocks (a broker throttle
+    wait, a checkpoint fsync) never stalls the API or Telegram tasks. A stop waits
+    for the tick in flight, so its final checkpoint never lands mid-tick.
+    """
+
+    def __init__(
+        self,
+        *,
+        bot: SteppableBot,
+        host: str,
+        port: int,
+        notifications: AsyncNotifierBridge | None = None,
+        telegram_poller: TelegramCommandPoller | None = None,
+        api_token: str = "",
+        status_snapshots: StatusPublisher | None = None,
+        metrics: BotMetrics | None = None,
+        tracer: StageTracer | None = None,
+    ) -> None:
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self.notifications = notifications
+        self.telegram_poller = telegram_poller
+        self.status_snapshots = status_snapshots
+        self.metrics = metrics
+        telegram_commands: TelegramCommandsToggle | None = telegram_poller
+        self.router = ApiRouter(
+            bot,
+            telegram_commands=telegram_commands,
+            api_token=api_token,
+            status_snapshots=status_snapshots,
+            metrics=metrics,
+            tracer=tracer,
+        )
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._trading_task: asyncio.Task[None] | None = None
+        self._status_changed: asyncio.Event | None = None
+        self._unsubscribe_status: Callable[[], None] | None = None
+
+    @property
+    def server_address(self) -> tuple[str, int]:
+        if self._server is None or not self._server.sockets:
+            raise RuntimeError("runtime is not started")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return str(host), int(port)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self.bot.add_state_listener(self._on_state_change)
+        if self.notifications is not None:
+            self.notifications.bind(self._loop)
+        if self.status_snapshots is not None:
+            self._status_changed = asyncio.Event()
+            self._unsubscribe_status = self.status_snapshots.subscribe(self._on_snapshot)
+
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.bot.start(run_loop=False)
+
+        self._trading_task = asyncio.create_task(self._trading_loop(), name="trading-loop")
+        if self.notifications is not None:
+            self._tasks.append(
+                asyncio.create_task(self.notifications.deliver_forever(), name="notifications")
+            )
+        if self.telegram_poller is not None:
+            self._tasks.append(asyncio.create_task(self._telegram_loop(), name="telegram-commands"))
+
+    async def wait_stopped(self) -> None:
+        assert self._trading_task is not None
+        try:
+            await self._trading_task
+        finally:
+            await self._shutdown()
+
+    async def run(self) -> None:
+        await self.start()
+        await self.wait_stopped()
+
+    def _on_state_change(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(wake.set)
+
+    def _on_snapshot(self, snapshot: StatusSnapshot) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._wake_status_waiters)
+
+    def _wake_status_waiters(self) -> None:
+        # Swap in a fresh event so later waiters block until the next change.
+        changed, self._status_changed = self._status_changed, asyncio.Event()
+        if changed is not None:
+            changed.set()
+
+    async def _wait_for_status(self, poll: StatusPoll) -> None:
+        snapshots = self.status_snapshots
+        assert snapshots is not None
+        deadline = asyncio.get_running_loop().time() + poll.timeout
+        while snapshots.latest.version == poll.since and self._status_changed is not None:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                return
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._status_changed.wait(), timeout=remaining)
+
+    async def _trading_loop(self) -> None:
+        assert self._wake is not None
+        loop = asyncio.get_running_loop()
+        while not self.bot.stopped:
+            # Cleared before the tick so a wake-up (e.g. a live feed bar) during it is not lost.
+            self._wake.clear()
+            await asyncio.to_thread(self.bot.run_once)
+            wait_started = loop.time()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.bot.tick_seconds)
+            except asyncio.TimeoutError:
+                if self.metrics is not None:
+                    late = loop.time() - wait_started - self.bot.tick_seconds
+                    self.metrics.record_loop_drift(late)
+
+    async def _telegram_loop(self) -> None:
+        poller = self.telegram_poller
+        assert poller is not None
+        while True:
+            try:
+                _, body = await http_request(
+                    "GET",
+                    poller.updates_url(timeout=_TELEGRAM_LONG_POLL_SECONDS),
+                    timeout=_TELEGRAM_LONG_POLL_SECONDS + 10,
+                )
+                updates = poller.parse_updates(json.loads(body.decode("utf-8")))
+                for response in poller.handle_updates(updates):
+                    self._reply(poller, response)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Command polling failures should not break trading runtime.
+                pass
+            await asyncio.sleep(poller.poll_seconds)
+
+    def _reply(self, poller: TelegramCommandPoller, message: str) -> None:
+        if self.notifications is not None:
+            self.notifications.send(message)
+        else:
+            poller.notifier.send(message)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), _CLIENT_READ_TIMEOUT_SECONDS)
+            headers = await asyncio.wait_for(read_headers(reader), _CLIENT_READ_TIMEOUT_SECONDS)
+            length = int(headers.get("content-length", "0") or 0)
+            if length:
+                await asyncio.wait_for(reader.readexactly(length), _CLIENT_READ_TIMEOUT_SECONDS)
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2:
+                return
+            method, path = parts[0], parts[1]
+            poll = self.router.pending_long_poll(method, path, _Headers(headers))
+            if poll is not None:
+                await self._wait_for_status(poll)
+            response = self.router.handle(method, path, _Headers(headers), wait=False)
+            data = response.body()
+            head = [
+                f"HTTP/1.1 {response.code} {HTTPStatus(response.code).phrase}",
+                f"Content-Type: {response.content_type}",
+                f"Content-Length: {len(data)}",
+                "Connection: close",
+                *(f"{name}: {value}" for name, value in response.headers.items()),
+            ]
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + data)
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def _shutdown(self) -> None:
+        if self._unsubscribe_status is not None:
+            self._unsubscribe_status()
+            self._unsubscribe_status = None
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        if self.notifications is not None:
+            # Give queued messages (e.g. the stop notice) a bounded chance to go out.
+            await self.notifications.flush(_SHUTDOWN_FLUSH_SECONDS)
+
+        # Cancel until they finish: a cancel landing just as asyncio.wait_for's inner
+        # call completes is swallowed (Python < 3.12), which would leave a task running.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _SHUTDOWN_FLUSH_SECONDS
+        pending = set(self._tasks)
+        while pending and loop.time() < deadline:
+            for task in pending:
+                task.cancel()
+            _, pending = await asyncio.wait(pending, timeout=_SHUTDOWN_CANCEL_RETRY_SECONDS)
+        self._tasks.clear()
+
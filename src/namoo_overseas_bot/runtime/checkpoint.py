@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Protocol
+
+from namoo_overseas_bot.brokers.base import BrokerClient
+
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointError(RuntimeError):
+    pass
+
+
+class CheckpointableBot(Protocol):
+    broker: BrokerClient
+
+    def export_state(self) -> dict[str, Any]: ...
+
+    def restore_state(self, state: dict[str, Any]) -> None: ...
+
+    def sync_account(self) -> None: ...
+
+
+@dataclass
+class CheckpointStats:
+    path: str
+    saves: int
+    failures: int
+    last_saved_at_utc: str
+    last_save_seconds: float
+    last_error: str
+
+
+class CheckpointStore:
+    """
+    Atomic JSON checkpoints of a bot: cursor, counters, strategy state and broker.
+
+    ``save`` captures the state on the calling thread (the bots call it under their
+    tick lock, so the cut is consistent), writes it to a temp file, fsyncs and renames
+    it over ``path``; a crash leaves either the old or the new checkpoint, never a
+    mix. The bots check ``due`` after every tick, so at most one checkpoint is
+    written per ``interval_seconds``, plus a final one on stop.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if interval_seconds < 0:
+            raise ValueError("interval_seconds must be >= 0")
+        self.path = Path(path)
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_save_at: float | None = None
+
+        self._saves = 0
+        self._failures = 0
+        self._last_saved_at_utc = ""
+        self._last_save_seconds = 0.0
+        self._last_error = ""
+
+    def due(self) -> bool:
+        last = self._last_save_at
+        return last is None or self._clock() - last >= self.interval_seconds
+
+    def save(self, bot: CheckpointableBot) -> bool:
+        """Write a checkpoint; failures are recorded in ``stats`` instead of raised."""
+        started = time.perf_counter()
+        saved_at = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._last_save_at = self._clock()
+            try:
+                document = {
+                    "version": CHECKPOINT_VERSION,
+                    "saved_at_utc": saved_at,
+                    "bot": bot.export_state(),
+                    "broker": bot.broker.export_state(),
+                }
+                self._write(json.dumps(document).encode("utf-8"))
+            except Exception as exc:
+                self._failures += 1
+                self._last_error = str(exc)
+                return False
+            self._saves += 1
+            self._last_saved_at_utc = saved_at
+            self._last_save_seconds = time.perf_counter() - started
+            return True
+
+    def load(self) -> dict[str, Any] | None:
+        """The stored checkpoint, or None when there is none yet."""
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            document = json.loads(raw)
+        except ValueError as exc:
+            raise CheckpointError(f"corrupt checkpoint {self.path}: {exc}") from exc
+        if not isinstance(document, dict) or document.get("version") != CHECKPOINT_VERSION:
+            raise CheckpointError(f"unsupported checkpoint format in {self.path}")
+        return document
+
+    def restore(self, bot: CheckpointableBot) -> dict[str, Any] | None:
+        """Load the checkpoint into ``bot`` and its broker; returns it, or None if missing."""
+        document = self.load()
+        if document is None:
+            return None
+        try:
+            # The bot validates symbols, windows and candles before the broker is touched.
+            bot.restore_state(document["bot"])
+            if document["broker"] is not None:
+                bot.broker.restore_state(document["broker"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise CheckpointError(f"cannot resume from {self.path}: {exc}") from exc
+        bot.sync_account()
+        # Count the restored state as freshly saved.
+        self._last_save_at = self._clock()
+        return document
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return asdict(
+                CheckpointStats(
+                    path=str(self.path),
+                    saves=self._saves,
+                    failures=self._failures,
+                    last_saved_at_utc=self._last_saved_at_utc,
+                    last_save_seconds=self._last_save_seconds,
+                    last_error=self._last_error,
+                )
+            )
+
+    def _write(self, data: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp.open("wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        finally:
+            tmp.unlink(missing_ok=True)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    def now(self) -> float: ...
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """Wait until ``event`` is set or ``timeout`` clock seconds pass; True if it was set."""
+        ...
+
+
+class RealClock:
+    def now(self) -> float:
+        return time.monotonic()
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(timeout)
+
+
+REAL_CLOCK = RealClock()
+
+
+class VirtualClock:
+    """
+    Clock for replaying history faster than real time.
+
+    Waiting advances virtual time by the full timeout while taking only
+    ``timeout / speed`` real seconds; ``speed=None`` does not sleep at all. An
+    event set during a wait still ends it early, and virtual time then advances
+    only by the scaled real time that actually passed.
+    """
+
+    def __init__(self, *, speed: float | None = None, start: float = 0.0) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (or None for no sleeping)")
+        self.speed = speed
+        self._now = start
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds: float) -> None:
+        with self._lock:
+            self._now += seconds
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        if event.is_set():
+            return True
+        if self.speed is None:
+            self.advance(timeout)
+            return event.is_set()
+        started = time.monotonic()
+        woken = event.wait(timeout / self.speed)
+        self.advance(timeout if not woken else (time.monotonic() - started) * self.speed)
+        return woken
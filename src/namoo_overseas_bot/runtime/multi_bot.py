@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime, timezone
+import threading
+from time import perf_counter
+from typing import Any
+
+from namoo_overseas_bot.brokers.base import BrokerClient
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.metrics import BotMetrics
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.base import NotifierClient
+from namoo_overseas_bot.runtime.checkpoint import CheckpointStore
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.runtime.status_snapshot import StatusPublisher
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.tracing import StageTracer
+
+_SYMBOL_STATUS_KEYS = (
+    "trades",
+    "position_qty",
+    "last_price",
+    "last_signal",
+    "last_candle_timestamp",
+    "loop_count",
+)
+
+
+class MultiSymbolTradingBot:
+    """
+    Drives one ``PaperTradingBot`` per symbol from a single scheduler thread.
+
+    Every symbol keeps its own strategy state and candle cursor while orders go to
+    one shared ``BrokerClient``, so all symbols draw on the same cash balance.
+    """
+
+    def __init__(
+        self,
+        *,
+        broker: BrokerClient,
+        strategy_factory: Callable[[], SmaCrossStrategy],
+        notifier: NotifierClient,
+        candles_by_symbol: Mapping[str, Sequence[Candle] | CandleSeries],
+        quantity: int,
+        tick_seconds: float,
+        max_position_qty: int,
+        metrics: BotMetrics | None = None,
+        tracer: StageTracer | None = None,
+        checkpoint: CheckpointStore | None = None,
+    ) -> None:
+        if not candles_by_symbol:
+            raise ValueError("candles_by_symbol must not be empty")
+
+        self.broker = broker
+        self.notifier = notifier
+        self.quantity = quantity
+        self.tick_seconds = tick_seconds
+        self.metrics = metrics or BotMetrics()
+        self.checkpoint = checkpoint
+        self.bots: dict[str, PaperTradingBot] = {
+            symbol: PaperTradingBot(
+                broker=broker,
+                strategy=strategy_factory(),
+                notifier=notifier,
+                symbol=symbol,
+                quantity=quantity,
+                candles=candles,
+                tick_seconds=tick_seconds,
+                max_position_qty=max_position_qty,
+                metrics=self.metrics,
+                tracer=tracer,
+                begin_broker_tick=False,
+                publish_status=False,
+            )
+            for symbol, candles in candles_by_symbol.items()
+        }
+
+        self._lock = threading.Lock()
+        # Held for a whole tick and for the final checkpoint, so a stop from another thread
+        # never saves a half-done tick.
+        self._tick_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._paused = False
+        self._loop_count = 0
+        self._started_at_utc = ""
+        self._last_error = ""
+        self._errors: dict[str, str] = {symbol: "" for symbol in self.bots}
+        self._state_listeners: list[Callable[[], None]] = []
+        self._publish_lock = threading.Lock()
+        self.status_publisher = StatusPublisher()
+        self._publish_status()
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self.bots)
+
+    def start(self, *, run_loop: bool = True) -> None:
+        """Mark the bot running; ``run_loop=False`` leaves ticking to an external driver."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._running = True
+            self._paused = False
+            self._started_at_utc = datetime.now(timezone.utc).isoformat()
+            self._last_error = ""
+            if run_loop:
+                self._thread = threading.Thread(target=self._run_loop, name="multi-symbol-bot", daemon=True)
+                self._thread.start()
+
+        self._publish_status()
+        self._safe_notify(
+            f"[시작] 멀티 종목 페이퍼 봇 시작 | 종목={','.join(self.bots)}, "
+            f"수량={self.quantity}, 주기={self.tick_seconds}초"
+        )
+
+    def pause(self) -> None:
+        with self._lock:
+            self._paused = True
+        self._publish_status()
+        self._notify_state_listeners()
+        self._safe_notify(f"[일시정지] {','.join(self.bots)} 봇 일시정지")
+
+    def resume(self) -> None:
+        with self._lock:
+            self._paused = False
+        self._publish_status()
+        self._notify_state_listeners()
+        self._safe_notify(f"[재개] {','.join(self.bots)} 봇 재개")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        with self._lock:
+            self._running = False
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        with self._tick_lock:
+            self._save_checkpoint(force=True)
+        self._publish_status()
+        self._notify_state_listeners()
+        self._safe_notify(f"[중지] {','.join(self.bots)} 봇 중지")
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def add_state_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` (from any thread) after pause, resume and stop."""
+        self._state_listeners.append(listener)
+
+    def process_tick(self) -> None:
+        """Advance every symbol by one candle; one symbol failing does not skip the rest."""
+        # One account refresh for all symbols, which share the broker.
+        self.broker.begin_tick()
+        for symbol, bot in self.bots.items():
+            try:
+                bot.process_next_candle()
+                error = ""
+            except Exception as exc:
+                error = str(exc)
+                self.metrics.errors.labels(source="tick").inc()
+                self._safe_notify(f"[오류] {symbol} 런타임 예외: {exc}")
+            with self._lock:
+                self._errors[symbol] = error
+                if error:
+                    self._last_error = f"{symbol}: {error}"
+        with self._lock:
+            self._loop_count += 1
+        self._publish_status()
+
+    def status(self) -> dict[str, object]:
+        per_symbol: dict[str, dict[str, object]] = {}
+        trades = 0
+        market_value = 0.0
+        for symbol, bot in self.bots.items():
+            child = bot.status()
+            entry = {key: child[key] for key in _SYMBOL_STATUS_KEYS}
+            entry["market_value"] = float(child["position_qty"]) * float(child["last_price"])
+            per_symbol[symbol] = entry
+            trades += int(child["trades"])
+            market_value += entry["market_value"]
+
+        cash = self.broker.cash_balance()
+        with self._lock:
+            for symbol, entry in per_symbol.items():
+                entry["last_error"] = self._errors[symbol]
+            return {
+                "running": self._running,
+                "paused": self._paused,
+                "symbol": ",".join(self.bots),
+                "symbols": list(self.bots),
+                "trades": trades,
+                "cash": cash,
+                "market_value": market_value,
+                "equity": cash + market_value,
+                "loop_count": self._loop_count,
+                "started_at_utc": self._started_at_utc,
+                "last_error": self._last_error,
+                "per_symbol": per_symbol,
+            }
+
+    def export_state(self) -> dict[str, Any]:
+        with self._lock:
+            loop_count = self._loop_count
+        return {
+            "loop_count": loop_count,
+            "bots": {symbol: bot.export_state() for symbol, bot in self.bots.items()},
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Restore the symbols found in ``state``; symbols added since start fresh."""
+        restoring = {symbol: bot_state for symbol, bot_state in state["bots"].items() if symbol in self.bots}
+        loop_count = int(state["loop_count"])
+        # Check every symbol first, so one bad entry cannot leave the others half restored.
+        for symbol, bot_state in restoring.items():
+            self.bots[symbol].validate_state(bot_state)
+        for symbol, bot_state in restoring.items():
+            self.bots[symbol].restore_state(bot_state)
+        with self._lock:
+            self._loop_count = loop_count
+
+    def sync_account(self) -> None:
+        for bot in self.bots.values():
+            bot.sync_account()
+        self._publish_status()
+
+    def run_once(self) -> None:
+        """One scheduler iteration: advance every symbol unless paused."""
+        with self._tick_lock:
+            if not self._is_paused():
+                self.process_tick()
+                self._save_checkpoint()
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            self.run_once()
+            wait_started = perf_counter()
+            if not self._stop_event.wait(self.tick_seconds):
+                self.metrics.record_loop_drift(perf_counter() - wait_started - self.tick_seconds)
+
+    def _is_paused(self) -> bool:
+        with self._lock:
+            return self._paused
+
+    def _publish_status(self) -> None:
+        with self._publish_lock:
+            self.status_publisher.publish(self.status())
+
+    def _save_checkpoint(self, *, force: bool = False) -> None:
+        store = self.checkpoint
+        if store is None or not (force or store.due()):
+            return
+        if not store.save(self):
+            self.metrics.errors.labels(source="checkpoint").inc()
+
+    def _notify_state_listeners(self) -> None:
+        for listener in self._state_listeners:
+            listener()
+
+    def _safe_notify(self, message: str) -> None:
+        try:
+            self.notifier.send(message)
+        except Exception:
+            # Notifications should never crash trading runtime.
+            return
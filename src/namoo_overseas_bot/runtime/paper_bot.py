@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+import copy
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 import threading
-import time
+from time import perf_counter
+from typing import Any
 
 from namoo_overseas_bot.brokers.base import BrokerClient
-from namoo_overseas_bot.models import Candle, Order, Side, Signal
+from namoo_overseas_bot.market_data.feed import MarketDataFeed, ReplayFeed
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.metrics import BotMetrics
+from namoo_overseas_bot.models import Candle, Fill, Order, Side, Signal
 from namoo_overseas_bot.notifiers.base import NotifierClient
+from namoo_overseas_bot.runtime.checkpoint import CheckpointStore
+from namoo_overseas_bot.runtime.clock import REAL_CLOCK, Clock
+from namoo_overseas_bot.runtime.status_snapshot import StatusPublisher
 from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.tracing import NULL_SPAN, StageTracer
 
 
 @dataclass
@@ -37,12 +47,23 @@ class PaperTradingBot:
         notifier: NotifierClient,
         symbol: str,
         quantity: int,
-        candles: list[Candle],
+        candles: Sequence[Candle] | CandleSeries | None = None,
         tick_seconds: float,
         max_position_qty: int,
+        metrics: BotMetrics | None = None,
+        tracer: StageTracer | None = None,
+        checkpoint: CheckpointStore | None = None,
+        begin_broker_tick: bool = True,
+        publish_status: bool = True,
+        feed: MarketDataFeed | None = None,
+        clock: Clock | None = None,
     ) -> None:
-        if not candles:
+        if feed is None and not candles:
             raise ValueError("candles must not be empty")
+        if feed is not None and candles:
+            raise ValueError("pass either candles or feed, not both")
+        if feed is not None and feed.symbol != symbol:
+            raise ValueError(f"feed is for {feed.symbol}, not {symbol}")
         if quantity <= 0:
             raise ValueError("quantity must be positive")
         if tick_seconds <= 0:
@@ -56,8 +77,18 @@ class PaperTradingBot:
         self.symbol = symbol
         self.quantity = quantity
         self.candles = candles
+        self.feed = feed
         self.tick_seconds = tick_seconds
+        # A VirtualClock replays history faster than tick_seconds of wall time.
+        self.clock = clock or REAL_CLOCK
         self.max_position_qty = max_position_qty
+        self.metrics = metrics or BotMetrics()
+        self.tracer = tracer
+        self.checkpoint = checkpoint
+        # False when a parent bot sharing the broker starts the broker tick itself.
+        self.begin_broker_tick = begin_broker_tick
+        # False when a parent bot publishes the combined status instead.
+        self.publish_status = publish_status
 
         self._status = RuntimeStatus(
             running=False,
@@ -76,11 +107,22 @@ class PaperTradingBot:
         )
 
         self._lock = threading.Lock()
+        # Held for a whole tick and for the final checkpoint, so a stop from another thread
+        # (e.g. the API while the async runtime ticks in a worker) never saves a half-done tick.
+        self._tick_lock = threading.Lock()
         self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
         self._thread: threading.Thread | None = None
         self._cursor = 0
+        self._state_listeners: list[Callable[[], None]] = []
+        self._publish_lock = threading.Lock()
+        self.status_publisher = StatusPublisher()
+        self._publish_status()
+        if feed is not None:
+            feed.add_listener(self._on_bar_available)
 
-    def start(self) -> None:
+    def start(self, *, run_loop: bool = True) -> None:
+        """Mark the bot running; ``run_loop=False`` leaves ticking to an external driver."""
         with self._lock:
             if self._thread and self._thread.is_alive():
                 return
@@ -89,9 +131,11 @@ class PaperTradingBot:
             self._status.paused = False
             self._status.started_at_utc = datetime.now(timezone.utc).isoformat()
             self._status.last_error = ""
-            self._thread = threading.Thread(target=self._run_loop, name="paper-trading-bot", daemon=True)
-            self._thread.start()
+            if run_loop:
+                self._thread = threading.Thread(target=self._run_loop, name="paper-trading-bot", daemon=True)
+                self._thread.start()
 
+        self._publish_status()
         self._safe_notify(
             f"[시작] {self.symbol} 페이퍼 봇 시작 | 수량={self.quantity}, 주기={self.tick_seconds}초"
         )
@@ -99,37 +143,77 @@ class PaperTradingBot:
     def pause(self) -> None:
         with self._lock:
             self._status.paused = True
+        self._publish_status()
+        self._notify_state_listeners()
         self._safe_notify(f"[일시정지] {self.symbol} 봇 일시정지")
 
     def resume(self) -> None:
         with self._lock:
             self._status.paused = False
+        self._wake_event.set()
+        self._publish_status()
+        self._notify_state_listeners()
         self._safe_notify(f"[재개] {self.symbol} 봇 재개")
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wake_event.set()
         with self._lock:
             self._status.running = False
         thread = self._thread
-        if thread and thread.is_alive():
+        if thread and thread.is_alive() and thread is not threading.current_thread():
             thread.join(timeout=5)
+        with self._tick_lock:
+            self._save_checkpoint(force=True)
+        self._publish_status()
+        self._notify_state_listeners()
         self._safe_notify(f"[중지] {self.symbol} 봇 중지")
 
-    def process_next_candle(self) -> None:
-        candle = self.candles[self._cursor % len(self.candles)]
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def add_state_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` (from any thread) after pause, resume, stop and when a live feed has a bar."""
+        self._state_listeners.append(listener)
+
+    def process_next_candle(self) -> bool:
+        """Process one bar; ``False`` when the feed has none ready."""
+        tick_started = perf_counter()
+        span = self.tracer.span(self.symbol) if self.tracer is not None else NULL_SPAN
+        if self.feed is None:
+            assert self.candles is not None
+            candle = self.candles[self._cursor % len(self.candles)]
+        else:
+            next_bar = self.feed.poll()
+            if next_bar is None:
+                return False
+            candle = next_bar
+        metrics = self.metrics
         self._cursor += 1
+        if self.begin_broker_tick:
+            self.broker.begin_tick()
+        span.lap("fetch")
 
+        strategy_started = perf_counter()
         signal = self.strategy.on_price(candle.close)
+        metrics.strategy_seconds.observe(perf_counter() - strategy_started)
+        span.lap("strategy")
         fill_message = ""
+        if signal != Signal.HOLD:
+            metrics.signals.labels(symbol=self.symbol, signal=signal.value).inc()
 
         if signal == Signal.BUY:
             current_pos = self.broker.position_qty(self.symbol)
-            if current_pos + self.quantity <= self.max_position_qty:
-                fill = self.broker.submit_order(
+            allowed = current_pos + self.quantity <= self.max_position_qty
+            span.lap("risk")
+            if allowed:
+                fill = self._submit_order(
                     Order(symbol=self.symbol, side=Side.BUY, qty=self.quantity),
                     price=candle.close,
                     timestamp=candle.timestamp,
                 )
+                span.lap("broker")
                 fill_message = f"[체결] 매수 {fill.qty} {fill.symbol} @ {fill.price:.2f}"
                 with self._lock:
                     self._status.trades += 1
@@ -139,15 +223,19 @@ class PaperTradingBot:
                     f"current={current_pos}"
                 )
 
-        if signal == Signal.SELL and self.broker.position_qty(self.symbol) >= self.quantity:
-            fill = self.broker.submit_order(
-                Order(symbol=self.symbol, side=Side.SELL, qty=self.quantity),
-                price=candle.close,
-                timestamp=candle.timestamp,
-            )
-            fill_message = f"[체결] 매도 {fill.qty} {fill.symbol} @ {fill.price:.2f}"
-            with self._lock:
-                self._status.trades += 1
+        if signal == Signal.SELL:
+            allowed = self.broker.position_qty(self.symbol) >= self.quantity
+            span.lap("risk")
+            if allowed:
+                fill = self._submit_order(
+                    Order(symbol=self.symbol, side=Side.SELL, qty=self.quantity),
+                    price=candle.close,
+                    timestamp=candle.timestamp,
+                )
+                span.lap("broker")
+                fill_message = f"[체결] 매도 {fill.qty} {fill.symbol} @ {fill.price:.2f}"
+                with self._lock:
+                    self._status.trades += 1
 
         cash = self.broker.cash_balance()
         position_qty = self.broker.position_qty(self.symbol)
@@ -161,6 +249,8 @@ class PaperTradingBot:
             self._status.position_qty = position_qty
             self._status.equity = equity
             self._status.loop_count += 1
+        self._publish_status()
+        span.lap("state")
 
         if signal != Signal.HOLD:
             self._safe_notify(
@@ -169,34 +259,162 @@ class PaperTradingBot:
             )
         if fill_message:
             self._safe_notify(fill_message)
+        span.lap("notify")
+        span.finish(candle_timestamp=candle.timestamp, signal=signal.value)
+        metrics.tick_seconds.observe(perf_counter() - tick_started)
+        return True
 
     def status(self) -> dict[str, object]:
         with self._lock:
             return asdict(self._status)
 
-    def _run_loop(self) -> None:
-        while not self._stop_event.is_set():
+    def export_state(self) -> dict[str, Any]:
+        """Everything needed to continue trading where this bot left off, except the broker."""
+        with self._lock:
+            return {
+                "symbol": self.symbol,
+                "cursor": self._cursor,
+                "trades": self._status.trades,
+                "loop_count": self._status.loop_count,
+                "last_signal": self._status.last_signal,
+                "last_price": self._status.last_price,
+                "last_candle_timestamp": self._status.last_candle_timestamp,
+                "strategy": self.strategy.export_state(),
+            }
+
+    def validate_state(self, state: dict[str, Any]) -> None:
+        """Raise what ``restore_state`` would raise, without changing the bot."""
+        self._checked_state(state)
+        # A throwaway copy shows whether the strategy accepts its part.
+        copy.deepcopy(self.strategy).restore_state(state["strategy"])
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        cursor, status = self._checked_state(state)
+        self.strategy.restore_state(state["strategy"])
+        if isinstance(self.feed, ReplayFeed):
+            self.feed.cursor = cursor
+        with self._lock:
+            self._cursor = cursor
+            for name, value in status.items():
+                setattr(self._status, name, value)
+
+    def _checked_state(self, state: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        if state["symbol"] != self.symbol:
+            raise ValueError(f"state is for {state['symbol']}, not {self.symbol}")
+        cursor = int(state["cursor"])
+        status = {
+            "trades": int(state["trades"]),
+            "loop_count": int(state["loop_count"]),
+            "last_signal": str(state["last_signal"]),
+            "last_price": float(state["last_price"]),
+            "last_candle_timestamp": str(state["last_candle_timestamp"]),
+        }
+        candles = self.feed.candles if isinstance(self.feed, ReplayFeed) else self.candles
+        # Bars from a live or synthetic feed cannot be looked up again; only replayed candles are checked.
+        if cursor and candles is not None:
+            # The cursor only means something on the same candle series.
+            previous = candles[(cursor - 1) % len(candles)]
+            saved = (status["last_candle_timestamp"], status["last_price"])
+            if (previous.timestamp, previous.close) != saved:
+                raise ValueError(
+                    f"{self.symbol} candles changed: expected {saved} at position {cursor - 1}, "
+                    f"found {(previous.timestamp, previous.close)}"
+                )
+        return cursor, status
+
+    def sync_account(self) -> None:
+        """Refresh cash, position and equity from the broker (e.g. after a restore)."""
+        cash = self.broker.cash_balance()
+        position_qty = self.broker.position_qty(self.symbol)
+        with self._lock:
+            self._status.cash = cash
+            self._status.position_qty = position_qty
+            self._status.equity = cash + position_qty * self._status.last_price
+        self._publish_status()
+
+    def run_once(self) -> None:
+        """One scheduler iteration: process a candle unless paused, recording failures."""
+        with self._tick_lock:
+            if self._is_paused():
+                return
             try:
-                if self._is_paused():
-                    time.sleep(0.2)
-                    continue
-                self.process_next_candle()
+                if self.feed is not None and self.feed.live:
+                    # Drain everything that arrived since the last wake-up.
+                    while self.process_next_candle() and not (self._stop_event.is_set() or self._is_paused()):
+                        pass
+                else:
+                    self.process_next_candle()
             except Exception as exc:  # pragma: no cover - defensive runtime path
+                self.metrics.errors.labels(source="tick").inc()
                 with self._lock:
                     self._status.last_error = str(exc)
+                self._publish_status()
                 self._safe_notify(f"[오류] 런타임 예외: {exc}")
-            time.sleep(self.tick_seconds)
+            self._save_checkpoint()
+        if self.feed is not None and self.feed.exhausted and not self._stop_event.is_set():
+            with self._lock:
+                processed = self._status.loop_count
+            self._safe_notify(f"[완료] {self.symbol} 시세 데이터 끝 | 처리={processed}봉")
+            self.stop()
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            # Cleared before the tick so a bar arriving during it wakes the next wait.
+            self._wake_event.clear()
+            self.run_once()
+            if self._is_paused():
+                # Sleep for real until resume or stop; a virtual clock would otherwise spin through time.
+                self._wake_event.wait()
+                continue
+            # Resume, stop and live feed bars set the wake event so they apply without waiting out a tick.
+            wait_started = self.clock.now()
+            if not self.clock.wait(self._wake_event, self.tick_seconds):
+                self.metrics.record_loop_drift(self.clock.now() - wait_started - self.tick_seconds)
 
     def _is_paused(self) -> bool:
         with self._lock:
             return self._status.paused
 
+    def _publish_status(self) -> None:
+        if not self.publish_status:
+            return
+        # Serialize publishes so an older payload never replaces a newer one.
+        with self._publish_lock:
+            with self._lock:
+                # RuntimeStatus holds only scalars; a shallow copy avoids asdict's deepcopy.
+                payload = dict(vars(self._status))
+            self.status_publisher.publish(payload)
+
+    def _save_checkpoint(self, *, force: bool = False) -> None:
+        store = self.checkpoint
+        if store is None or not (force or store.due()):
+            return
+        if not store.save(self):
+            self.metrics.errors.labels(source="checkpoint").inc()
+
+    def _on_bar_available(self) -> None:
+        self._wake_event.set()
+        self._notify_state_listeners()
+
+    def _notify_state_listeners(self) -> None:
+        for listener in self._state_listeners:
+            listener()
+
+    def _submit_order(self, order: Order, *, price: float, timestamp: str) -> Fill:
+        started = perf_counter()
+        fill = self.broker.submit_order(order, price=price, timestamp=timestamp)
+        self.metrics.broker_seconds.observe(perf_counter() - started)
+        self.metrics.fills.labels(symbol=fill.symbol, side=fill.side.value).inc()
+        return fill
+
     def _safe_notify(self, message: str) -> None:
+        started = perf_counter()
         try:
             self.notifier.send(message)
         except Exception:
             # Notifications should never crash trading runtime.
-            return
+            self.metrics.errors.labels(source="notifier").inc()
+        self.metrics.notifier_seconds.observe(perf_counter() - started)
 
     @staticmethod
     def _signal_to_korean(signal: Signal) -> str:
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class ControllableBot(Protocol):
+    """What the control API and Telegram commands need from a runtime."""
+
+    def status(self) -> dict[str, object]: ...
+
+    def pause(self) -> None: ...
+
+    def resume(self) -> None: ...
+
+    def stop(self) -> None: ...
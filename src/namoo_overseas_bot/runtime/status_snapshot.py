@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import json
+import secrets
+import threading
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    version: int
+    body: bytes
+    etag: str
+
+
+class StatusPublisher:
+    """
+    Holds the latest immutable, pre-serialized status of a bot.
+
+    The trading side calls ``publish`` after it changes state; the JSON is encoded
+    once there and every reader gets the same bytes back from ``latest`` without
+    taking a lock. The version only moves when the payload actually changes, so
+    long-poll waiters are not woken by no-op ticks.
+    """
+
+    def __init__(self) -> None:
+        # Distinguishes ETags of different processes that reach the same version.
+        self._epoch = secrets.token_hex(4)
+        self._cond = threading.Condition()
+        self._payload: dict[str, object] | None = None
+        self._subscribers: list[Callable[[StatusSnapshot], None]] = []
+        self._latest = self._snapshot(0, {})
+
+    @property
+    def latest(self) -> StatusSnapshot:
+        return self._latest
+
+    def publish(self, payload: Mapping[str, object]) -> StatusSnapshot:
+        payload = dict(payload)
+        with self._cond:
+            if payload == self._payload:
+                return self._latest
+            self._payload = payload
+            snapshot = self._snapshot(self._latest.version + 1, payload)
+            self._latest = snapshot
+            self._cond.notify_all()
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(snapshot)
+        return snapshot
+
+    def wait_for_change(self, since: int, timeout: float) -> StatusSnapshot:
+        """Block until the version differs from ``since`` or ``timeout`` elapses."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._latest.version != since, timeout)
+            return self._latest
+
+    def subscribe(self, callback: Callable[[StatusSnapshot], None]) -> Callable[[], None]:
+        """Call ``callback`` (on the publishing thread) for every new snapshot."""
+        with self._cond:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._cond:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def _snapshot(self, version: int, payload: Mapping[str, object]) -> StatusSnapshot:
+        body = json.dumps({**payload, "version": version}).encode("utf-8")
+        return StatusSnapshot(version=version, body=body, etag=f'"{self._epoch}-{version}"')
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
 import urllib.parse
-import urllib.request
 
+from namoo_overseas_bot.http_pool import KeepAliveHttpClient
 from namoo_overseas_bot.notifiers.base import NotifierClient
-from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.runtime.protocols import ControllableBot
 
 
 class TelegramCommandHandler:
-    def __init__(self, *, bot: PaperTradingBot) -> None:
+    def __init__(self, *, bot: ControllableBot) -> None:
         self.bot = bot
 
     def handle(self, text: str) -> str:
@@ -22,6 +21,8 @@ class TelegramCommandHandler:
 
         if cmd == "/status":
             s = self.bot.status()
+            if "per_symbol" in s:
+                return self._multi_status_message(s)
             return (
                 f"[상태] {s['symbol']} | running={s['running']} paused={s['paused']}\n"
                 f"trades={s['trades']} position={s['position_qty']} cash={s['cash']:.2f} equity={s['equity']:.2f}\n"
@@ -42,6 +43,21 @@ class TelegramCommandHandler:
 
         return "[안내] 지원하지 않는 명령입니다. /help 또는 /명령어 를 입력하세요."
 
+    @staticmethod
+    def _multi_status_message(s: dict[str, object]) -> str:
+        lines = [
+            f"[상태] {s['symbol']} | running={s['running']} paused={s['paused']}",
+            f"trades={s['trades']} cash={s['cash']:.2f} equity={s['equity']:.2f}",
+        ]
+        per_symbol = s["per_symbol"]
+        assert isinstance(per_symbol, dict)
+        for symbol, entry in per_symbol.items():
+            lines.append(
+                f"- {symbol}: position={entry['position_qty']} last_signal={entry['last_signal']} "
+                f"price={entry['last_price']:.2f} ts={entry['last_candle_timestamp']}"
+            )
+        return "\n".join(lines)
+
     @staticmethod
     def _help_message() -> str:
         return (
@@ -65,6 +81,8 @@ class TelegramCommandPoller:
         handler: TelegramCommandHandler,
         poll_seconds: float = 1.0,
         commands_enabled: bool = True,
+        api_base_url: str = "https://api.telegram.org",
+        http_client: KeepAliveHttpClient | None = None,
     ) -> None:
         self.bot_token = bot_token
         self.allowed_chat_id = str(allowed_chat_id)
@@ -72,6 +90,8 @@ class TelegramCommandPoller:
         self.handler = handler
         self.poll_seconds = poll_seconds
         self._commands_enabled = commands_enabled
+        self.api_base_url = api_base_url.rstrip("/")
+        self.http_client = http_client or KeepAliveHttpClient(self.api_base_url)
 
         self._offset = 0
         self._enabled_lock = threading.Lock()
@@ -102,27 +122,8 @@ class TelegramCommandPoller:
         while not self._stop_event.is_set():
             try:
                 updates = self._get_updates(offset=self._offset, timeout=20)
-                for upd in updates:
-                    self._offset = int(upd.get("update_id", 0)) + 1
-                    message = upd.get("message") or upd.get("edited_message")
-                    if not isinstance(message, dict):
-                        continue
-
-                    chat = message.get("chat", {})
-                    chat_id = str(chat.get("id", ""))
-                    if self.allowed_chat_id and chat_id != self.allowed_chat_id:
-                        continue
-
-                    text = str(message.get("text", "")).strip()
-                    if not text.startswith("/"):
-                        continue
-
-                    if not self.is_commands_enabled():
-                        continue
-
-                    response = self.handler.handle(text)
-                    if response:
-                        self.notifier.send(response)
+                for response in self.handle_updates(updates):
+                    self.notifier.send(response)
 
             except Exception:
                 # Command polling failures should not break trading runtime.
@@ -131,16 +132,59 @@ class TelegramCommandPoller:
 
             time.sleep(self.poll_seconds)
 
-    def _get_updates(self, *, offset: int, timeout: int) -> list[dict[str, object]]:
-        query = urllib.parse.urlencode({"offset": offset, "timeout": timeout})
-        url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates?{query}"
+    def handle_updates(self, updates: list[dict[str, object]]) -> list[str]:
+        """Advance the update offset and return replies for accepted commands."""
+        responses: list[str] = []
+        for upd in updates:
+            self._offset = int(upd.get("update_id", 0)) + 1
+            message = upd.get("message") or upd.get("edited_message")
+            if not isinstance(message, dict):
+                continue
 
-        with urllib.request.urlopen(url, timeout=timeout + 10) as response:
-            payload = json.loads(response.read().decode("utf-8"))
+            chat = message.get("chat", {})
+            chat_id = str(chat.get("id", ""))
+            if self.allowed_chat_id and chat_id != self.allowed_chat_id:
+                continue
+
+            text = str(message.get("text", "")).strip()
+            if not text.startswith("/"):
+                continue
 
+            if not self.is_commands_enabled():
+                continue
+
+            response = self.handler.handle(text)
+            if response:
+                responses.append(response)
+        return responses
+
+    def updates_path(self, *, offset: int | None = None, timeout: int) -> str:
+        query = urllib.parse.urlencode(
+            {"offset": self._offset if offset is None else offset, "timeout": timeout}
+        )
+        return f"/bot{self.bot_token}/getUpdates?{query}"
+
+    def updates_url(self, *, offset: int | None = None, timeout: int) -> str:
+        return f"{self.api_base_url}{self.updates_path(offset=offset, timeout=timeout)}"
+
+    @staticmethod
+    def parse_updates(payload: dict[str, object]) -> list[dict[str, object]]:
         if not payload.get("ok"):
             return []
         results = payload.get("result", [])
         if not isinstance(results, list):
             return []
         return [r for r in results if isinstance(r, dict)]
+
+    def _get_updates(self, *, offset: int, timeout: int) -> list[dict[str, object]]:
+        response = self.http_client.request(
+            "GET",
+            self.updates_path(offset=offset, timeout=timeout),
+            timeout=timeout + 10,
+        )
+        if response.status >= 300:
+            raise RuntimeError(f"telegram getUpdates failed with status={response.status}")
+        payload = response.json()
+        if not isinstance(payload, dict):
+            return []
+        return self.parse_updates(payload)
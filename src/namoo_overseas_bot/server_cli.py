@@ -1,32 +1,123 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
+import threading
 
+from namoo_overseas_bot.brokers.base import BrokerClient
+from namoo_overseas_bot.brokers.cached import CachedAccountBroker
+from namoo_overseas_bot.brokers.journal import FillJournal
 from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.brokers.throttle import ORDER, QUERY, ThrottledBroker
 from namoo_overseas_bot.config import BotConfig
-from namoo_overseas_bot.market_data.csv_feed import load_candles
-from namoo_overseas_bot.notifiers import NoOpNotifier, NotifierClient, TelegramNotifier
+from namoo_overseas_bot.http_pool import KeepAliveHttpClient
+from namoo_overseas_bot.market_data.cache import load_cached_candle_series
+from namoo_overseas_bot.market_data.csv_feed import load_candle_series
+from namoo_overseas_bot.market_data.feed import (
+    HttpFeedServer,
+    MarketDataFeed,
+    QueueFeed,
+    ReplayFeed,
+    SyntheticFeed,
+)
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.metrics import BotMetrics
+from namoo_overseas_bot.notifiers import (
+    NoOpNotifier,
+    NotifierClient,
+    QueuedNotifier,
+    TelegramNotifier,
+)
 from namoo_overseas_bot.runtime import (
+    AsyncBotRuntime,
+    AsyncNotifierBridge,
     BotApiServer,
+    CheckpointStore,
+    MultiSymbolTradingBot,
     PaperTradingBot,
     TelegramCommandHandler,
     TelegramCommandPoller,
+    VirtualClock,
 )
 from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.tracing import StageTracer
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Namoo overseas stock bot server (paper + telegram + control API)"
     )
-    parser.add_argument("--csv", default="data/sample_us_stock.csv", help="OHLCV CSV path")
+    parser.add_argument(
+        "--csv",
+        default="data/sample_us_stock.csv",
+        help='OHLCV CSV path; may contain "{symbol}" for per-symbol files',
+    )
     parser.add_argument("--symbol", default=None, help="ticker symbol")
+    parser.add_argument(
+        "--symbols",
+        default=None,
+        help="comma separated tickers to trade in one runtime (overrides --symbol)",
+    )
     parser.add_argument("--host", default=None, help="server host")
     parser.add_argument("--port", type=int, default=None, help="server port")
+    parser.add_argument(
+        "--runtime",
+        choices=["thread", "async"],
+        default=None,
+        help="thread: one thread per component; async: one asyncio event loop (default: BOT_RUNTIME_MODE)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always parse the CSV instead of using its binary sidecar cache",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="record per-tick stage timings and serve them at GET /debug/trace (default: BOT_TRACE_ENABLED)",
+    )
+    parser.add_argument(
+        "--journal",
+        default=None,
+        help="paper fill journal path; paper cash/positions are restored from it (default: BOT_JOURNAL_PATH)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="runtime checkpoint path, saved periodically and on stop (default: BOT_CHECKPOINT_PATH)",
+    )
+    parser.add_argument(
+        "--feed",
+        choices=["replay", "synthetic", "http"],
+        default="replay",
+        help="replay: loop over --csv; synthetic: endless random walk; "
+        "http: trade bars POSTed to a local /candles endpoint as soon as they arrive",
+    )
+    parser.add_argument(
+        "--feed-port",
+        type=int,
+        default=0,
+        help="port for --feed http (default: any free port)",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=None,
+        help="play --csv once on a virtual clock at N times real speed (0: as fast as possible), "
+        "then print the final status and exit; thread runtime, single symbol",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue from the checkpoint (cursor, strategy, counters, account) instead of starting over",
+    )
     return parser
 
 
-def _build_notifier(config: BotConfig) -> NotifierClient:
+def _build_notifier(
+    config: BotConfig, http_client: KeepAliveHttpClient | None = None
+) -> NotifierClient:
     if not config.telegram_enabled:
         return NoOpNotifier()
 
@@ -37,48 +128,211 @@ def _build_notifier(config: BotConfig) -> NotifierClient:
     return TelegramNotifier(
         bot_token=config.telegram_bot_token,
         chat_id=config.telegram_chat_id,
+        http_client=http_client,
+    )
+
+
+def _throttle(broker: BrokerClient, config: BotConfig, metrics: BotMetrics) -> BrokerClient:
+    rates = (
+        config.broker_orders_per_second,
+        config.broker_queries_per_second,
+        config.broker_requests_per_second,
     )
+    if not any(rate > 0 for rate in rates):
+        return broker
+    throttled = ThrottledBroker(
+        broker,
+        orders_per_second=rates[0] or None,
+        queries_per_second=rates[1] or None,
+        requests_per_second=rates[2] or None,
+        wait_histogram=metrics.throttle_wait_seconds,
+    )
+    for kind, name in ((ORDER, "orders"), (QUERY, "queries")):
+        metrics.registry.gauge(
+            f"namoo_broker_throttle_waiting_{name}",
+            f"Broker {kind} calls waiting for a rate-limit token.",
+            lambda kind=kind: throttled.queue_depth(kind),
+        )
+    return throttled
+
+
+def _load_candles(args: argparse.Namespace, symbol: str) -> CandleSeries:
+    csv_path = args.csv.replace("{symbol}", symbol)
+    if args.no_cache:
+        return load_candle_series(csv_path, symbol=symbol)
+    return load_cached_candle_series(csv_path, symbol=symbol)
 
 
 def main() -> None:
     args = build_parser().parse_args()
     config = BotConfig.from_env()
 
-    symbol = args.symbol or config.symbol
+    if args.symbols:
+        symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    elif args.symbol:
+        symbols = [args.symbol]
+    else:
+        symbols = list(config.symbols) or [config.symbol]
+    symbol = ",".join(symbols)
     host = args.host or config.server_host
     port = args.port or config.server_port
+    runtime_mode = args.runtime or config.runtime_mode
+    if runtime_mode not in {"thread", "async"}:
+        raise ValueError(f"unsupported runtime mode: {runtime_mode}")
 
-    candles = load_candles(args.csv, symbol=symbol)
-    strategy = SmaCrossStrategy(
-        short_window=config.short_window,
-        long_window=config.long_window,
+    journal_path = args.journal or config.journal_path
+    journal = (
+        FillJournal(journal_path, compact_every=config.journal_compact_every)
+        if journal_path
+        else None
     )
-    broker = PaperBroker(initial_cash_usd=config.initial_cash_usd)
-    notifier = _build_notifier(config)
-
-    bot = PaperTradingBot(
-        broker=broker,
-        strategy=strategy,
-        notifier=notifier,
-        symbol=symbol,
-        quantity=config.quantity,
-        candles=candles,
-        tick_seconds=config.tick_seconds,
-        max_position_qty=config.max_position_qty,
+    paper_broker = PaperBroker(initial_cash_usd=config.initial_cash_usd, journal=journal)
+    checkpoint_path = args.checkpoint or config.checkpoint_path
+    if args.resume and not checkpoint_path:
+        raise ValueError("--resume needs --checkpoint or BOT_CHECKPOINT_PATH")
+    checkpoint = (
+        CheckpointStore(checkpoint_path, interval_seconds=config.checkpoint_seconds)
+        if checkpoint_path
+        else None
+    )
+    metrics = BotMetrics()
+    broker = _throttle(paper_broker, config, metrics)
+    if config.broker_account_cache:
+        # Outermost, so cached reads never wait for a throttle token.
+        broker = CachedAccountBroker(broker)
+    tracer = (
+        StageTracer(capacity=config.trace_capacity)
+        if args.trace or config.trace_enabled
+        else None
     )
+    # Alerts and command polling share keep-alive connections to the Bot API.
+    telegram_http = (
+        KeepAliveHttpClient("https://api.telegram.org") if config.telegram_enabled else None
+    )
+    notifier = _build_notifier(config, telegram_http)
+    bridge: AsyncNotifierBridge | None = None
+    queued: QueuedNotifier | None = None
+    if runtime_mode == "async":
+        bridge = AsyncNotifierBridge(notifier)
+    elif config.telegram_enabled:
+        # Keep Bot API round trips off the trading and command threads.
+        queued = QueuedNotifier(
+            notifier,
+            max_queue_size=config.notify_queue_size,
+            min_interval_seconds=config.notify_min_interval_seconds,
+        )
+        queued.start()
+        metrics.registry.gauge(
+            "namoo_notifier_queue_depth",
+            "Messages waiting in the notification queue.",
+            queued.queue_depth,
+        )
+    bot_notifier: NotifierClient = bridge or queued or notifier
 
-    bot.start()
-    command_poller: TelegramCommandPoller | None = None
+    def strategy_factory() -> SmaCrossStrategy:
+        return SmaCrossStrategy(
+            short_window=config.short_window,
+            long_window=config.long_window,
+        )
+
+    if args.feed != "replay" and len(symbols) != 1:
+        raise ValueError("--feed synthetic/http supports a single symbol")
+    clock: VirtualClock | None = None
+    if args.replay_speed is not None:
+        if args.feed != "replay" or len(symbols) != 1 or runtime_mode != "thread":
+            raise ValueError("--replay-speed needs --feed replay, a single symbol and --runtime thread")
+        if args.replay_speed < 0:
+            raise ValueError("--replay-speed must be >= 0")
+        clock = VirtualClock(speed=args.replay_speed or None)
+    feed: MarketDataFeed | None = None
+    feed_server: HttpFeedServer | None = None
+    if clock is not None:
+        # Play the file once; the bot stops itself after the last bar.
+        feed = ReplayFeed(_load_candles(args, symbol), loop=False)
+    elif args.feed == "synthetic":
+        feed = SyntheticFeed(symbol)
+    elif args.feed == "http":
+        queue_feed = QueueFeed(symbol)
+        feed_server = HttpFeedServer(
+            queue_feed, host=host, port=args.feed_port, api_token=config.api_token
+        ).start()
+        feed = queue_feed
+
+    bot: PaperTradingBot | MultiSymbolTradingBot
+    if len(symbols) == 1:
+        bot = PaperTradingBot(
+            broker=broker,
+            strategy=strategy_factory(),
+            notifier=bot_notifier,
+            symbol=symbol,
+            quantity=config.quantity,
+            candles=_load_candles(args, symbol) if feed is None else None,
+            feed=feed,
+            tick_seconds=config.tick_seconds,
+            max_position_qty=config.max_position_qty,
+            metrics=metrics,
+            tracer=tracer,
+            checkpoint=checkpoint,
+            clock=clock,
+        )
+    else:
+        bot = MultiSymbolTradingBot(
+            broker=broker,
+            strategy_factory=strategy_factory,
+            notifier=bot_notifier,
+            candles_by_symbol={s: _load_candles(args, s) for s in symbols},
+            quantity=config.quantity,
+            tick_seconds=config.tick_seconds,
+            max_position_qty=config.max_position_qty,
+            metrics=metrics,
+            tracer=tracer,
+            checkpoint=checkpoint,
+        )
 
+    if checkpoint and args.resume:
+        restored = checkpoint.restore(bot)
+        if restored is None:
+            print(f"no checkpoint at {checkpoint.path}; starting fresh")
+        else:
+            print(f"resumed from checkpoint saved at {restored['saved_at_utc']}")
+
+    command_poller: TelegramCommandPoller | None = None
     if config.telegram_enabled:
         command_poller = TelegramCommandPoller(
             bot_token=config.telegram_bot_token,
             allowed_chat_id=config.telegram_chat_id,
-            notifier=notifier,
+            notifier=bot_notifier,
             handler=TelegramCommandHandler(bot=bot),
             poll_seconds=config.telegram_poll_seconds,
             commands_enabled=config.telegram_commands_enabled,
+            http_client=telegram_http,
         )
+
+    if runtime_mode == "async":
+        try:
+            asyncio.run(
+                _serve_async(
+                    bot=bot,
+                    host=host,
+                    port=port,
+                    notifications=bridge,
+                    command_poller=command_poller,
+                    api_token=config.api_token,
+                    symbol=symbol,
+                    metrics=metrics,
+                    tracer=tracer,
+                    feed_url=feed_server.base_url if feed_server else "",
+                )
+            )
+        finally:
+            if feed_server:
+                feed_server.close()
+            if journal:
+                journal.close()
+        return
+
+    bot.start()
+    if command_poller:
         command_poller.start()
 
     server = BotApiServer(
@@ -87,13 +341,99 @@ def main() -> None:
         port=port,
         telegram_commands=command_poller,
         api_token=config.api_token,
+        notifier_stats=queued,
+        status_snapshots=bot.status_publisher,
+        metrics=metrics,
+        tracer=tracer,
     )
 
     bound_host, bound_port = server.server_address
+    _print_banner(
+        symbol,
+        bound_host,
+        bound_port,
+        command_poller,
+        runtime_mode,
+        feed_url=feed_server.base_url if feed_server else "",
+        replay_speed=args.replay_speed,
+    )
+
+    if clock is not None:
+        # A replay ends when the data does; take the API server down with the bot.
+        def shutdown_when_stopped() -> None:
+            if bot.stopped:
+                threading.Thread(target=server.shutdown, daemon=True).start()
+
+        bot.add_state_listener(shutdown_when_stopped)
+        shutdown_when_stopped()
+
+    try:
+        server.serve_forever()
+        if clock is not None:
+            print(json.dumps(bot.status(), ensure_ascii=False))
+    finally:
+        if feed_server:
+            feed_server.close()
+        if command_poller:
+            command_poller.stop()
+        if queued:
+            queued.stop()
+        if journal:
+            journal.close()
+
+
+async def _serve_async(
+    *,
+    bot: PaperTradingBot | MultiSymbolTradingBot,
+    host: str,
+    port: int,
+    notifications: AsyncNotifierBridge | None,
+    command_poller: TelegramCommandPoller | None,
+    api_token: str,
+    symbol: str,
+    metrics: BotMetrics,
+    tracer: StageTracer | None,
+    feed_url: str = "",
+) -> None:
+    runtime = AsyncBotRuntime(
+        bot=bot,
+        host=host,
+        port=port,
+        notifications=notifications,
+        telegram_poller=command_poller,
+        api_token=api_token,
+        status_snapshots=bot.status_publisher,
+        metrics=metrics,
+        tracer=tracer,
+    )
+    await runtime.start()
+    bound_host, bound_port = runtime.server_address
+    _print_banner(symbol, bound_host, bound_port, command_poller, "async", feed_url=feed_url)
+    await runtime.wait_stopped()
+
+
+def _print_banner(
+    symbol: str,
+    host: str,
+    port: int,
+    command_poller: TelegramCommandPoller | None,
+    runtime_mode: str,
+    *,
+    feed_url: str = "",
+    replay_speed: float | None = None,
+) -> None:
     print("=== Namoo Overseas Bot Server (Paper) ===")
     print(f"symbol: {symbol}")
-    print(f"api: http://{bound_host}:{bound_port}")
-    print("endpoints: GET /health, GET /status, POST /pause, POST /resume, POST /stop")
+    print(f"runtime: {runtime_mode}")
+    print(f"api: http://{host}:{port}")
+    if feed_url:
+        print(f"feed: POST {feed_url}/candles")
+    if replay_speed is not None:
+        print(f"replay: {f'{replay_speed:g}x' if replay_speed else 'max speed'} (virtual clock)")
+    print(
+        "endpoints: GET /health, GET /status, GET /metrics, GET /notifier, GET /debug/trace, "
+        "POST /pause, POST /resume, POST /stop"
+    )
     print(
         "telegram command control: GET /telegram-commands, "
         "POST /telegram-commands/enable, POST /telegram-commands/disable"
@@ -104,12 +444,6 @@ def main() -> None:
             f"(enabled={command_poller.is_commands_enabled()})"
         )
 
-    try:
-        server.serve_forever()
-    finally:
-        if command_poller:
-            command_poller.stop()
-
 
 if __name__ == "__main__":
     main()
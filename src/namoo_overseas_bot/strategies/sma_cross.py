@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from collections import deque
+from typing import Any
 
+from namoo_overseas_bot.indicators.moving_average import SimpleMovingAverage
 from namoo_overseas_bot.models import Signal
 
+# SMAs closer than this (relative to the long SMA) are treated as equal, so exact
+# ties in the prices never turn into signals through float rounding noise.
+_TIE_TOLERANCE = 1e-9
+
 
 class SmaCrossStrategy:
     def __init__(self, short_window: int, long_window: int) -> None:
@@ -14,22 +19,40 @@ class SmaCrossStrategy:
 
         self.short_window = short_window
         self.long_window = long_window
-        self._prices = deque(maxlen=long_window)
+        self._short_sma = SimpleMovingAverage(short_window)
+        self._long_sma = SimpleMovingAverage(long_window)
         self._last_signal = Signal.HOLD
 
     def on_price(self, price: float) -> Signal:
-        self._prices.append(price)
-        if len(self._prices) < self.long_window:
+        short_sma = self._short_sma.update(price)
+        long_sma = self._long_sma.update(price)
+        if short_sma is None or long_sma is None:
             return Signal.HOLD
 
-        prices = list(self._prices)
-        short_sma = sum(prices[-self.short_window :]) / self.short_window
-        long_sma = sum(prices) / self.long_window
-
-        if short_sma > long_sma and self._last_signal != Signal.BUY:
+        spread = short_sma - long_sma
+        tolerance = _TIE_TOLERANCE * abs(long_sma)
+        if spread > tolerance and self._last_signal != Signal.BUY:
             self._last_signal = Signal.BUY
             return Signal.BUY
-        if short_sma < long_sma and self._last_signal != Signal.SELL:
+        if spread < -tolerance and self._last_signal != Signal.SELL:
             self._last_signal = Signal.SELL
             return Signal.SELL
         return Signal.HOLD
+
+    def export_state(self) -> dict[str, Any]:
+        return {
+            "last_signal": self._last_signal.value,
+            "short_sma": self._short_sma.export_state(),
+            "long_sma": self._long_sma.export_state(),
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Continue from exported state; raises ValueError if the windows differ."""
+        windows = (state["short_sma"]["window"], state["long_sma"]["window"])
+        if windows != (self.short_window, self.long_window):
+            raise ValueError(
+                f"state is for windows {windows}, not {(self.short_window, self.long_window)}"
+            )
+        self._short_sma.restore_state(state["short_sma"])
+        self._long_sma.restore_state(state["long_sma"])
+        self._last_signal = Signal(state["last_signal"])
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import csv
+from dataclasses import asdict, dataclass, fields
+from itertools import product
+import os
+from pathlib import Path
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import EngineResult, TradingEngine
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.market_data.shared import SharedCandleSeries, SharedSeriesHandle, attach_series
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.vectorized import VectorizedSmaBacktest, closes_array, np
+
+
+@dataclass(frozen=True)
+class SweepParams:
+    short_window: int
+    long_window: int
+    quantity: int
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    short_window: int
+    long_window: int
+    quantity: int
+    trades: int
+    cash: float
+    position_qty: int
+    equity: float
+    return_pct: float
+    error: str = ""
+
+
+def parse_grid(spec: str) -> list[int]:
+    """Parse ``"3,5,8"`` or an inclusive ``"start:stop[:step]"`` range."""
+    spec = spec.strip()
+    if ":" in spec:
+        parts = [int(p) for p in spec.split(":")]
+        if len(parts) not in {2, 3}:
+            raise ValueError(f"invalid range: {spec!r}")
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) == 3 else 1
+        if step <= 0:
+            raise ValueError(f"range step must be positive: {spec!r}")
+        return list(range(start, stop + 1, step))
+    return [int(p) for p in spec.split(",") if p.strip()]
+
+
+def build_grid(
+    short_windows: Iterable[int],
+    long_windows: Iterable[int],
+    quantities: Iterable[int],
+) -> list[SweepParams]:
+    return [
+        SweepParams(short_window=s, long_window=l, quantity=q)
+        for s, l, q in product(short_windows, long_windows, quantities)
+        if 0 < s < l and q > 0
+    ]
+
+
+# Per-process series (a copy, or a view of the shared-memory block), set once by
+# the pool initializer so tasks only carry their parameter chunk.
+_worker_candles: Sequence[Candle] | CandleSeries = ()
+_worker_closes = None
+_worker_symbol = ""
+_worker_cash = 0.0
+_worker_vectorized = False
+
+
+def _init_worker(
+    candles: Sequence[Candle] | CandleSeries | SharedSeriesHandle,
+    symbol: str,
+    initial_cash_usd: float,
+    vectorized: bool,
+) -> None:
+    global _worker_candles, _worker_closes, _worker_symbol, _worker_cash, _worker_vectorized
+    _worker_candles = attach_series(candles) if isinstance(candles, SharedSeriesHandle) else candles
+    _worker_symbol = symbol
+    _worker_cash = initial_cash_usd
+    _worker_vectorized = vectorized
+    if vectorized:
+        _worker_closes = closes_array(_worker_candles)
+
+
+def _run_one(params: SweepParams) -> SweepResult:
+    try:
+        if _worker_vectorized:
+            result = VectorizedSmaBacktest(
+                short_window=params.short_window,
+                long_window=params.long_window,
+                quantity=params.quantity,
+                initial_cash_usd=_worker_cash,
+            ).run_closes(_worker_closes)
+        else:
+            result = TradingEngine(
+                broker=PaperBroker(initial_cash_usd=_worker_cash),
+                strategy=SmaCrossStrategy(
+                    short_window=params.short_window,
+                    long_window=params.long_window,
+                ),
+                symbol=_worker_symbol,
+                quantity=params.quantity,
+            ).run(_worker_candles)
+    except ValueError as exc:
+        return SweepResult(
+            short_window=params.short_window,
+            long_window=params.long_window,
+            quantity=params.quantity,
+            trades=0,
+            cash=0.0,
+            position_qty=0,
+            equity=0.0,
+            return_pct=0.0,
+            error=str(exc),
+        )
+    return _to_sweep_result(params, result, _worker_cash)
+
+
+def _run_chunk(chunk: list[SweepParams]) -> list[SweepResult]:
+    return [_run_one(params) for params in chunk]
+
+
+def _to_sweep_result(params: SweepParams, result: EngineResult, initial_cash_usd: float) -> SweepResult:
+    return SweepResult(
+        short_window=params.short_window,
+        long_window=params.long_window,
+        quantity=params.quantity,
+        trades=result.trades,
+        cash=result.cash,
+        position_qty=result.position_qty,
+        equity=result.equity,
+        return_pct=(result.equity / initial_cash_usd - 1.0) * 100.0 if initial_cash_usd else 0.0,
+    )
+
+
+def run_sweep(
+    candles: Sequence[Candle] | CandleSeries,
+    grid: Sequence[SweepParams],
+    *,
+    symbol: str,
+    initial_cash_usd: float,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    vectorized: bool | None = None,
+    shared_memory: bool = True,
+) -> list[SweepResult]:
+    """
+    Backtest every grid point and return results ranked by final equity.
+
+    With ``shared_memory`` a ``CandleSeries`` is published once to shared memory
+    and every worker attaches to it, instead of each receiving a pickled copy.
+    """
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized and np is None:
+        raise RuntimeError("vectorized sweep requires numpy: pip install 'namoo-overseas-bot[fast]'")
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # A few chunks per worker keeps the pool balanced without per-task overhead.
+        chunksize = max(1, len(grid) // (workers * 4))
+    chunks = [list(grid[i : i + chunksize]) for i in range(0, len(grid), chunksize)]
+
+    results: list[SweepResult] = []
+    if workers == 1:
+        _init_worker(candles, symbol, initial_cash_usd, vectorized)
+        for chunk in chunks:
+            results.extend(_run_chunk(chunk))
+        return rank_results(results)
+
+    with contextlib.ExitStack() as stack:
+        source: Sequence[Candle] | CandleSeries | SharedSeriesHandle = candles
+        if shared_memory and isinstance(candles, CandleSeries):
+            # Unlinked only after the pool (and so every attached worker) has exited.
+            source = stack.enter_context(SharedCandleSeries(candles)).handle
+        executor = stack.enter_context(
+            ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(source, symbol, initial_cash_usd, vectorized),
+            )
+        )
+        for chunk_results in executor.map(_run_chunk, chunks):
+            results.extend(chunk_results)
+
+    return rank_results(results)
+
+
+def rank_results(results: Iterable[SweepResult]) -> list[SweepResult]:
+    return sorted(
+        results,
+        key=lambda r: (r.error != "", -r.equity, r.short_window, r.long_window, r.quantity),
+    )
+
+
+def write_results_csv(results: Sequence[SweepResult], path: str | Path) -> None:
+    with Path(path).open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["rank", *[field.name for field in fields(SweepResult)]])
+        writer.writeheader()
+        for rank, result in enumerate(results, start=1):
+            writer.writerow({"rank": rank, **asdict(result)})
+
+
+def format_table(results: Sequence[SweepResult], *, limit: int) -> str:
+    lines = [f"{'rank':>4} {'short':>5} {'long':>5} {'qty':>4} {'trades':>6} {'equity':>12} {'return%':>8}"]
+    for rank, r in enumerate(results[:limit], start=1):
+        if r.error:
+            lines.append(f"{rank:>4} {r.short_window:>5} {r.long_window:>5} {r.quantity:>4} error: {r.error}")
+            continue
+        lines.append(
+            f"{rank:>4} {r.short_window:>5} {r.long_window:>5} {r.quantity:>4} "
+            f"{r.trades:>6} {r.equity:>12.2f} {r.return_pct:>8.2f}"
+        )
+    return "\n".join(lines)
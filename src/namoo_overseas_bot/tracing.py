@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+import itertools
+import math
+import threading
+import time
+from time import perf_counter
+
+# Stage names used by the bot and the engine, in tick order.
+STAGES = ("fetch", "strategy", "risk", "broker", "state", "notify")
+
+
+@dataclass(frozen=True)
+class TickTrace:
+    seq: int
+    symbol: str
+    candle_timestamp: str
+    signal: str
+    wall_time: float
+    total_seconds: float
+    stages: dict[str, float]
+
+
+class TraceSpan:
+    """Times one tick; each ``lap`` charges the time since the previous lap to a stage."""
+
+    __slots__ = ("_last", "_started", "_tracer", "stages", "symbol")
+
+    def __init__(self, tracer: StageTracer, symbol: str) -> None:
+        self._tracer = tracer
+        self.symbol = symbol
+        self.stages: dict[str, float] = {}
+        self._started = self._last = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def finish(self, *, candle_timestamp: str, signal: str) -> None:
+        self._tracer.record(
+            symbol=self.symbol,
+            candle_timestamp=candle_timestamp,
+            signal=signal,
+            total_seconds=self._last - self._started,
+            stages=self.stages,
+        )
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def lap(self, stage: str) -> None:
+        return
+
+    def finish(self, *, candle_timestamp: str, signal: str) -> None:
+        return
+
+
+# Handed out when tracing is off so the hot path needs no branches.
+NULL_SPAN = _NullSpan()
+
+
+class StageTracer:
+    """Keeps the last ``capacity`` tick traces in a ring buffer."""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._ring: deque[TickTrace] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+
+    def span(self, symbol: str) -> TraceSpan:
+        return TraceSpan(self, symbol)
+
+    def record(
+        self,
+        *,
+        symbol: str,
+        candle_timestamp: str,
+        signal: str,
+        total_seconds: float,
+        stages: dict[str, float],
+    ) -> None:
+        wall_time = time.time()
+        with self._lock:
+            self._ring.append(
+                TickTrace(
+                    seq=next(self._seq),
+                    symbol=symbol,
+                    candle_timestamp=candle_timestamp,
+                    signal=signal,
+                    wall_time=wall_time,
+                    total_seconds=total_seconds,
+                    stages=stages,
+                )
+            )
+
+    def recent(self, limit: int | None = None) -> list[TickTrace]:
+        with self._lock:
+            traces = list(self._ring)
+        return traces[-limit:] if limit else traces
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ring.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per-stage count, mean, p95 and max seconds over the buffered ticks."""
+        traces = self.recent()
+        columns: dict[str, list[float]] = {"total": [t.total_seconds for t in traces]}
+        for trace in traces:
+            for stage, seconds in trace.stages.items():
+                columns.setdefault(stage, []).append(seconds)
+
+        summary: dict[str, dict[str, float]] = {}
+        for stage, values in columns.items():
+            if not values:
+                continue
+            ordered = sorted(values)
+            p95 = ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
+            summary[stage] = {
+                "count": len(values),
+                "mean_seconds": sum(values) / len(values),
+                "p95_seconds": p95,
+                "max_seconds": ordered[-1],
+            }
+        return summary
+
+    def to_dict(self, limit: int | None = None) -> dict[str, object]:
+        return {
+            "capacity": self.capacity,
+            "summary": self.summary(),
+            "ticks": [asdict(trace) for trace in self.recent(limit)],
+        }
+
+
+def format_summary(summary: dict[str, dict[str, float]]) -> str:
+    header = f"{'stage':<10} {'count':>8} {'mean us':>10} {'p95 us':>10} {'max us':>10}"
+    lines = [header, "-" * len(header)]
+    names = [s for s in STAGES if s in summary] + [s for s in summary if s not in STAGES]
+    for stage in names:
+        row = summary[stage]
+        lines.append(
+            f"{stage:<10} {int(row['count']):>8} {row['mean_seconds'] * 1e6:>10.1f} "
+            f"{row['p95_seconds'] * 1e6:>10.1f} {row['max_seconds'] * 1e6:>10.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from namoo_overseas_bot.engine import EngineResult
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.models import Candle
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    np = None
+
+# Must match strategies.sma_cross so both engines agree on which bars are ties.
+_TIE_TOLERANCE = 1e-9
+
+
+class VectorizedSmaBacktest:
+    """
+    Array implementation of ``TradingEngine`` + ``SmaCrossStrategy`` + ``PaperBroker``.
+
+    Signals, position changes, cash and equity are computed over the whole close
+    series at once and reproduce the loop engine bar for bar, starting from a flat
+    paper account with ``initial_cash_usd``. Requires the ``fast`` extra (numpy).
+    """
+
+    def __init__(
+        self,
+        *,
+        short_window: int,
+        long_window: int,
+        quantity: int,
+        initial_cash_usd: float,
+    ) -> None:
+        if np is None:
+            raise RuntimeError(
+                "vectorized backtest requires numpy: pip install 'namoo-overseas-bot[fast]'"
+            )
+        if short_window <= 0 or long_window <= 0:
+            raise ValueError("window sizes must be positive")
+        if short_window >= long_window:
+            raise ValueError("short_window must be smaller than long_window")
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+
+        self.short_window = short_window
+        self.long_window = long_window
+        self.quantity = quantity
+        self.initial_cash_usd = initial_cash_usd
+
+    def run(self, candles: Sequence[Candle] | CandleSeries) -> EngineResult:
+        return self.run_closes(closes_array(candles))
+
+    def run_closes(self, closes: "np.ndarray") -> EngineResult:
+        closes = np.ascontiguousarray(closes, dtype=np.float64)
+        n = closes.shape[0]
+        if n == 0:
+            return EngineResult(
+                trades=0,
+                cash=self.initial_cash_usd,
+                position_qty=0,
+                last_price=0.0,
+                equity=self.initial_cash_usd,
+                equity_curve=np.empty(0, dtype=np.float64),
+            )
+
+        buys, sells = self.signals(closes)
+
+        # Signals alternate, so every BUY fills from a flat book; a SELL fills only
+        # when it follows a BUY (i.e. it is not the very first signal).
+        events = np.flatnonzero(buys | sells)
+        if events.size and sells[events[0]]:
+            sells = sells.copy()
+            sells[events[0]] = False
+
+        notional = self.quantity * closes
+        cash_delta = np.zeros(n, dtype=np.float64)
+        cash_delta[buys] = -notional[buys]
+        cash_delta[sells] = notional[sells]
+        cash = np.cumsum(np.concatenate(([self.initial_cash_usd], cash_delta)))
+
+        cash_before = cash[:-1]
+        short = buys & (notional > cash_before)
+        if short.any():
+            idx = int(np.argmax(short))
+            raise ValueError(
+                f"insufficient cash: need {notional[idx]:.2f}, have {cash_before[idx]:.2f}"
+            )
+        cash = cash[1:]
+
+        traded = buys | sells
+        last_trade = np.where(traded, np.arange(n), 0)
+        np.maximum.accumulate(last_trade, out=last_trade)
+        position = buys[last_trade].astype(np.int64) * self.quantity
+
+        equity_curve = cash + position * closes
+        return EngineResult(
+            trades=int(buys.sum() + sells.sum()),
+            cash=float(cash[-1]),
+            position_qty=int(position[-1]),
+            last_price=float(closes[-1]),
+            equity=float(equity_curve[-1]),
+            equity_curve=equity_curve,
+        )
+
+    def signals(self, closes: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+        """Return boolean BUY/SELL masks equal to ``SmaCrossStrategy.on_price`` output."""
+        n = closes.shape[0]
+        state = np.zeros(n, dtype=np.int8)
+        if n >= self.long_window:
+            short_sma = _rolling_mean(closes, self.short_window)[self.long_window - self.short_window :]
+            long_sma = _rolling_mean(closes, self.long_window)
+            spread = short_sma - long_sma
+            tolerance = _TIE_TOLERANCE * np.abs(long_sma)
+            tail = state[self.long_window - 1 :]
+            tail[spread > tolerance] = 1
+            tail[spread < -tolerance] = -1
+
+        # Previous non-tie state, i.e. the strategy's ``_last_signal`` before each bar.
+        last_idx = np.where(state != 0, np.arange(n), 0)
+        np.maximum.accumulate(last_idx, out=last_idx)
+        last_state = state[last_idx]
+        previous = np.concatenate(([0], last_state[:-1])).astype(np.int8)
+
+        buys = (state == 1) & (previous != 1)
+        sells = (state == -1) & (previous != -1)
+        return buys, sells
+
+
+def closes_array(candles: Sequence[Candle] | CandleSeries) -> "np.ndarray":
+    """Close prices as float64; a ``CandleSeries`` column is wrapped without copying."""
+    if isinstance(candles, CandleSeries):
+        return np.frombuffer(candles.close, dtype=np.float64)
+    return np.fromiter((c.close for c in candles), dtype=np.float64, count=len(candles))
+
+
+def _rolling_mean(values: "np.ndarray", window: int) -> "np.ndarray":
+    # Cumulative-sum difference, O(n) for any window. Summing offsets from the
+    # first close keeps the running sum (and its rounding error) small enough for
+    # _TIE_TOLERANCE to absorb.
+    if len(values) < window:
+        return np.empty(0, dtype=np.float64)
+    base = values[0]
+    sums = np.concatenate(([0.0], np.cumsum(values - base)))
+    return (sums[window:] - sums[:-window]) / window + base
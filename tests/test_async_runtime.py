@@ -0,0 +1,215 @@
+import asyncio
+import json
+import threading
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.telegram import TelegramNotifier
+from namoo_overseas_bot.runtime.async_http import http_request, read_headers
+from namoo_overseas_bot.runtime.async_runtime import AsyncBotRuntime, AsyncNotifierBridge
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.runtime.telegram_commands import TelegramCommandHandler, TelegramCommandPoller
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+class _RecordingNotifier:
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def send(self, message: str) -> None:
+        self.messages.append(message)
+
+
+class _FakeTelegramApi:
+    """Local stand-in for the Bot API: serves one /status command, records sends."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self._served_update = False
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def close(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request_line = (await reader.readline()).decode()
+        headers = await read_headers(reader)
+        body = await reader.readexactly(int(headers.get("content-length", "0")))
+        if "/sendMessage" in request_line:
+            self.sent.append(json.loads(body)["text"])
+            payload = {"ok": True}
+        elif not self._served_update:
+            self._served_update = True
+            payload = {
+                "ok": True,
+                "result": [{"update_id": 7, "message": {"chat": {"id": 1}, "text": "/status"}}],
+            }
+        else:
+            payload = {"ok": True, "result": []}
+        data = json.dumps(payload).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            + f"Content-Length: {len(data)}\r\n\r\n".encode()
+            + data
+        )
+        await writer.drain()
+        writer.close()
+
+
+def _bot(notifier: object, *, tick_seconds: float) -> PaperTradingBot:
+    candles = [
+        Candle(
+            symbol="AAPL",
+            timestamp=f"2026-01-{idx + 1:02d}T00:00:00Z",
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for idx, close in enumerate([100, 101, 102, 103, 99, 98, 97, 104])
+    ]
+    return PaperTradingBot(
+        broker=PaperBroker(initial_cash_usd=10_000),
+        strategy=SmaCrossStrategy(short_window=2, long_window=3),
+        notifier=notifier,
+        symbol="AAPL",
+        quantity=1,
+        candles=candles,
+        tick_seconds=tick_seconds,
+        max_position_qty=1,
+    )
+
+
+async def _api(runtime: AsyncBotRuntime, method: str, path: str) -> dict[str, object]:
+    host, port = runtime.server_address
+    status, body = await http_request(method, f"http://{host}:{port}{path}", timeout=2)
+    payload = json.loads(body)
+    payload["_code"] = status
+    return payload
+
+
+class AsyncBotRuntimeTests(unittest.IsolatedAsyncioTestCase):
+    async def _start(self, runtime: AsyncBotRuntime) -> None:
+        try:
+            await runtime.start()
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+
+    async def _wait_for_loop_count(self, runtime: AsyncBotRuntime, count: int) -> dict[str, object]:
+        for _ in range(100):
+            status = await _api(runtime, "GET", "/status")
+            if status["loop_count"] >= count:
+                break
+            await asyncio.sleep(0.02)
+        return status
+
+    async def test_control_api_applies_without_waiting_for_tick(self) -> None:
+        inner = _RecordingNotifier()
+        bridge = AsyncNotifierBridge(inner)
+        bot = _bot(bridge, tick_seconds=60)
+        runtime = AsyncBotRuntime(bot=bot, host="127.0.0.1", port=0, notifications=bridge)
+        await self._start(runtime)
+
+        status = await self._wait_for_loop_count(runtime, 1)
+        self.assertTrue(status["running"])
+        self.assertEqual(status["loop_count"], 1)
+
+        self.assertTrue((await _api(runtime, "POST", "/pause"))["paused"])
+        self.assertFalse((await _api(runtime, "POST", "/resume"))["paused"])
+        # Resume woke the trading task, which ticked once instead of sleeping 60s.
+        self.assertEqual((await self._wait_for_loop_count(runtime, 2))["loop_count"], 2)
+
+        await _api(runtime, "POST", "/stop")
+        await asyncio.wait_for(runtime.wait_stopped(), timeout=2)
+
+        self.assertTrue(inner.messages[0].startswith("[시작]"))
+        self.assertTrue(inner.messages[-1].startswith("[중지]"))
+
+    async def test_blocked_tick_does_not_stall_the_api(self) -> None:
+        bot = _bot(_RecordingNotifier(), tick_seconds=60)
+        release = threading.Event()
+        ticking = threading.Event()
+        run_once = bot.run_once
+
+        def throttled_tick() -> None:
+            # Stands in for a broker throttle wait or a slow checkpoint write.
+            ticking.set()
+            release.wait(5)
+            run_once()
+
+        bot.run_once = throttled_tick  # type: ignore[method-assign]
+        runtime = AsyncBotRuntime(bot=bot, host="127.0.0.1", port=0)
+        await self._start(runtime)
+        self.assertTrue(await asyncio.to_thread(ticking.wait, 2))
+
+        status = await asyncio.wait_for(_api(runtime, "GET", "/status"), timeout=1)
+        self.assertEqual(status["loop_count"], 0)
+
+        release.set()
+        self.assertEqual((await self._wait_for_loop_count(runtime, 1))["loop_count"], 1)
+        bot.stop()
+        await asyncio.wait_for(runtime.wait_stopped(), timeout=2)
+
+    async def test_unknown_route_and_auth(self) -> None:
+        bot = _bot(_RecordingNotifier(), tick_seconds=60)
+        runtime = AsyncBotRuntime(bot=bot, host="127.0.0.1", port=0, api_token="secret")
+        await self._start(runtime)
+
+        self.assertEqual((await _api(runtime, "GET", "/health"))["_code"], 200)
+        self.assertEqual((await _api(runtime, "GET", "/status"))["_code"], 401)
+
+        bot.stop()
+        await asyncio.wait_for(runtime.wait_stopped(), timeout=2)
+
+    async def test_telegram_commands_and_notifications_run_on_the_loop(self) -> None:
+        api = _FakeTelegramApi()
+        try:
+            base_url = await api.start()
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+
+        bridge = AsyncNotifierBridge(
+            TelegramNotifier(bot_token="t", chat_id="1", api_base_url=base_url)
+        )
+        bot = _bot(bridge, tick_seconds=60)
+        poller = TelegramCommandPoller(
+            bot_token="t",
+            allowed_chat_id="1",
+            notifier=bridge,
+            handler=TelegramCommandHandler(bot=bot),
+            poll_seconds=0.01,
+            api_base_url=base_url,
+        )
+        runtime = AsyncBotRuntime(
+            bot=bot,
+            host="127.0.0.1",
+            port=0,
+            notifications=bridge,
+            telegram_poller=poller,
+        )
+        await self._start(runtime)
+
+        for _ in range(100):
+            if any(text.startswith("[상태]") for text in api.sent):
+                break
+            await asyncio.sleep(0.02)
+
+        bot.stop()
+        await asyncio.wait_for(runtime.wait_stopped(), timeout=2)
+        await api.close()
+
+        self.assertTrue(any(text.startswith("[상태] AAPL") for text in api.sent))
+        self.assertTrue(api.sent[-1].startswith("[중지]"))
+
+
+if __name__ == "__main__":
+    unittest.main()
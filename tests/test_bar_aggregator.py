@@ -0,0 +1,173 @@
+import random
+import unittest
+
+from namoo_overseas_bot.market_data.aggregator import (
+    BarAggregator,
+    parse_timeframe,
+    resample,
+    resample_with_stats,
+)
+from namoo_overseas_bot.market_data.series import DATE_FORMAT, CandleSeries, format_timestamp, parse_timestamp
+from namoo_overseas_bot.models import Candle, Signal
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+T0 = parse_timestamp("2026-01-05T00:00:00Z")
+
+
+def _minute_bars(count: int, *, seed: int = 3) -> list[Candle]:
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    for idx in range(count):
+        open_ = price
+        price = max(1.0, price + rng.gauss(0, 0.5))
+        bars.append(
+            Candle(
+                "AAPL",
+                format_timestamp(T0 + idx * 60),
+                open_,
+                max(open_, price) + rng.random(),
+                min(open_, price) - rng.random(),
+                price,
+                float(rng.randrange(1, 100)),
+            )
+        )
+    return bars
+
+
+def _expected(bars: list[Candle], size: int) -> list[tuple[str, float, float, float, float, float]]:
+    """Brute-force reference: group every ``size`` consecutive minute bars."""
+    out = []
+    for start in range(0, len(bars), size):
+        group = bars[start : start + size]
+        out.append(
+            (
+                group[0].timestamp,
+                group[0].open,
+                max(b.high for b in group),
+                min(b.low for b in group),
+                group[-1].close,
+                sum(b.volume for b in group),
+            )
+        )
+    return out
+
+
+def _ohlcv(bar: Candle) -> tuple[str, float, float, float, float, float]:
+    return (bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume)
+
+
+class BarAggregatorTests(unittest.TestCase):
+    def test_builds_every_timeframe_from_minute_bars(self) -> None:
+        bars = _minute_bars(3 * 60 + 7)
+        aggregator = BarAggregator("AAPL", ["1h", "5m"])
+        closed: dict[str, list[Candle]] = {"5m": [], "1h": []}
+        order: list[str] = []
+        for timeframe in closed:
+            aggregator.subscribe(timeframe, lambda tf, bar, _closed: (closed[tf].append(bar), order.append(tf)))
+
+        for bar in bars:
+            aggregator.add_candle(bar)
+        # Nothing is emitted for the still-open bars until flush.
+        self.assertEqual(len(closed["5m"]), (3 * 60 + 5) // 5)
+        self.assertEqual(len(closed["1h"]), 3)
+        self.assertEqual(order[order.index("1h") - 1], "5m")
+        aggregator.flush()
+
+        self.assertEqual([_ohlcv(b) for b in closed["5m"]], _expected(bars, 5))
+        self.assertEqual([_ohlcv(b) for b in closed["1h"]], _expected(bars, 60))
+        self.assertEqual(aggregator.timeframes, ["5m", "1h"])
+        self.assertIsNone(aggregator.open_bar("1h"))
+
+    def test_ticks_partial_bars_and_late_updates(self) -> None:
+        aggregator = BarAggregator("AAPL", ["1m"])
+        updates: list[tuple[Candle, bool]] = []
+        aggregator.subscribe("1m", lambda _, bar, closed: updates.append((bar, closed)), partial=True)
+
+        aggregator.add_tick(T0 + 1, 10.0, 5)
+        aggregator.add_tick(T0 + 20, 12.0, 1)
+        aggregator.add_tick(T0 + 59, 9.0, 2)
+        aggregator.add_tick(T0 + 61, 11.0, 1)
+        aggregator.add_tick(T0 + 30, 50.0, 1)
+
+        self.assertEqual([closed for _, closed in updates], [False, False, False, True, False])
+        minute = updates[3][0]
+        self.assertEqual(_ohlcv(minute), (format_timestamp(T0), 10.0, 12.0, 9.0, 9.0, 8.0))
+        self.assertEqual(updates[2][0], minute)
+        self.assertEqual(aggregator.open_bar("1m").close, 11.0)  # type: ignore[union-attr]
+        stats = aggregator.stats()
+        self.assertEqual((stats.updates, stats.bars_closed, stats.late), (5, 1, 1))
+
+    def test_late_update_is_dropped_from_every_timeframe_once(self) -> None:
+        aggregator = BarAggregator("AAPL", ["5m", "1m"])
+        aggregator.add_tick(T0 + 1, 10.0, 1)
+        aggregator.add_tick(T0 + 61, 11.0, 1)
+        # Still inside the open 5m bar, but older than the open 1m bar.
+        aggregator.add_tick(T0 + 30, 50.0, 1)
+        aggregator.add_tick(T0 - 600, 1.0, 1)
+        aggregator.add_tick(T0 + 62, 12.0, 1)
+
+        five = aggregator.open_bar("5m")
+        assert five is not None
+        self.assertEqual(_ohlcv(five), (format_timestamp(T0), 10.0, 12.0, 10.0, 12.0, 3.0))
+        stats = aggregator.stats()
+        self.assertEqual((stats.updates, stats.late), (5, 2))
+
+    def test_strategies_see_only_their_timeframe(self) -> None:
+        bars = _minute_bars(600)
+        aggregator = BarAggregator("AAPL", ["5m", "15m"])
+        signals: list[Signal] = []
+        aggregator.subscribe_strategy(
+            "15m",
+            SmaCrossStrategy(short_window=2, long_window=5),
+            lambda bar, signal: signals.append(signal),
+        )
+        for bar in bars:
+            aggregator.add_candle(bar)
+        aggregator.flush()
+
+        reference = SmaCrossStrategy(short_window=2, long_window=5)
+        self.assertEqual(signals, [reference.on_price(close) for *_, close, _ in _expected(bars, 15)])
+
+    def test_rejects_bad_input(self) -> None:
+        self.assertEqual([parse_timeframe(t) for t in ("30s", "5m", "4h", "1d")], [30, 300, 14_400, 86_400])
+        for bad in ("", "m", "0m", "5w", "1.5h"):
+            with self.assertRaises(ValueError):
+                parse_timeframe(bad)
+        with self.assertRaises(ValueError):
+            BarAggregator("AAPL", [])
+        with self.assertRaises(ValueError):
+            BarAggregator("AAPL", ["45m", "1h"])
+        aggregator = BarAggregator("AAPL", ["5m"])
+        with self.assertRaises(ValueError):
+            aggregator.subscribe("1h", lambda *_: None)
+        with self.assertRaises(ValueError):
+            aggregator.add_candle(Candle("MSFT", "2026-01-05T00:00:00Z", 1, 1, 1, 1, 1))
+
+
+class ResampleTests(unittest.TestCase):
+    def test_resample_matches_streaming_aggregation(self) -> None:
+        bars = _minute_bars(250)
+        hourly = resample(CandleSeries.from_candles(bars), "1h")
+        self.assertEqual([_ohlcv(b) for b in hourly], _expected(bars, 60))
+
+    def test_resample_counts_out_of_order_rows(self) -> None:
+        bars = _minute_bars(180)
+        # An hour-old bar slipped in after the second hour started.
+        series = CandleSeries.from_candles([*bars[:70], bars[5], *bars[70:]])
+        hourly, stats = resample_with_stats(series, "1h")
+        self.assertEqual([_ohlcv(b) for b in hourly], _expected(bars, 60))
+        self.assertEqual((stats.updates, stats.bars_closed, stats.late), (181, 3, 1))
+
+    def test_daily_series_keeps_date_timestamps(self) -> None:
+        days = [Candle("AAPL", f"2026-01-{d:02d}", d, d + 1, d - 1, d + 0.5, 10) for d in range(5, 10)]
+        series = CandleSeries.from_candles(days)
+        self.assertEqual(series.timestamp_format, DATE_FORMAT)
+        two_day = resample(series, "2d")
+        self.assertEqual(two_day.timestamp_format, DATE_FORMAT)
+        self.assertEqual(len(resample(series, "1d")), 5)
+        self.assertEqual(sum(two_day.volume), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import io
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from namoo_overseas_bot.batch import (
+    BatchCsvWriter,
+    BatchSettings,
+    BatchSummary,
+    discover_tasks,
+    run_batch,
+)
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.csv_feed import load_candles
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+SAMPLE = Path("data/sample_us_stock.csv")
+SETTINGS = BatchSettings(short_window=3, long_window=8, quantity=1, initial_cash_usd=10_000, use_cache=False)
+
+
+class _PoolWithCrashingWorker(ThreadPoolExecutor):
+    """Stands in for the process pool; the MSFT worker dies mid-task."""
+
+    def __init__(self, max_workers: int, **_: object) -> None:
+        super().__init__(max_workers)
+
+    def submit(self, fn, task, settings):  # type: ignore[no-untyped-def, override]
+        if task.symbol == "MSFT":
+            future: Future[object] = Future()
+            future.set_exception(BrokenProcessPool("a worker process terminated abruptly"))
+            return future
+        return super().submit(fn, task, settings)
+
+
+class BatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        lines = SAMPLE.read_text().splitlines()
+        # Different history lengths give each symbol a different result.
+        for symbol, rows in (("aapl", 40), ("msft", 30), ("nvda", 25)):
+            (self.root / f"{symbol}.csv").write_text("\n".join(lines[: rows + 1]) + "\n")
+        (self.root / "bad.csv").write_text("timestamp,close\n2026-01-01,1\n")
+        (self.root / "notes.txt").write_text("ignored")
+
+    def _expected_equity(self, path: Path, symbol: str) -> float:
+        return TradingEngine(
+            broker=PaperBroker(initial_cash_usd=SETTINGS.initial_cash_usd),
+            strategy=SmaCrossStrategy(short_window=SETTINGS.short_window, long_window=SETTINGS.long_window),
+            symbol=symbol,
+            quantity=SETTINGS.quantity,
+        ).run(load_candles(path, symbol=symbol)).equity
+
+    def test_discovers_directories_globs_and_files(self) -> None:
+        symbols = [t.symbol for t in discover_tasks([str(self.root)])]
+        self.assertEqual(symbols, ["AAPL", "BAD", "MSFT", "NVDA"])
+
+        globbed = discover_tasks([str(self.root / "[mn]*.csv"), str(self.root / "aapl.csv")])
+        self.assertEqual([t.symbol for t in globbed], ["MSFT", "NVDA", "AAPL"])
+
+        with self.assertRaises(FileNotFoundError):
+            discover_tasks([str(self.root / "missing.csv")])
+
+    def test_results_match_engine_and_errors_are_isolated(self) -> None:
+        tasks = discover_tasks([str(self.root)])
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = {r.symbol: r for r in run_batch(tasks, SETTINGS, workers=workers)}
+                self.assertEqual(set(results), {"AAPL", "BAD", "MSFT", "NVDA"})
+                self.assertIn("ValueError", results["BAD"].error)
+                for symbol in ("AAPL", "MSFT", "NVDA"):
+                    self.assertEqual(results[symbol].error, "")
+                    self.assertAlmostEqual(
+                        results[symbol].equity,
+                        self._expected_equity(self.root / f"{symbol.lower()}.csv", symbol),
+                    )
+                self.assertEqual(results["AAPL"].bars, 40)
+
+    def test_unexpected_errors_become_error_rows(self) -> None:
+        tasks = discover_tasks([str(self.root)])
+        with mock.patch.object(TradingEngine, "run", side_effect=RuntimeError("engine blew up")):
+            results = list(run_batch(tasks, SETTINGS, workers=1))
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(r.error for r in results))
+        self.assertIn("RuntimeError: engine blew up", {r.symbol: r for r in results}["AAPL"].error)
+
+    def test_crashed_worker_becomes_an_error_row(self) -> None:
+        tasks = discover_tasks([str(self.root)])
+        with mock.patch("namoo_overseas_bot.batch.ProcessPoolExecutor", _PoolWithCrashingWorker):
+            results = {r.symbol: r for r in run_batch(tasks, SETTINGS, workers=2, max_in_flight=2)}
+
+        self.assertEqual(set(results), {"AAPL", "BAD", "MSFT", "NVDA"})
+        self.assertIn("BrokenProcessPool", results["MSFT"].error)
+        self.assertEqual(results["AAPL"].error, "")
+        self.assertEqual(results["NVDA"].error, "")
+
+    def test_summary_and_streaming_writer(self) -> None:
+        tasks = discover_tasks([str(self.root)])
+        summary = BatchSummary(initial_cash_usd=SETTINGS.initial_cash_usd)
+        out = io.StringIO()
+        writer = BatchCsvWriter(out)
+        for result in run_batch(tasks, SETTINGS, workers=1):
+            summary.add(result)
+            writer.write(result)
+
+        self.assertEqual((summary.symbols, summary.succeeded, summary.failed), (4, 3, 1))
+        self.assertEqual(summary.bars, 95)
+        self.assertEqual(len(out.getvalue().splitlines()), 5)
+        self.assertIsNotNone(summary.best)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+from namoo_overseas_bot.bench import (
+    CASES,
+    BenchResult,
+    compare,
+    load_results,
+    results_payload,
+    run_case,
+    synthetic_candles,
+    write_results,
+)
+from namoo_overseas_bot.bench.__main__ import main
+from namoo_overseas_bot.bench.cases import SYMBOL, write_synthetic_csv
+from namoo_overseas_bot.market_data.csv_feed import load_candles
+
+
+def _result(name: str, size: int, median: float) -> BenchResult:
+    return BenchResult(
+        name=name, size=size, unit="op", repeat=1, best_seconds=median, median_seconds=median
+    )
+
+
+class BenchSuiteTests(unittest.TestCase):
+    def test_synthetic_data_is_reproducible(self) -> None:
+        self.assertEqual(synthetic_candles(200), synthetic_candles(200))
+        self.assertNotEqual(synthetic_candles(200), synthetic_candles(200, seed=1))
+
+    def test_synthetic_csv_round_trips_through_loader(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_synthetic_csv(Path(tmp) / "bench.csv", 100)
+            self.assertEqual(load_candles(path, symbol=SYMBOL), synthetic_candles(100))
+
+    def test_every_case_runs_at_a_tiny_size(self) -> None:
+        for case in CASES:
+            size = 5 if case.unit == "request" else 60
+            with self.subTest(case=case.name):
+                try:
+                    result = run_case(case, size, repeat=1, warmup=0)
+                except PermissionError:
+                    self.skipTest("socket bind is not permitted in this environment")
+                self.assertEqual(result.size, size)
+                self.assertGreater(result.median_seconds, 0)
+
+    def test_compare_flags_slowdowns_beyond_threshold(self) -> None:
+        baseline = [_result("a", 10, 1.0), _result("b", 10, 1.0), _result("gone", 10, 1.0)]
+        current = [_result("a", 10, 1.1), _result("b", 10, 1.3), _result("new", 10, 1.0)]
+        comparisons = {c.name: c for c in compare(current, baseline, threshold=0.15)}
+
+        self.assertEqual(set(comparisons), {"a", "b"})
+        self.assertFalse(comparisons["a"].regressed)
+        self.assertTrue(comparisons["b"].regressed)
+
+    def test_results_json_round_trip(self) -> None:
+        results = [_result("a", 10, 0.5)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bench.json"
+            write_results(path, results_payload(results, quick=True))
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            self.assertTrue(payload["quick"])
+            self.assertEqual(payload["results"][0]["per_op_ns"], 0.05e9)
+            self.assertEqual(load_results(path), results)
+
+    def test_main_exits_non_zero_on_regression(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "current.json"
+            baseline = Path(tmp) / "baseline.json"
+            fast = [_result("strategy.on_price", 500, 1e-9), _result("strategy.on_price", 2000, 1e-9)]
+            write_results(baseline, results_payload(fast, quick=True))
+
+            args = ["--quick", "--repeat", "1", "--case", "strategy.on_price", "--out", str(out)]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(args), 0)
+                self.assertEqual(main([*args, "--baseline", str(baseline)]), 1)
+            self.assertTrue(out.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
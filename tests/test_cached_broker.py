@@ -0,0 +1,130 @@
+import unittest
+
+from namoo_overseas_bot.brokers.base import BrokerClient
+from namoo_overseas_bot.brokers.cached import CachedAccountBroker
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.models import AccountSnapshot, Candle, Fill, Order, Side
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.multi_bot import MultiSymbolTradingBot
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+class CountingBroker(PaperBroker):
+    """PaperBroker that counts reads, standing in for a broker where each is a round trip."""
+
+    def __init__(self, initial_cash_usd: float) -> None:
+        super().__init__(initial_cash_usd=initial_cash_usd)
+        self.round_trips = 0
+
+    def cash_balance(self) -> float:
+        self.round_trips += 1
+        return super().cash_balance()
+
+    def position_qty(self, symbol: str) -> int:
+        self.round_trips += 1
+        return super().position_qty(symbol)
+
+    def account_snapshot(self) -> AccountSnapshot:
+        self.round_trips += 1
+        return super().account_snapshot()
+
+
+def _candles(symbol: str, closes: list[float]) -> list[Candle]:
+    return [
+        Candle(symbol=symbol, timestamp=f"2026-01-{i + 1:02d}", open=c, high=c, low=c, close=c, volume=1)
+        for i, c in enumerate(closes)
+    ]
+
+
+CLOSES = [10, 11, 12, 13, 9, 8, 7, 14, 15, 16, 6, 5]
+
+
+class CachedAccountBrokerTests(unittest.TestCase):
+    def test_brokers_must_list_positions_for_snapshots(self) -> None:
+        class NoPositionsBroker(BrokerClient):
+            def submit_order(self, order: Order, price: float, timestamp: str) -> Fill:
+                raise NotImplementedError
+
+            def cash_balance(self) -> float:
+                return 0.0
+
+            def position_qty(self, symbol: str) -> int:
+                return 0
+
+        # Caught at construction, not on the first account_snapshot of a running bot.
+        with self.assertRaises(TypeError):
+            NoPositionsBroker()  # type: ignore[abstract]
+
+    def test_bot_tick_costs_at_most_one_round_trip(self) -> None:
+        inner = CountingBroker(initial_cash_usd=1_000)
+        broker = CachedAccountBroker(inner)
+        bot = PaperTradingBot(
+            broker=broker,
+            strategy=SmaCrossStrategy(short_window=2, long_window=3),
+            notifier=NoOpNotifier(),
+            symbol="AAPL",
+            quantity=1,
+            candles=_candles("AAPL", CLOSES),
+            tick_seconds=1,
+            max_position_qty=3,
+        )
+        inner.round_trips = 0
+        for _ in range(len(CLOSES)):
+            bot.process_next_candle()
+
+        self.assertGreater(bot.status()["trades"], 0)
+        self.assertLessEqual(inner.round_trips, len(CLOSES))
+        self.assertGreater(broker.stats().fills_applied, 0)
+        status = bot.status()
+        self.assertEqual(status["cash"], PaperBroker.cash_balance(inner))
+        self.assertEqual(status["position_qty"], PaperBroker.position_qty(inner, "AAPL"))
+
+    def test_multi_symbol_tick_refreshes_once_for_all_symbols(self) -> None:
+        inner = CountingBroker(initial_cash_usd=10_000)
+        bot = MultiSymbolTradingBot(
+            broker=CachedAccountBroker(inner),
+            strategy_factory=lambda: SmaCrossStrategy(short_window=2, long_window=3),
+            notifier=NoOpNotifier(),
+            candles_by_symbol={"AAPL": _candles("AAPL", CLOSES), "MSFT": _candles("MSFT", CLOSES[::-1])},
+            quantity=1,
+            tick_seconds=1,
+            max_position_qty=1,
+        )
+        inner.round_trips = 0
+        for _ in range(5):
+            bot.process_tick()
+        self.assertLessEqual(inner.round_trips, 5)
+
+    def test_fills_patch_the_cache_and_failures_invalidate_it(self) -> None:
+        inner = CountingBroker(initial_cash_usd=1_000)
+        broker = CachedAccountBroker(inner)
+        self.assertEqual(broker.cash_balance(), 1_000)
+        broker.submit_order(Order("AAPL", Side.BUY, 3), price=10.0, timestamp="t1")
+        broker.submit_orders([Order("AAPL", Side.SELL, 3)], {"AAPL": 12.0}, "t2")
+        broker.submit_order(Order("MSFT", Side.BUY, 1), price=100.0, timestamp="t3")
+
+        self.assertEqual(broker.account_snapshot(), AccountSnapshot(cash=906.0, positions={"MSFT": 1}))
+        self.assertEqual(inner.round_trips, 1)
+
+        with self.assertRaises(ValueError):
+            broker.submit_order(Order("AAPL", Side.SELL, 1), price=10.0, timestamp="t4")
+        self.assertEqual(broker.position_qty("MSFT"), 1)
+        self.assertEqual(inner.round_trips, 2)
+
+    def test_push_updates_replace_per_tick_refresh(self) -> None:
+        inner = CountingBroker(initial_cash_usd=1_000)
+        broker = CachedAccountBroker(inner, refresh_each_tick=False)
+        broker.apply_snapshot(AccountSnapshot(cash=500.0, positions={"AAPL": 2, "MSFT": 0}))
+        broker.begin_tick()
+        self.assertEqual(broker.positions(), {"AAPL": 2})
+
+        broker.apply_fill(Fill("AAPL", Side.SELL, 2, 50.0, "t1"))
+        broker.begin_tick()
+        self.assertEqual(broker.account_snapshot(), AccountSnapshot(cash=600.0, positions={}))
+        self.assertEqual(inner.round_trips, 0)
+        self.assertEqual(broker.stats().pushes, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+from pathlib import Path
+import pickle
+import tempfile
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.csv_feed import iter_candle_chunks, load_candle_series, load_candles
+from namoo_overseas_bot.market_data.series import (
+    CandleSeries,
+    detect_timestamp_format,
+    format_timestamp,
+    parse_timestamp,
+)
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+CSV_PATH = "data/sample_us_stock.csv"
+
+
+class TimestampTests(unittest.TestCase):
+    def test_round_trips_dates_and_datetimes(self) -> None:
+        self.assertEqual(format_timestamp(parse_timestamp("2025-12-01"), "%Y-%m-%d"), "2025-12-01")
+        ts = parse_timestamp("2026-01-02T03:04:05Z")
+        self.assertEqual(ts, parse_timestamp("2026-01-02T12:04:05+09:00"))
+        self.assertEqual(format_timestamp(ts), "2026-01-02T03:04:05Z")
+
+    def test_detected_format_writes_the_original_string_back(self) -> None:
+        for raw in (
+            "2024-01-02",
+            "2024-01-02T09:30:00Z",
+            "2024-01-02T09:30:00+09:00",
+            "2024-01-02T09:30:00-04:30",
+            "2024-01-02 09:30:00",
+            "2024-01-02T09:30",
+        ):
+            self.assertEqual(format_timestamp(parse_timestamp(raw), detect_timestamp_format(raw)), raw)
+        for bad in ("2024-01-02T09:30:00.250Z", "01/02/2024"):
+            with self.assertRaises(ValueError):
+                detect_timestamp_format(bad)
+
+    def test_csv_paths_agree_and_mixed_formats_keep_their_strings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "kst.csv"
+            path.write_text(
+                "timestamp,open,high,low,close,volume\n"
+                "2024-01-02T09:30:00+09:00,1,1,1,1,1\n"
+                "2024-01-02T09:31:00+09:00,2,2,2,2,1\n",
+                encoding="utf-8",
+            )
+            self.assertEqual(list(load_candle_series(path, symbol="X")), load_candles(path, symbol="X"))
+            self.assertIsNone(load_candle_series(path, symbol="X").timestamp_labels)
+
+            with path.open("a", encoding="utf-8") as f:
+                f.write("2024-01-02 00:32:00,3,3,3,3,1\n")
+            self.assertEqual(list(load_candle_series(path, symbol="X")), load_candles(path, symbol="X"))
+
+    def test_offset_change_across_dst_and_sub_second_rows_load(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nyse.csv"
+            path.write_text(
+                "timestamp,open,high,low,close,volume\n"
+                "2024-03-07T09:30:00-05:00,1,1,1,1,1\n"
+                "2024-03-08T09:30:00-05:00,2,2,2,2,1\n"
+                "2024-03-11T09:30:00-04:00,3,3,3,3,1\n"
+                "2024-03-12T09:30:00.500-04:00,4,4,4,4,1\n",
+                encoding="utf-8",
+            )
+            expected = load_candles(path, symbol="X")
+            for chunk_size in (1, 2, 3):
+                chunks = iter_candle_chunks(path, "X", chunk_size=chunk_size)
+                self.assertEqual([candle for chunk in chunks for candle in chunk], expected)
+            series = load_candle_series(path, symbol="X")
+            self.assertEqual(list(series), expected)
+            self.assertEqual(series.timestamp_format, "%Y-%m-%dT%H:%M:%S-05:00")
+            self.assertEqual(list(series[2:]), expected[2:])
+            self.assertEqual(list(pickle.loads(pickle.dumps(series))), expected)
+            self.assertEqual(list(CandleSeries.from_candles(expected)), expected)
+
+            series.append(
+                timestamp=parse_timestamp("2024-03-13T14:30:00Z"), open=5, high=5, low=5, close=5, volume=1
+            )
+            self.assertEqual(series.timestamp_at(-1), "2024-03-13T09:30:00-05:00")
+
+
+
+class CandleSeriesTests(unittest.TestCase):
+    def test_csv_series_matches_row_loader(self) -> None:
+        series = load_candle_series(CSV_PATH, symbol="AAPL")
+        candles = load_candles(CSV_PATH, symbol="AAPL")
+
+        self.assertEqual(len(series), len(candles))
+        self.assertEqual(list(series), candles)
+        self.assertEqual(series[-1], candles[-1])
+        self.assertEqual(series.close.itemsize, 8)
+        self.assertEqual(series.timestamps.itemsize, 8)
+
+    def test_slice_and_from_candles(self) -> None:
+        candles = [
+            Candle(
+                symbol="MSFT",
+                timestamp=f"2026-01-01T00:0{idx}:00Z",
+                open=1.0 + idx,
+                high=2.0 + idx,
+                low=0.5 + idx,
+                close=1.5 + idx,
+                volume=100.0,
+            )
+            for idx in range(5)
+        ]
+        series = CandleSeries.from_candles(candles)
+        self.assertEqual(series.symbol, "MSFT")
+        self.assertEqual(list(series), candles)
+
+        tail = series[2:]
+        self.assertIsInstance(tail, CandleSeries)
+        self.assertEqual(list(tail), candles[2:])
+
+    def test_pickles_for_worker_processes(self) -> None:
+        series = load_candle_series(CSV_PATH, symbol="AAPL")
+        restored = pickle.loads(pickle.dumps(series))
+        self.assertEqual(list(restored), list(series))
+
+    def test_rejects_ragged_columns(self) -> None:
+        series = CandleSeries.empty("AAPL")
+        series.close.append(1.0)
+        with self.assertRaises(ValueError):
+            CandleSeries(
+                symbol="AAPL",
+                timestamps=series.timestamps,
+                open=series.open,
+                high=series.high,
+                low=series.low,
+                close=series.close,
+                volume=series.volume,
+            )
+
+
+class CandleSeriesConsumerTests(unittest.TestCase):
+    def test_engine_gives_same_result_for_series_and_list(self) -> None:
+        def run(candles: object) -> object:
+            broker = PaperBroker(initial_cash_usd=10_000)
+            result = TradingEngine(
+                broker=broker,
+                strategy=SmaCrossStrategy(short_window=2, long_window=5),
+                symbol="AAPL",
+                quantity=1,
+            ).run(candles, record_equity=True)
+            return result
+
+        self.assertEqual(
+            run(load_candle_series(CSV_PATH, symbol="AAPL")),
+            run(load_candles(CSV_PATH, symbol="AAPL")),
+        )
+
+    def test_paper_bot_reads_series(self) -> None:
+        series = load_candle_series(CSV_PATH, symbol="AAPL")
+        bot = PaperTradingBot(
+            broker=PaperBroker(initial_cash_usd=10_000),
+            strategy=SmaCrossStrategy(short_window=2, long_window=3),
+            notifier=NoOpNotifier(),
+            symbol="AAPL",
+            quantity=1,
+            candles=series,
+            tick_seconds=1,
+            max_position_qty=1,
+        )
+        for _ in range(len(series) + 1):
+            bot.process_next_candle()
+        self.assertEqual(bot.status()["last_candle_timestamp"], series[0].timestamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
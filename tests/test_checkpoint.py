@@ -0,0 +1,221 @@
+import json
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.models import Candle, Signal
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.checkpoint import CheckpointError, CheckpointStore
+from namoo_overseas_bot.runtime.multi_bot import MultiSymbolTradingBot
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+CLOSES = [100, 101, 102, 103, 99, 98, 97, 104, 108, 95, 94, 99, 105, 107, 90]
+COMPARED_KEYS = ("trades", "cash", "position_qty", "equity", "last_signal", "last_candle_timestamp", "loop_count")
+
+
+def _candles(symbol: str = "AAPL", closes: list[int] = CLOSES) -> list[Candle]:
+    return [
+        Candle(
+            symbol=symbol,
+            timestamp=f"2026-01-{idx + 1:02d}",
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for idx, close in enumerate(closes)
+    ]
+
+
+def _bot(
+    checkpoint: CheckpointStore | None = None,
+    *,
+    candles: list[Candle] | None = None,
+    long_window: int = 3,
+    strategy: SmaCrossStrategy | None = None,
+) -> PaperTradingBot:
+    return PaperTradingBot(
+        broker=PaperBroker(initial_cash_usd=10_000),
+        strategy=strategy or SmaCrossStrategy(short_window=2, long_window=long_window),
+        notifier=NoOpNotifier(),
+        symbol="AAPL",
+        quantity=1,
+        candles=candles or _candles(),
+        tick_seconds=60,
+        max_position_qty=1,
+        checkpoint=checkpoint,
+    )
+
+
+class _GatedStrategy(SmaCrossStrategy):
+    """Blocks ``on_price`` until ``gate`` is set, to hold a tick in flight."""
+
+    def __init__(self) -> None:
+        super().__init__(short_window=2, long_window=3)
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    def on_price(self, price: float) -> Signal:
+        self.entered.set()
+        self.gate.wait(5)
+        return super().on_price(price)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CheckpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "checkpoint.json"
+
+    def _store(self, **kwargs: object) -> CheckpointStore:
+        return CheckpointStore(self.path, interval_seconds=0, **kwargs)
+
+    def test_resumed_bot_matches_uninterrupted_run(self) -> None:
+        reference = _bot()
+        for _ in range(len(CLOSES)):
+            reference.run_once()
+
+        first = _bot(self._store())
+        for _ in range(7):
+            first.run_once()
+
+        resumed = _bot(self._store())
+        self.assertIsNotNone(resumed.checkpoint.restore(resumed))
+        self.assertEqual(resumed.status()["cash"], first.status()["cash"])
+        for _ in range(len(CLOSES) - 7):
+            resumed.run_once()
+
+        expected = reference.status()
+        actual = resumed.status()
+        self.assertEqual({k: actual[k] for k in COMPARED_KEYS}, {k: expected[k] for k in COMPARED_KEYS})
+
+    def test_checkpoints_are_rate_limited_and_written_on_stop(self) -> None:
+        clock = _FakeClock()
+        store = CheckpointStore(self.path, interval_seconds=30, clock=clock)
+        bot = _bot(store)
+        bot.run_once()
+        bot.run_once()
+        self.assertEqual(store.stats()["saves"], 1)
+
+        clock.now = 31
+        bot.run_once()
+        self.assertEqual(store.stats()["saves"], 2)
+
+        bot.stop()
+        self.assertEqual(store.stats()["saves"], 3)
+        saved = json.loads(self.path.read_text())
+        self.assertEqual(saved["bot"]["cursor"], 3)
+        self.assertEqual(len(saved["bot"]["strategy"]["long_sma"]["values"]), 3)
+
+    def test_stop_waits_for_the_tick_in_flight_before_the_final_checkpoint(self) -> None:
+        strategy = _GatedStrategy()
+        bot = _bot(CheckpointStore(self.path, interval_seconds=30, clock=_FakeClock()), strategy=strategy)
+        bot.run_once()
+
+        strategy.gate.clear()
+        strategy.entered.clear()
+        tick = threading.Thread(target=bot.run_once)
+        tick.start()
+        self.assertTrue(strategy.entered.wait(5))
+        stopper = threading.Thread(target=bot.stop)
+        stopper.start()
+        stopper.join(0.1)
+        self.assertTrue(stopper.is_alive())
+
+        strategy.gate.set()
+        tick.join(5)
+        stopper.join(5)
+        saved = json.loads(self.path.read_text())
+        self.assertEqual(saved["bot"]["cursor"], 2)
+        self.assertEqual(len(saved["bot"]["strategy"]["long_sma"]["values"]), 2)
+
+    def test_state_export_failure_is_counted_not_raised(self) -> None:
+        store = self._store()
+        bot = _bot(store)
+
+        def broken_export() -> dict:
+            raise RuntimeError("deque mutated during iteration")
+
+        bot.export_state = broken_export  # type: ignore[method-assign]
+        self.assertFalse(store.save(bot))
+        self.assertEqual(store.stats()["failures"], 1)
+        self.assertIn("deque mutated", store.stats()["last_error"])
+
+    def test_changed_candles_are_rejected_before_the_broker_is_touched(self) -> None:
+        bot = _bot(self._store())
+        for _ in range(5):
+            bot.run_once()
+
+        other = _bot(self._store(), candles=_candles(closes=CLOSES[1:]))
+        cash = other.broker.cash_balance()
+        with self.assertRaises(CheckpointError):
+            other.checkpoint.restore(other)
+        self.assertEqual(other.broker.cash_balance(), cash)
+
+    def test_changed_strategy_windows_are_rejected(self) -> None:
+        bot = _bot(self._store())
+        bot.run_once()
+        with self.assertRaises(CheckpointError):
+            resumed = _bot(self._store(), long_window=4)
+            resumed.checkpoint.restore(resumed)
+
+    def test_missing_checkpoint_restores_nothing(self) -> None:
+        bot = _bot(self._store())
+        self.assertIsNone(bot.checkpoint.restore(bot))
+
+    def _multi(self, msft_closes: list[int] | None = None) -> MultiSymbolTradingBot:
+        return MultiSymbolTradingBot(
+            broker=PaperBroker(initial_cash_usd=10_000),
+            strategy_factory=lambda: SmaCrossStrategy(short_window=2, long_window=3),
+            notifier=NoOpNotifier(),
+            candles_by_symbol={
+                "AAPL": _candles("AAPL"),
+                "MSFT": _candles("MSFT", msft_closes or [c * 2 for c in reversed(CLOSES)]),
+            },
+            quantity=1,
+            tick_seconds=60,
+            max_position_qty=1,
+            checkpoint=self._store(),
+        )
+
+    def test_multi_symbol_round_trip(self) -> None:
+        first = self._multi()
+        for _ in range(6):
+            first.run_once()
+        resumed = self._multi()
+        resumed.checkpoint.restore(resumed)
+
+        before, after = first.status(), resumed.status()
+        for key in ("cash", "equity", "trades", "loop_count", "per_symbol"):
+            self.assertEqual(after[key], before[key])
+
+    def test_multi_symbol_restore_changes_nothing_when_one_symbol_is_rejected(self) -> None:
+        first = self._multi()
+        for _ in range(6):
+            first.run_once()
+        self.assertTrue(first.checkpoint.save(first))
+
+        # MSFT's candles changed, so the whole restore is refused; AAPL must stay fresh too.
+        resumed = self._multi(msft_closes=CLOSES)
+        before = resumed.status()
+        with self.assertRaises(CheckpointError):
+            resumed.checkpoint.restore(resumed)
+        self.assertEqual(resumed.status()["per_symbol"], before["per_symbol"])
+        self.assertEqual(resumed.bots["AAPL"].export_state(), self._multi().bots["AAPL"].export_state())
+
+
+if __name__ == "__main__":
+    unittest.main()
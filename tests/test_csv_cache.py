@@ -0,0 +1,80 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from namoo_overseas_bot.market_data.cache import cache_path_for, load_cached_candle_series, read_cache
+from namoo_overseas_bot.market_data.csv_feed import load_candle_series
+
+CSV_PATH = "data/sample_us_stock.csv"
+
+
+class CsvCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv = Path(self._tmp.name) / "bars.csv"
+        shutil.copyfile(CSV_PATH, self.csv)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_first_load_writes_cache_and_second_load_maps_it(self) -> None:
+        expected = list(load_candle_series(self.csv, symbol="AAPL"))
+
+        first = load_cached_candle_series(self.csv, symbol="AAPL")
+        self.assertTrue(cache_path_for(self.csv).exists())
+        self.assertEqual(list(first), expected)
+
+        second = load_cached_candle_series(self.csv, symbol="AAPL")
+        self.assertIsInstance(second.close, memoryview)
+        self.assertTrue(second.close.readonly)
+        self.assertEqual(list(second), expected)
+        self.assertEqual(second.timestamp_at(0), "2025-12-01")
+
+    def test_rows_with_their_own_timestamp_strings_skip_the_cache(self) -> None:
+        self.csv.write_text(
+            "timestamp,open,high,low,close,volume\n"
+            "2024-03-08T09:30:00-05:00,1,1,1,1,1\n"
+            "2024-03-11T09:30:00-04:00,2,2,2,2,1\n",
+            encoding="utf-8",
+        )
+        series = load_cached_candle_series(self.csv, symbol="AAPL")
+        self.assertFalse(cache_path_for(self.csv).exists())
+        self.assertEqual(series.timestamp_at(1), "2024-03-11T09:30:00-04:00")
+
+    def test_modified_source_invalidates_cache(self) -> None:
+        load_cached_candle_series(self.csv, symbol="AAPL")
+        with self.csv.open("a", encoding="utf-8") as f:
+            f.write("2026-02-01,1,2,0.5,1.5,10\n")
+
+        self.assertIsNone(read_cache(cache_path_for(self.csv), self.csv, "AAPL"))
+        series = load_cached_candle_series(self.csv, symbol="AAPL")
+        self.assertEqual(series[-1].close, 1.5)
+        self.assertIsInstance(load_cached_candle_series(self.csv, symbol="AAPL").close, memoryview)
+
+    def test_same_size_edit_with_restored_mtime_is_detected(self) -> None:
+        load_cached_candle_series(self.csv, symbol="AAPL")
+        stat = self.csv.stat()
+        data = self.csv.read_bytes().replace(b"2025-12-01,190", b"2025-12-01,180", 1)
+        self.csv.write_bytes(data)
+        os.utime(self.csv, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        series = load_cached_candle_series(self.csv, symbol="AAPL")
+        self.assertEqual(series[0].open, 180.0)
+
+    def test_corrupt_cache_falls_back_to_csv(self) -> None:
+        cache_path_for(self.csv).write_bytes(b"garbage")
+        series = load_cached_candle_series(self.csv, symbol="AAPL")
+        self.assertEqual(len(series), 40)
+
+    def test_mapped_series_pickles_as_arrays(self) -> None:
+        load_cached_candle_series(self.csv, symbol="AAPL")
+        mapped = load_cached_candle_series(self.csv, symbol="AAPL")
+        restored = pickle.loads(pickle.dumps(mapped))
+        self.assertEqual(list(restored), list(mapped))
+
+
+if __name__ == "__main__":
+    unittest.main()
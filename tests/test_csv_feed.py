@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.csv_feed import (
+    iter_candle_chunks,
+    iter_candles,
+    load_candle_series,
+    load_candles,
+)
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+CSV_PATH = "data/sample_us_stock.csv"
+
+
+class StreamingCsvTests(unittest.TestCase):
+    def test_iter_candles_is_lazy_and_matches_loader(self) -> None:
+        stream = iter_candles(CSV_PATH, symbol="AAPL")
+        first = next(stream)
+        self.assertEqual(first.timestamp, "2025-12-01")
+        self.assertEqual([first, *stream], load_candles(CSV_PATH, symbol="AAPL"))
+
+    def test_chunks_cover_file_in_order(self) -> None:
+        chunks = list(iter_candle_chunks(CSV_PATH, symbol="AAPL", chunk_size=7))
+        self.assertTrue(all(len(chunk) <= 7 for chunk in chunks))
+        flattened = [candle for chunk in chunks for candle in chunk]
+        self.assertEqual(flattened, list(load_candle_series(CSV_PATH, symbol="AAPL")))
+
+    def test_reordered_columns_quotes_and_blank_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bars.csv"
+            path.write_text(
+                "close,timestamp,volume,open,high,low\r\n"
+                "10.5,2026-01-01T00:00:00Z,100,10,11,9\r\n"
+                "\r\n"
+                '"11.5","2026-01-01T00:01:00Z","200","10.5","12","10"\r\n',
+                encoding="utf-8",
+            )
+            candles = load_candles(path, symbol="MSFT")
+
+        self.assertEqual([c.close for c in candles], [10.5, 11.5])
+        self.assertEqual(candles[1].timestamp, "2026-01-01T00:01:00Z")
+        self.assertEqual(candles[1].volume, 200.0)
+
+    def test_whitespace_lines_and_quoted_newlines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bars.csv"
+            path.write_text(
+                "timestamp,open,high,low,close,volume,note\n"
+                "2026-01-01T00:00:00Z,10,11,9,10.5,100,\n"
+                "   \n"
+                '2026-01-01T00:01:00Z,10.5,12,10,11.5,200,"halted\nthen resumed"\n'
+                "  \t \n"
+                "2026-01-01T00:02:00Z,11.5,12,11,11,300,\n",
+                encoding="utf-8",
+            )
+            candles = load_candles(path, symbol="MSFT")
+            series = load_candle_series(path, symbol="MSFT")
+
+        self.assertEqual([c.close for c in candles], [10.5, 11.5, 11.0])
+        self.assertEqual(list(series), candles)
+
+    def test_missing_column_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bars.csv"
+            path.write_text("timestamp,close\n2026-01-01,1\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                list(iter_candles(path, symbol="MSFT"))
+
+    def test_engine_consumes_stream_and_reports_fills_as_they_happen(self) -> None:
+        fills = []
+        result = TradingEngine(
+            broker=PaperBroker(initial_cash_usd=10_000),
+            strategy=SmaCrossStrategy(short_window=5, long_window=20),
+            symbol="AAPL",
+            quantity=1,
+        ).run(iter_candles(CSV_PATH, symbol="AAPL"), on_fill=fills.append)
+
+        self.assertEqual(len(fills), result.trades)
+        self.assertGreater(result.trades, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
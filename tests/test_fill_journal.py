@@ -0,0 +1,134 @@
+import json
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from namoo_overseas_bot.brokers.journal import FillJournal, JournalError
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.models import Order, Side
+
+
+def _trade(broker: PaperBroker, count: int) -> None:
+    for idx in range(count):
+        side = Side.BUY if idx % 2 == 0 else Side.SELL
+        price = 100 + (idx % 7) * 0.37
+        broker.submit_order(Order(symbol="AAPL", side=side, qty=2), price=price, timestamp=f"t{idx}")
+
+
+class FillJournalTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "state" / "fills.jsonl"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _broker(self, *, compact_every: int = 1000, initial_cash: float = 10_000) -> PaperBroker:
+        journal = FillJournal(self.path, compact_every=compact_every)
+        self.addCleanup(journal.close)
+        return PaperBroker(initial_cash_usd=initial_cash, journal=journal)
+
+    def test_restart_restores_cash_and_positions(self) -> None:
+        broker = self._broker()
+        _trade(broker, 5)
+        broker.submit_order(Order(symbol="MSFT", side=Side.BUY, qty=1), price=300, timestamp="t9")
+        self.assertTrue(broker._journal.flush())
+
+        # The starting cash is pinned by the first snapshot, not by the new config.
+        restored = self._broker(initial_cash=1)
+        self.assertEqual(restored.cash_balance(), broker.cash_balance())
+        self.assertEqual(restored.position_qty("AAPL"), broker.position_qty("AAPL"))
+        self.assertEqual(restored.position_qty("MSFT"), 1)
+
+    def test_compaction_bounds_replayed_records(self) -> None:
+        broker = self._broker(compact_every=10)
+        _trade(broker, 45)
+        journal = broker._journal
+        self.assertTrue(journal.flush())
+
+        stats = journal.stats()
+        self.assertEqual(stats["seq"], 45)
+        self.assertEqual(stats["durable_seq"], 45)
+        self.assertEqual(stats["snapshots"], 4)
+        self.assertEqual(len(self.path.read_text().splitlines()), 5)
+        snapshot = json.loads(self.path.with_name("fills.jsonl.snapshot").read_text())
+        self.assertEqual(snapshot["seq"], 40)
+
+        journal.close()
+        reopened = FillJournal(self.path, compact_every=10)
+        self.addCleanup(reopened.close)
+        state = reopened.restore(0)
+        self.assertEqual(state.seq, 45)
+        self.assertEqual(len(state.fills), 5)
+
+    def test_torn_tail_is_dropped_and_log_stays_appendable(self) -> None:
+        broker = self._broker()
+        _trade(broker, 3)
+        self.assertTrue(broker._journal.flush())
+        broker._journal.close()
+        with open(self.path, "ab") as fh:
+            fh.write(b'{"seq":4,"symbol":"AAPL","si')
+
+        restored = self._broker()
+        self.assertEqual(restored.cash_balance(), broker.cash_balance())
+        self.assertEqual(restored.position_qty("AAPL"), 2)
+
+        restored.submit_order(Order(symbol="AAPL", side=Side.SELL, qty=1), price=50, timestamp="t")
+        self.assertTrue(restored._journal.flush())
+        restored._journal.close()
+        self.assertEqual(self._broker().position_qty("AAPL"), 1)
+
+    def test_failed_write_is_cut_off_and_retried_in_order(self) -> None:
+        journal = FillJournal(self.path, retry_seconds=0.01)
+        self.addCleanup(journal.close)
+        broker = PaperBroker(initial_cash_usd=10_000, journal=journal)
+        _trade(broker, 3)
+        self.assertTrue(journal.flush())
+
+        failing = True
+        real_write = os.write
+
+        def disk_full(fd: int, data: bytes) -> int:
+            if fd == journal._fd and failing:
+                # Half a record reaches the file before the error.
+                real_write(fd, bytes(data[:10]))
+                raise OSError(28, "No space left on device")
+            return real_write(fd, data)
+
+        with mock.patch("namoo_overseas_bot.brokers.journal.os.write", disk_full):
+            _trade(broker, 2)
+            self.assertFalse(journal.flush(timeout=0.2))
+            stats = journal.stats()
+            self.assertEqual(stats["durable_seq"], 3)
+            self.assertEqual(stats["pending"], 2)
+            self.assertIn("No space left", stats["last_error"])
+
+            failing = False
+            self.assertTrue(journal.flush())
+        self.assertEqual(journal.stats()["durable_seq"], 5)
+        journal.close()
+
+        lines = self.path.read_text().splitlines()
+        self.assertEqual([json.loads(line)["seq"] for line in lines], [1, 2, 3, 4, 5])
+        restored = self._broker()
+        self.assertEqual(restored.cash_balance(), broker.cash_balance())
+        self.assertEqual(restored.position_qty("AAPL"), broker.position_qty("AAPL"))
+
+    def test_corrupt_record_is_reported(self) -> None:
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text("not json\n")
+        journal = FillJournal(self.path)
+        with self.assertRaises(JournalError):
+            journal.restore(1000)
+
+    def test_append_requires_restore(self) -> None:
+        broker = PaperBroker(initial_cash_usd=1000)
+        fill = broker.submit_order(Order(symbol="AAPL", side=Side.BUY, qty=1), price=10, timestamp="t")
+        with self.assertRaises(JournalError):
+            FillJournal(self.path).append(fill)
+
+
+if __name__ == "__main__":
+    unittest.main()
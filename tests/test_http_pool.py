@@ -0,0 +1,219 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import socket
+import threading
+import unittest
+
+from namoo_overseas_bot.http_pool import HttpPoolError, KeepAliveHttpClient
+from namoo_overseas_bot.notifiers.telegram import TelegramNotifier
+from namoo_overseas_bot.runtime.telegram_commands import (
+    TelegramCommandHandler,
+    TelegramCommandPoller,
+)
+
+
+class _StandInTelegram:
+    """Bot API stand-in speaking HTTP/1.1 keep-alive, counting TCP connections."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.sent: list[str] = []
+        self.drop_after_response = False
+        # Read the next request, then close without answering.
+        self.drop_next_request = False
+        self.dropped = threading.Event()
+        self.gets = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                stand_in.connections += 1
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A003
+                return
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length", "0"))
+                payload = json.loads(self.rfile.read(length))
+                stand_in.sent.append(payload["text"])
+                if not self._dropped():
+                    self._reply({"ok": True, "result": {}})
+
+            def do_GET(self) -> None:  # noqa: N802
+                stand_in.gets += 1
+                if self._dropped():
+                    return
+                self._reply(
+                    {
+                        "ok": True,
+                        "result": [
+                            {
+                                "update_id": 7,
+                                "message": {"chat": {"id": 1}, "text": "/status"},
+                            }
+                        ],
+                    }
+                )
+
+            def _reply(self, payload: dict[str, object]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                if stand_in.drop_after_response:
+                    # Close silently, like a proxy reaping an idle keep-alive socket.
+                    self._close_now()
+
+            def _dropped(self) -> bool:
+                if not stand_in.drop_next_request:
+                    return False
+                stand_in.drop_next_request = False
+                self._close_now()
+                return True
+
+            def _close_now(self) -> None:
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_WR)
+                stand_in.dropped.set()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.server.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _StatusBot:
+    def status(self) -> dict[str, object]:
+        return {
+            "running": True,
+            "paused": False,
+            "symbol": "AAPL",
+            "trades": 0,
+            "position_qty": 0,
+            "cash": 1.0,
+            "equity": 1.0,
+            "last_signal": "HOLD",
+            "last_price": 1.0,
+            "last_candle_timestamp": "",
+        }
+
+    def pause(self) -> None: ...
+
+    def resume(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+class KeepAliveHttpClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        try:
+            self.api = _StandInTelegram()
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+        self.addCleanup(self.api.close)
+
+    def test_notifier_reuses_one_connection(self) -> None:
+        client = KeepAliveHttpClient(self.api.base_url)
+        notifier = TelegramNotifier(
+            bot_token="t", chat_id="1", api_base_url=self.api.base_url, http_client=client
+        )
+        for idx in range(20):
+            notifier.send(f"msg {idx}")
+        client.close()
+
+        self.assertEqual(self.api.sent, [f"msg {i}" for i in range(20)])
+        self.assertEqual(self.api.connections, 1)
+        self.assertEqual(client.connections_opened, 1)
+        self.assertEqual(client.requests_sent, 20)
+
+    def test_reconnects_when_server_drops_idle_connection(self) -> None:
+        self.api.drop_after_response = True
+        client = KeepAliveHttpClient(self.api.base_url)
+        notifier = TelegramNotifier(
+            bot_token="t", chat_id="1", api_base_url=self.api.base_url, http_client=client
+        )
+        for idx in range(3):
+            notifier.send(f"msg {idx}")
+            self.assertTrue(self.api.dropped.wait(5))
+            self.api.dropped.clear()
+
+        self.assertEqual(self.api.sent, ["msg 0", "msg 1", "msg 2"])
+        self.assertEqual(self.api.connections, 3)
+        self.assertEqual(client.connections_opened, 3)
+
+    def test_post_that_may_have_been_processed_is_not_resent(self) -> None:
+        client = KeepAliveHttpClient(self.api.base_url)
+        notifier = TelegramNotifier(
+            bot_token="t", chat_id="1", api_base_url=self.api.base_url, http_client=client
+        )
+        notifier.send("first")
+        self.api.drop_next_request = True
+        with self.assertRaises(RuntimeError):
+            notifier.send("order")
+        client.close()
+
+        self.assertEqual(self.api.sent, ["first", "order"])
+        self.assertEqual(client.connections_opened, 1)
+
+    def test_idempotent_request_is_retried_on_a_fresh_connection(self) -> None:
+        client = KeepAliveHttpClient(self.api.base_url)
+        client.request("GET", "/getUpdates")
+        self.api.drop_next_request = True
+        response = client.request("GET", "/getUpdates")
+        client.close()
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(self.api.gets, 3)
+        self.assertEqual(client.connections_opened, 2)
+
+    def test_poller_and_notifier_share_the_pool(self) -> None:
+        client = KeepAliveHttpClient(self.api.base_url)
+        notifier = TelegramNotifier(
+            bot_token="t", chat_id="1", api_base_url=self.api.base_url, http_client=client
+        )
+        poller = TelegramCommandPoller(
+            bot_token="t",
+            allowed_chat_id="1",
+            notifier=notifier,
+            handler=TelegramCommandHandler(bot=_StatusBot()),
+            api_base_url=self.api.base_url,
+            http_client=client,
+        )
+        for _ in range(3):
+            updates = poller._get_updates(offset=0, timeout=0)
+            for reply in poller.handle_updates(updates):
+                notifier.send(reply)
+        client.close()
+
+        self.assertEqual(len(self.api.sent), 3)
+        self.assertTrue(self.api.sent[0].startswith("[상태]"))
+        self.assertEqual(self.api.connections, 1)
+
+    def test_base_url_path_prefix_is_kept(self) -> None:
+        client = KeepAliveHttpClient(self.api.base_url + "/proxy/")
+        self.assertEqual(client.path_prefix, "/proxy")
+
+    def test_connection_refused_raises_pool_error(self) -> None:
+        self.api.close()
+        client = KeepAliveHttpClient(self.api.base_url, timeout_seconds=1)
+        with self.assertRaises(HttpPoolError):
+            client.request("GET", "/")
+
+    def test_rejects_unsupported_scheme(self) -> None:
+        with self.assertRaises(ValueError):
+            KeepAliveHttpClient("ftp://example.com")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+from fractions import Fraction
+import math
+import random
+import statistics
+import unittest
+
+from namoo_overseas_bot.indicators import (
+    AverageTrueRange,
+    BollingerBands,
+    ExponentialMovingAverage,
+    RelativeStrengthIndex,
+    RollingVariance,
+    SimpleMovingAverage,
+)
+from namoo_overseas_bot.models import Signal
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+def _random_walk(n: int, seed: int = 7) -> list[float]:
+    rng = random.Random(seed)
+    price = 100.0
+    prices: list[float] = []
+    for _ in range(n):
+        price = max(1.0, price + rng.gauss(0, 1))
+        prices.append(round(price, 2))
+    return prices
+
+
+class _NaiveSmaCross:
+    """The original list-copy implementation, kept as the reference.
+
+    Sums are exact (``Fraction``) so ties between the two SMAs are real ties
+    rather than artefacts of float summation order.
+    """
+
+    def __init__(self, short_window: int, long_window: int) -> None:
+        self.short_window = short_window
+        self.long_window = long_window
+        self._prices: list[Fraction] = []
+        self._last_signal = Signal.HOLD
+
+    def on_price(self, price: float) -> Signal:
+        self._prices.append(Fraction(str(price)))
+        self._prices = self._prices[-self.long_window :]
+        if len(self._prices) < self.long_window:
+            return Signal.HOLD
+
+        short_sma = sum(self._prices[-self.short_window :]) / self.short_window
+        long_sma = sum(self._prices) / self.long_window
+        if short_sma > long_sma and self._last_signal != Signal.BUY:
+            self._last_signal = Signal.BUY
+            return Signal.BUY
+        if short_sma < long_sma and self._last_signal != Signal.SELL:
+            self._last_signal = Signal.SELL
+            return Signal.SELL
+        return Signal.HOLD
+
+
+class SimpleMovingAverageTests(unittest.TestCase):
+    def test_matches_naive_window_mean(self) -> None:
+        prices = _random_walk(5000)
+        sma = SimpleMovingAverage(50)
+        for idx, price in enumerate(prices):
+            value = sma.update(price)
+            if idx < 49:
+                self.assertIsNone(value)
+                continue
+            expected = sum(prices[idx - 49 : idx + 1]) / 50
+            self.assertAlmostEqual(value, expected, places=9)
+
+    def test_rejects_non_positive_window(self) -> None:
+        with self.assertRaises(ValueError):
+            SimpleMovingAverage(0)
+
+
+class ExponentialMovingAverageTests(unittest.TestCase):
+    def test_matches_naive_recursion(self) -> None:
+        prices = _random_walk(500)
+        ema = ExponentialMovingAverage(10)
+        alpha = 2.0 / 11
+        expected = sum(prices[:10]) / 10
+        for idx, price in enumerate(prices):
+            value = ema.update(price)
+            if idx < 9:
+                self.assertIsNone(value)
+                continue
+            if idx > 9:
+                expected = alpha * price + (1 - alpha) * expected
+            self.assertAlmostEqual(value, expected, places=9)
+
+
+class RollingVarianceTests(unittest.TestCase):
+    def test_matches_statistics_pvariance(self) -> None:
+        prices = _random_walk(3000)
+        variance = RollingVariance(20)
+        for idx, price in enumerate(prices):
+            value = variance.update(price)
+            if idx < 19:
+                self.assertIsNone(value)
+                continue
+            expected = statistics.pvariance(prices[idx - 19 : idx + 1])
+            self.assertAlmostEqual(value, expected, places=7)
+
+    def test_bollinger_bands_use_population_stddev(self) -> None:
+        prices = _random_walk(200)
+        bands = BollingerBands(window=20, num_std=2.0)
+        for price in prices:
+            bands.update(price)
+        window = prices[-20:]
+        middle = statistics.fmean(window)
+        width = 2.0 * statistics.pstdev(window)
+        self.assertAlmostEqual(bands.value.middle, middle, places=9)
+        self.assertAlmostEqual(bands.value.upper, middle + width, places=7)
+        self.assertAlmostEqual(bands.value.lower, middle - width, places=7)
+
+
+class WilderIndicatorTests(unittest.TestCase):
+    def test_rsi_matches_naive_wilder(self) -> None:
+        prices = _random_walk(400)
+        rsi = RelativeStrengthIndex(14)
+        values = [rsi.update(p) for p in prices]
+
+        changes = [b - a for a, b in zip(prices, prices[1:])]
+        avg_gain = sum(max(c, 0.0) for c in changes[:14]) / 14
+        avg_loss = sum(max(-c, 0.0) for c in changes[:14]) / 14
+        for idx, change in enumerate(changes[14:], start=15):
+            avg_gain = (avg_gain * 13 + max(change, 0.0)) / 14
+            avg_loss = (avg_loss * 13 + max(-change, 0.0)) / 14
+            expected = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            self.assertAlmostEqual(values[idx], expected, places=7)
+        self.assertTrue(all(v is None for v in values[:14]))
+
+    def test_atr_matches_naive_wilder(self) -> None:
+        closes = _random_walk(300)
+        highs = [c + 0.5 for c in closes]
+        lows = [c - 0.7 for c in closes]
+        atr = AverageTrueRange(14)
+        values = [atr.update(h, l, c) for h, l, c in zip(highs, lows, closes)]
+
+        true_ranges = [highs[0] - lows[0]]
+        for idx in range(1, len(closes)):
+            prev = closes[idx - 1]
+            true_ranges.append(
+                max(highs[idx] - lows[idx], abs(highs[idx] - prev), abs(lows[idx] - prev))
+            )
+        expected = sum(true_ranges[:14]) / 14
+        self.assertAlmostEqual(values[13], expected, places=9)
+        for idx in range(14, len(closes)):
+            expected = (expected * 13 + true_ranges[idx]) / 14
+            self.assertTrue(math.isclose(values[idx], expected, rel_tol=1e-9))
+
+
+class SmaCrossEquivalenceTests(unittest.TestCase):
+    def test_signals_match_naive_implementation(self) -> None:
+        prices = _random_walk(20000, seed=11)
+        for short_window, long_window in [(2, 3), (5, 20), (50, 200)]:
+            fast = SmaCrossStrategy(short_window=short_window, long_window=long_window)
+            naive = _NaiveSmaCross(short_window=short_window, long_window=long_window)
+            fast_signals = [fast.on_price(p) for p in prices]
+            naive_signals = [naive.on_price(p) for p in prices]
+            mismatches = [
+                idx for idx, (a, b) in enumerate(zip(fast_signals, naive_signals)) if a != b
+            ]
+            self.assertEqual(mismatches, [], f"windows=({short_window}, {long_window})")
+
+
+if __name__ == "__main__":
+    unittest.main()
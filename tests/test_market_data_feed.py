@@ -0,0 +1,171 @@
+import http.client
+import json
+import time
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.market_data.feed import HttpFeedServer, QueueFeed, ReplayFeed, SyntheticFeed
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+def _candle(close: float, idx: int = 0, symbol: str = "AAPL") -> Candle:
+    return Candle(symbol, f"2026-01-{idx + 1:02d}", close, close, close, close, 1)
+
+
+def _bot(**kwargs: object) -> PaperTradingBot:
+    options: dict = {
+        "broker": PaperBroker(initial_cash_usd=10_000),
+        "strategy": SmaCrossStrategy(short_window=2, long_window=3),
+        "notifier": NoOpNotifier(),
+        "symbol": "AAPL",
+        "quantity": 1,
+        "tick_seconds": 30,
+        "max_position_qty": 1,
+        **kwargs,
+    }
+    return PaperTradingBot(**options)
+
+
+class FeedTests(unittest.TestCase):
+    def test_replay_feed_loops_or_ends(self) -> None:
+        candles = [_candle(c, i) for i, c in enumerate([1, 2, 3])]
+        looping = ReplayFeed(candles)
+        self.assertEqual([looping.poll().close for _ in range(5)], [1, 2, 3, 1, 2])  # type: ignore[union-attr]
+
+        once = ReplayFeed(candles, loop=False)
+        self.assertEqual([once.poll() for _ in range(4)][-1], None)
+        self.assertTrue(once.exhausted)
+
+    def test_synthetic_feed_is_seeded_and_well_formed(self) -> None:
+        feed_a, feed_b = SyntheticFeed("SYN", seed=7), SyntheticFeed("SYN", seed=7)
+        bars = [feed_a.poll() for _ in range(200)]
+        self.assertEqual(bars, [feed_b.poll() for _ in range(200)])
+        self.assertNotEqual(bars, [SyntheticFeed("SYN", seed=8).poll() for _ in range(200)])
+        for bar in bars:
+            self.assertLessEqual(bar.low, min(bar.open, bar.close))
+            self.assertGreaterEqual(bar.high, max(bar.open, bar.close))
+        self.assertLess(bars[0].timestamp, bars[1].timestamp)
+
+    def test_queue_feed_orders_bounds_and_notifies(self) -> None:
+        feed = QueueFeed("AAPL", max_queue_size=2)
+        wakeups: list[int] = []
+        feed.add_listener(lambda: wakeups.append(1))
+        for idx, close in enumerate([1.0, 2.0, 3.0]):
+            feed.publish(_candle(close, idx))
+
+        self.assertEqual(len(wakeups), 3)
+        self.assertEqual([feed.poll().close, feed.poll().close], [2.0, 3.0])  # type: ignore[union-attr]
+        self.assertIsNone(feed.poll())
+        self.assertEqual(feed.stats().dropped, 1)
+        self.assertIsNone(feed.next_candle(timeout=0.01))
+        with self.assertRaises(ValueError):
+            feed.publish(_candle(1.0, symbol="MSFT"))
+
+        feed.close()
+        self.assertTrue(feed.exhausted)
+        with self.assertRaises(ValueError):
+            feed.publish(_candle(1.0))
+
+    def test_http_stand_in_publishes_posted_bars(self) -> None:
+        feed = QueueFeed("AAPL")
+        try:
+            server = HttpFeedServer(feed).start()
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+        self.addCleanup(server.close)
+        host, port = server.base_url.removeprefix("http://").split(":")
+
+        def post(payload: object) -> int:
+            conn = http.client.HTTPConnection(host, int(port), timeout=5)
+            conn.request("POST", "/candles", body=json.dumps(payload))
+            status = conn.getresponse().status
+            conn.close()
+            return status
+
+        self.assertEqual(post({"timestamp": "2026-01-01", "close": 10}), 200)
+        self.assertEqual(post([{"timestamp": "2026-01-02", "close": 11, "volume": 5}]), 200)
+        self.assertEqual(post({"timestamp": "2026-01-03"}), 400)
+        self.assertEqual(post({"timestamp": "2026-01-03", "close": 1, "symbol": "MSFT"}), 400)
+        for length in ("abc", "-1"):
+            conn = http.client.HTTPConnection(host, int(port), timeout=5)
+            conn.request("POST", "/candles", body=b'{"close": 1}', headers={"Content-Length": length})
+            self.assertEqual(conn.getresponse().status, 400)
+            conn.close()
+
+        bars = [feed.poll(), feed.poll()]
+        self.assertEqual([b.close for b in bars], [10.0, 11.0])  # type: ignore[union-attr]
+        self.assertEqual(bars[1].volume, 5.0)  # type: ignore[union-attr]
+        self.assertIsNone(feed.poll())
+
+    def test_http_feed_server_requires_the_api_token_when_set(self) -> None:
+        feed = QueueFeed("AAPL")
+        try:
+            server = HttpFeedServer(feed, api_token="secret").start()
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+        self.addCleanup(server.close)
+        host, port = server.base_url.removeprefix("http://").split(":")
+
+        def post(headers: dict[str, str]) -> int:
+            body = json.dumps({"timestamp": "2026-01-01", "close": 10})
+            conn = http.client.HTTPConnection(host, int(port), timeout=5)
+            conn.request("POST", "/candles", body=body, headers=headers)
+            status = conn.getresponse().status
+            conn.close()
+            return status
+
+        self.assertEqual(post({}), 401)
+        self.assertEqual(post({"X-API-Token": "wrong"}), 401)
+        self.assertIsNone(feed.poll())
+        self.assertEqual(post({"X-API-Token": "secret"}), 200)
+        self.assertEqual(post({"Authorization": "Bearer secret"}), 200)
+        self.assertEqual(len([feed.poll(), feed.poll()]), 2)
+
+
+class FeedDrivenBotTests(unittest.TestCase):
+    def test_bot_reacts_to_live_bars_without_waiting_for_the_tick(self) -> None:
+        feed = QueueFeed("AAPL")
+        bot = _bot(feed=feed)
+        bot.start()
+        self.addCleanup(bot.stop)
+
+        started = time.monotonic()
+        for idx, close in enumerate([10, 11, 12, 13]):
+            feed.publish(_candle(close, idx))
+        while bot.status()["loop_count"] < 4 and time.monotonic() - started < 5:
+            time.sleep(0.005)
+
+        self.assertEqual(bot.status()["loop_count"], 4)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(bot.status()["last_price"], 13)
+
+    def test_pull_feed_matches_candle_list(self) -> None:
+        candles = [_candle(c, i) for i, c in enumerate([10, 11, 12, 13, 9, 8, 7, 14])]
+        from_list = _bot(candles=candles)
+        from_feed = _bot(feed=ReplayFeed(candles))
+        for _ in range(len(candles)):
+            from_list.run_once()
+            from_feed.run_once()
+        self.assertEqual(from_feed.status()["trades"], from_list.status()["trades"])
+        self.assertEqual(from_feed.status()["cash"], from_list.status()["cash"])
+
+    def test_live_feed_with_no_bar_is_a_no_op(self) -> None:
+        bot = _bot(feed=QueueFeed("AAPL"))
+        self.assertFalse(bot.process_next_candle())
+        bot.run_once()
+        self.assertEqual(bot.status()["loop_count"], 0)
+
+    def test_rejects_ambiguous_or_mismatched_sources(self) -> None:
+        with self.assertRaises(ValueError):
+            _bot(candles=[_candle(1)], feed=QueueFeed("AAPL"))
+        with self.assertRaises(ValueError):
+            _bot()
+        with self.assertRaises(ValueError):
+            _bot(feed=QueueFeed("MSFT"))
+
+
+if __name__ == "__main__":
+    unittest.main()
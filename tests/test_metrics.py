@@ -0,0 +1,139 @@
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.metrics import BotMetrics, MetricsRegistry
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.api_server import ApiRouter
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+class _FailingNotifier:
+    def send(self, message: str) -> None:
+        raise RuntimeError("down")
+
+
+def _bot(notifier: object, metrics: BotMetrics) -> PaperTradingBot:
+    candles = [
+        Candle(
+            symbol="AAPL",
+            timestamp=f"2026-01-{idx + 1:02d}",
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for idx, close in enumerate([100, 101, 102, 103, 99, 98, 97, 104])
+    ]
+    return PaperTradingBot(
+        broker=PaperBroker(initial_cash_usd=10_000),
+        strategy=SmaCrossStrategy(short_window=2, long_window=3),
+        notifier=notifier,
+        symbol="AAPL",
+        quantity=1,
+        candles=candles,
+        tick_seconds=60,
+        max_position_qty=1,
+        metrics=metrics,
+    )
+
+
+def _samples(text: str) -> dict[str, float]:
+    samples: dict[str, float] = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_histogram_renders_cumulative_buckets(self) -> None:
+        registry = MetricsRegistry()
+        histogram = registry.histogram("op_seconds", "Op latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        text = registry.render()
+        self.assertIn("# TYPE op_seconds histogram", text)
+        samples = _samples(text)
+        self.assertEqual(samples['op_seconds_bucket{le="0.1"}'], 2)
+        self.assertEqual(samples['op_seconds_bucket{le="1"}'], 3)
+        self.assertEqual(samples['op_seconds_bucket{le="+Inf"}'], 4)
+        self.assertEqual(samples["op_seconds_count"], 4)
+        self.assertAlmostEqual(samples["op_seconds_sum"], 3.65)
+
+    def test_labelled_counter_and_escaping(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("events_total", "Events.", ("kind",))
+        counter.labels(kind='a"b').inc()
+        counter.labels(kind='a"b').inc(2)
+        self.assertEqual(_samples(registry.render())['events_total{kind="a\\"b"}'], 3)
+
+        with self.assertRaises(ValueError):
+            counter.labels(other="x")
+
+    def test_gauge_reads_source_at_render_time(self) -> None:
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("queue_depth", "Depth.", lambda: depth[0])
+        depth[0] = 7
+        self.assertEqual(_samples(registry.render())["queue_depth"], 7)
+
+    def test_registration_is_idempotent_per_type(self) -> None:
+        registry = MetricsRegistry()
+        first = registry.counter("x_total", "X.")
+        self.assertIs(registry.counter("x_total", "X."), first)
+        with self.assertRaises(ValueError):
+            registry.histogram("x_total", "X.")
+
+
+class BotMetricsTests(unittest.TestCase):
+    def test_bot_records_hot_path_metrics(self) -> None:
+        metrics = BotMetrics()
+        bot = _bot(NoOpNotifier(), metrics)
+        for _ in range(8):
+            bot.process_next_candle()
+        status = bot.status()
+
+        samples = _samples(metrics.render())
+        self.assertEqual(samples["namoo_process_next_candle_seconds_count"], 8)
+        self.assertEqual(samples["namoo_strategy_on_price_seconds_count"], 8)
+        self.assertEqual(samples["namoo_broker_submit_order_seconds_count"], status["trades"])
+        fills = sum(v for k, v in samples.items() if k.startswith("namoo_fills_total"))
+        self.assertEqual(fills, status["trades"])
+        self.assertEqual(samples['namoo_signals_total{symbol="AAPL",signal="buy"}'], 2)
+        self.assertEqual(samples['namoo_signals_total{symbol="AAPL",signal="sell"}'], 1)
+
+    def test_notifier_failures_are_counted(self) -> None:
+        metrics = BotMetrics()
+        bot = _bot(_FailingNotifier(), metrics)
+        bot.pause()
+        samples = _samples(metrics.render())
+        self.assertEqual(samples['namoo_errors_total{source="notifier"}'], 1)
+        self.assertEqual(samples["namoo_notifier_send_seconds_count"], 1)
+
+    def test_loop_drift_only_counts_lateness(self) -> None:
+        metrics = BotMetrics()
+        metrics.record_loop_drift(0.25)
+        metrics.record_loop_drift(-0.1)
+        samples = _samples(metrics.render())
+        self.assertEqual(samples["namoo_loop_iterations_total"], 2)
+        self.assertAlmostEqual(samples["namoo_loop_drift_seconds_total"], 0.25)
+
+    def test_router_serves_prometheus_text_behind_auth(self) -> None:
+        metrics = BotMetrics()
+        bot = _bot(NoOpNotifier(), metrics)
+        router = ApiRouter(bot, telegram_commands=None, api_token="secret", metrics=metrics)
+
+        self.assertEqual(router.handle("GET", "/metrics", {}).code, 401)
+        response = router.handle("GET", "/metrics", {"Authorization": "Bearer secret"})
+        self.assertEqual(response.code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        self.assertIn(b"namoo_process_next_candle_seconds", response.body())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.multi_bot import MultiSymbolTradingBot
+from namoo_overseas_bot.runtime.telegram_commands import TelegramCommandHandler
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+def _candles(symbol: str, values: list[float]) -> list[Candle]:
+    return [
+        Candle(
+            symbol=symbol,
+            timestamp=f"2026-01-{idx + 1:02d}T00:00:00Z",
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for idx, close in enumerate(values)
+    ]
+
+
+def _bot(broker: PaperBroker) -> MultiSymbolTradingBot:
+    return MultiSymbolTradingBot(
+        broker=broker,
+        strategy_factory=lambda: SmaCrossStrategy(short_window=2, long_window=3),
+        notifier=NoOpNotifier(),
+        candles_by_symbol={
+            "AAPL": _candles("AAPL", [100, 101, 102, 103, 99, 98, 97, 104]),
+            "MSFT": _candles("MSFT", [300, 299, 298, 305, 310, 311, 290, 280]),
+        },
+        quantity=1,
+        tick_seconds=1,
+        max_position_qty=1,
+    )
+
+
+class MultiSymbolTradingBotTests(unittest.TestCase):
+    def test_symbols_share_broker_cash_and_keep_own_state(self) -> None:
+        broker = PaperBroker(initial_cash_usd=10_000)
+        bot = _bot(broker)
+
+        for _ in range(4):
+            bot.process_tick()
+
+        status = bot.status()
+        self.assertEqual(status["symbols"], ["AAPL", "MSFT"])
+        self.assertEqual(status["loop_count"], 4)
+        per_symbol = status["per_symbol"]
+        self.assertEqual(per_symbol["AAPL"]["last_price"], 103)
+        self.assertEqual(per_symbol["MSFT"]["last_price"], 305)
+        self.assertEqual(per_symbol["AAPL"]["loop_count"], 4)
+
+        expected_cash = 10_000 - 102 - 305
+        self.assertEqual(broker.cash_balance(), expected_cash)
+        self.assertEqual(status["cash"], expected_cash)
+        self.assertEqual(status["equity"], expected_cash + 103 + 305)
+        self.assertEqual(status["trades"], 2)
+
+    def test_only_the_combined_status_is_published(self) -> None:
+        bot = _bot(PaperBroker(initial_cash_usd=10_000))
+        child_versions = [child.status_publisher.latest.version for child in bot.bots.values()]
+        combined_version = bot.status_publisher.latest.version
+
+        for _ in range(3):
+            bot.process_tick()
+
+        self.assertEqual(
+            [child.status_publisher.latest.version for child in bot.bots.values()], child_versions
+        )
+        self.assertGreater(bot.status_publisher.latest.version, combined_version)
+
+    def test_one_symbol_failing_does_not_stop_others(self) -> None:
+        broker = PaperBroker(initial_cash_usd=150)
+        bot = _bot(broker)
+
+        for _ in range(4):
+            bot.process_tick()
+
+        status = bot.status()
+        self.assertIn("insufficient cash", status["per_symbol"]["MSFT"]["last_error"])
+        self.assertEqual(status["per_symbol"]["AAPL"]["position_qty"], 1)
+        self.assertEqual(status["per_symbol"]["MSFT"]["loop_count"], 3)
+
+    def test_pause_resume_and_telegram_status(self) -> None:
+        bot = _bot(PaperBroker(initial_cash_usd=10_000))
+        bot.pause()
+        self.assertTrue(bot.status()["paused"])
+        bot.resume()
+        self.assertFalse(bot.status()["paused"])
+
+        bot.process_tick()
+        text = TelegramCommandHandler(bot=bot).handle("/status")
+        self.assertIn("AAPL,MSFT", text)
+        self.assertIn("- MSFT: position=0", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
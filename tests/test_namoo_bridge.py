@@ -0,0 +1,131 @@
+import http.client
+import threading
+import unittest
+
+from namoo_overseas_bot.brokers.bridge_standin import StandInBridge
+from namoo_overseas_bot.brokers.namoo_bridge import BridgeError, NamooBridgeBroker, OrderRejected
+from namoo_overseas_bot.models import Order, Side
+
+
+class NamooBridgeBrokerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        try:
+            self.bridge = StandInBridge(initial_cash_usd=1_000.0, api_token="secret").start()
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+        self.addCleanup(self.bridge.close)
+        self.broker = self._broker()
+
+    def _broker(self, **kwargs: object) -> NamooBridgeBroker:
+        options: dict = {
+            "base_url": self.bridge.base_url,
+            "account_no": "12345678",
+            "product_code": "01",
+            "api_token": "secret",
+            "retry_backoff_seconds": 0.0,
+            **kwargs,
+        }
+        broker = NamooBridgeBroker(**options)
+        self.addCleanup(broker.close)
+        return broker
+
+    def test_orders_and_account_share_one_connection(self) -> None:
+        fill = self.broker.submit_order(Order("AAPL", Side.BUY, 2), price=100.0, timestamp="t1")
+        self.assertEqual((fill.symbol, fill.side, fill.qty, fill.price), ("AAPL", Side.BUY, 2, 100.0))
+        self.broker.submit_order(Order("AAPL", Side.SELL, 1), price=110.0, timestamp="t2")
+
+        snapshot = self.broker.account_snapshot()
+        self.assertAlmostEqual(snapshot.cash, 910.0)
+        self.assertEqual(snapshot.positions, {"AAPL": 1})
+        self.assertEqual(self.broker.position_qty("MSFT"), 0)
+        self.assertEqual(self.bridge.connections, 1)
+        self.assertEqual(self.broker.stats().connections_opened, 1)
+
+    def test_lost_acknowledgement_is_retried_without_double_fill(self) -> None:
+        self.bridge.drop_next_responses(1)
+        fill = self.broker.submit_order(Order("AAPL", Side.BUY, 3), price=10.0, timestamp="t1")
+
+        self.assertEqual(fill.qty, 3)
+        self.assertEqual(self.bridge.orders_executed, 1)
+        self.assertEqual(self.bridge.broker.position_qty("AAPL"), 3)
+        self.assertGreaterEqual(self.bridge.requests, 2)
+
+    def test_reused_client_order_id_returns_original_result(self) -> None:
+        first = self.broker.submit_order(
+            Order("AAPL", Side.BUY, 1), price=10.0, timestamp="t1", client_order_id="fixed-1"
+        )
+        again = self.broker.submit_order(
+            Order("AAPL", Side.BUY, 1), price=10.0, timestamp="t1", client_order_id="fixed-1"
+        )
+        self.assertEqual(first, again)
+        self.assertEqual(self.bridge.orders_executed, 1)
+
+    def test_rejection_is_not_retried(self) -> None:
+        with self.assertRaises(OrderRejected):
+            self.broker.submit_order(Order("AAPL", Side.SELL, 1), price=10.0, timestamp="t1")
+        self.assertEqual(self.broker.stats().retries, 0)
+
+    def test_batch_is_one_request_and_reports_partial_fills(self) -> None:
+        fills = self.broker.submit_orders(
+            [Order("AAPL", Side.BUY, 1), Order("MSFT", Side.BUY, 2)],
+            {"AAPL": 100.0, "MSFT": 50.0},
+            "t1",
+        )
+        self.assertEqual([f.symbol for f in fills], ["AAPL", "MSFT"])
+        self.assertEqual(self.broker.stats().requests, 1)
+
+        with self.assertRaises(OrderRejected) as ctx:
+            self.broker.submit_orders(
+                [Order("AAPL", Side.SELL, 1), Order("NVDA", Side.SELL, 1)],
+                {"AAPL": 100.0, "NVDA": 10.0},
+                "t2",
+            )
+        self.assertEqual([f.symbol for f in ctx.exception.fills], ["AAPL"])
+        self.assertEqual(self.broker.positions(), {"MSFT": 2})
+
+    def test_status_query_covers_many_orders_in_one_round_trip(self) -> None:
+        ids = [self.broker.new_client_order_id() for _ in range(3)]
+        self.broker.submit_order(Order("AAPL", Side.BUY, 1), 10.0, "t1", client_order_id=ids[0])
+        with self.assertRaises(OrderRejected):
+            self.broker.submit_order(Order("AAPL", Side.SELL, 5), 10.0, "t2", client_order_id=ids[1])
+
+        before = self.bridge.requests
+        statuses = self.broker.order_statuses(ids)
+        self.assertEqual(self.bridge.requests, before + 1)
+        self.assertEqual([statuses[i].status for i in ids], ["filled", "rejected", "unknown"])
+        self.assertIsNotNone(statuses[ids[0]].fill)
+
+    def test_concurrent_orders_get_unique_ids(self) -> None:
+        def place() -> None:
+            for _ in range(10):
+                self.broker.submit_order(Order("AAPL", Side.BUY, 1), 1.0, "t")
+
+        threads = [threading.Thread(target=place) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.bridge.orders_executed, 40)
+        self.assertEqual(self.broker.position_qty("AAPL"), 40)
+
+    def test_bad_token_and_timeouts_raise_bridge_error(self) -> None:
+        with self.assertRaises(BridgeError):
+            self._broker(api_token="wrong").cash_balance()
+
+        self.bridge.latency_seconds = 0.2
+        slow = self._broker(timeout_seconds=0.05, max_attempts=2)
+        with self.assertRaises(BridgeError):
+            slow.cash_balance()
+        self.assertEqual(slow.stats().retries, 1)
+
+    def test_malformed_content_length_is_a_bad_request(self) -> None:
+        host, port = self.bridge.base_url.removeprefix("http://").split(":")
+        conn = http.client.HTTPConnection(host, int(port), timeout=5)
+        self.addCleanup(conn.close)
+        headers = {"Content-Length": "abc", "X-API-Token": "secret"}
+        conn.request("POST", "/orders", body=b"{}", headers=headers)
+        self.assertEqual(conn.getresponse().status, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
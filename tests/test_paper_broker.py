@@ -1,7 +1,8 @@
 import unittest
 
+from namoo_overseas_bot.brokers.namoo_stub import build_order_batch
 from namoo_overseas_bot.brokers.paper import PaperBroker
-from namoo_overseas_bot.models import Order, Side
+from namoo_overseas_bot.models import AccountSnapshot, Order, Side
 
 
 class PaperBrokerTests(unittest.TestCase):
@@ -21,6 +22,55 @@ class PaperBrokerTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             broker.submit_order(Order(symbol="AAPL", side=Side.SELL, qty=1), price=100, timestamp="t1")
 
+    def test_submit_orders_fills_the_whole_batch(self) -> None:
+        broker = PaperBroker(initial_cash_usd=1000)
+        broker.submit_order(Order(symbol="MSFT", side=Side.BUY, qty=2), price=100, timestamp="t0")
+
+        fills = broker.submit_orders(
+            [
+                Order(symbol="MSFT", side=Side.SELL, qty=2),
+                Order(symbol="AAPL", side=Side.BUY, qty=3),
+                Order(symbol="NVDA", side=Side.BUY, qty=1),
+            ],
+            prices={"MSFT": 150, "AAPL": 200, "NVDA": 300},
+            timestamp="t1",
+        )
+
+        self.assertEqual([(f.symbol, f.price) for f in fills], [("MSFT", 150), ("AAPL", 200), ("NVDA", 300)])
+        self.assertEqual(broker.positions(), {"AAPL": 3, "NVDA": 1})
+        self.assertEqual(broker.account_snapshot(), AccountSnapshot(cash=200, positions={"AAPL": 3, "NVDA": 1}))
+
+    def test_submit_orders_is_all_or_nothing(self) -> None:
+        broker = PaperBroker(initial_cash_usd=1000)
+        orders = [
+            Order(symbol="AAPL", side=Side.BUY, qty=3),
+            Order(symbol="NVDA", side=Side.BUY, qty=1),
+        ]
+        with self.assertRaises(ValueError):
+            broker.submit_orders(orders, prices={"AAPL": 200, "NVDA": 500}, timestamp="t1")
+        with self.assertRaises(ValueError):
+            broker.submit_orders(orders, prices={"AAPL": 200}, timestamp="t1")
+
+        self.assertEqual(broker.cash_balance(), 1000)
+        self.assertEqual(broker.positions(), {})
+
+    def test_builds_one_batch_payload(self) -> None:
+        orders = [Order(symbol="AAPL", side=Side.BUY, qty=1), Order(symbol="MSFT", side=Side.SELL, qty=2)]
+
+        payload = build_order_batch(
+            orders, {"AAPL": 190.5, "MSFT": 410}, "t1", account_no="123", product_code="01"
+        )
+        self.assertEqual(payload["account_no"], "123")
+        self.assertEqual(
+            payload["orders"],
+            [
+                {"symbol": "AAPL", "side": "buy", "qty": 1, "price": 190.5},
+                {"symbol": "MSFT", "side": "sell", "qty": 2, "price": 410},
+            ],
+        )
+        with self.assertRaises(ValueError):
+            build_order_batch(orders, {"AAPL": 190.5}, "t1", account_no="123", product_code="01")
+
 
 if __name__ == "__main__":
     unittest.main()
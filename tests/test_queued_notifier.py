@@ -0,0 +1,153 @@
+import threading
+import time
+import unittest
+
+from namoo_overseas_bot.notifiers.queued import QueuedNotifier
+from namoo_overseas_bot.runtime.api_server import ApiRouter
+
+
+class RecordingNotifier:
+    def __init__(self, delay_seconds: float = 0.0) -> None:
+        self.delay_seconds = delay_seconds
+        self.messages: list[str] = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def send(self, message: str) -> None:
+        self.gate.wait(5)
+        time.sleep(self.delay_seconds)
+        self.messages.append(message)
+
+
+class FailingNotifier:
+    def send(self, message: str) -> None:
+        raise RuntimeError("telegram send failed with status=429")
+
+
+class QueuedNotifierTests(unittest.TestCase):
+    def test_send_does_not_block_on_slow_inner_notifier(self) -> None:
+        inner = RecordingNotifier(delay_seconds=0.3)
+        notifier = QueuedNotifier(inner, min_interval_seconds=0.0, coalesce_seconds=0.0)
+        started = time.perf_counter()
+        for idx in range(20):
+            notifier.send(f"msg {idx}")
+        self.assertLess(time.perf_counter() - started, 0.1)
+        self.assertTrue(notifier.flush(timeout=5))
+        notifier.stop()
+        self.assertEqual("\n".join(inner.messages).splitlines(), [f"msg {i}" for i in range(20)])
+
+    def test_burst_is_coalesced_into_few_messages(self) -> None:
+        inner = RecordingNotifier()
+        notifier = QueuedNotifier(inner, min_interval_seconds=0.0, coalesce_seconds=0.05)
+        for idx in range(50):
+            notifier.send(f"signal {idx}")
+        notifier.stop()
+
+        self.assertLessEqual(len(inner.messages), 3)
+        stats = notifier.stats()
+        self.assertEqual(stats["sent_messages"], 50)
+        self.assertEqual(stats["sent_batches"], len(inner.messages))
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_batches_respect_message_size_limit(self) -> None:
+        inner = RecordingNotifier()
+        inner.gate.clear()
+        notifier = QueuedNotifier(
+            inner, min_interval_seconds=0.0, coalesce_seconds=0.0, max_batch_chars=100
+        )
+        notifier.send("warmup")
+        for _ in range(10):
+            notifier.send("x" * 30)
+        notifier.send("y" * 250)
+        inner.gate.set()
+        notifier.stop()
+
+        self.assertTrue(all(len(message) <= 100 for message in inner.messages))
+        self.assertEqual(sum(m.count("x" * 30) for m in inner.messages), 10)
+
+    def test_min_interval_spaces_out_sends(self) -> None:
+        inner = RecordingNotifier()
+        sent_at: list[float] = []
+        original = inner.send
+
+        def timed_send(message: str) -> None:
+            sent_at.append(time.monotonic())
+            original(message)
+
+        inner.send = timed_send  # type: ignore[method-assign]
+        notifier = QueuedNotifier(inner, min_interval_seconds=0.2, coalesce_seconds=0.0)
+        notifier.send("first")
+        time.sleep(0.05)
+        notifier.send("second")
+        notifier.stop()
+
+        self.assertEqual(len(sent_at), 2)
+        self.assertGreaterEqual(sent_at[1] - sent_at[0], 0.19)
+
+    def test_drop_oldest_keeps_latest_messages(self) -> None:
+        inner = RecordingNotifier()
+        inner.gate.clear()
+        notifier = QueuedNotifier(
+            inner, max_queue_size=3, min_interval_seconds=0.0, coalesce_seconds=0.0
+        )
+        notifier.send("in-flight")
+        deadline = time.monotonic() + 2
+        while notifier.stats()["queue_depth"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for idx in range(6):
+            notifier.send(f"m{idx}")
+        self.assertEqual(notifier.stats()["dropped"], 3)
+        inner.gate.set()
+        notifier.stop()
+        self.assertEqual(inner.messages, ["in-flight", "m3\nm4\nm5"])
+
+    def test_drop_newest_rejects_new_messages(self) -> None:
+        inner = RecordingNotifier()
+        inner.gate.clear()
+        notifier = QueuedNotifier(
+            inner,
+            max_queue_size=2,
+            drop_policy="newest",
+            min_interval_seconds=0.0,
+            coalesce_seconds=0.0,
+        )
+        notifier.send("in-flight")
+        deadline = time.monotonic() + 2
+        while notifier.stats()["queue_depth"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for idx in range(4):
+            notifier.send(f"m{idx}")
+        inner.gate.set()
+        notifier.stop()
+        self.assertEqual(inner.messages, ["in-flight", "m0\nm1"])
+        self.assertEqual(notifier.stats()["dropped"], 2)
+
+    def test_failures_are_counted_and_do_not_stop_sender(self) -> None:
+        notifier = QueuedNotifier(FailingNotifier(), min_interval_seconds=0.0, coalesce_seconds=0.0)
+        notifier.send("a")
+        notifier.stop()
+        stats = notifier.stats()
+        self.assertEqual(stats["failed_batches"], 1)
+        self.assertIn("429", stats["last_error"])
+
+    def test_rejects_unknown_drop_policy(self) -> None:
+        with self.assertRaises(ValueError):
+            QueuedNotifier(RecordingNotifier(), drop_policy="random")
+
+    def test_router_exposes_notifier_stats(self) -> None:
+        class Bot:
+            def status(self) -> dict[str, object]:
+                return {"running": True}
+
+        notifier = QueuedNotifier(RecordingNotifier(), min_interval_seconds=0.0)
+        router = ApiRouter(Bot(), telegram_commands=None, api_token="", notifier_stats=notifier)
+        response = router.handle("GET", "/notifier", {})
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.payload["queue_depth"], 0)
+
+        bare = ApiRouter(Bot(), telegram_commands=None, api_token="")
+        self.assertEqual(bare.handle("GET", "/notifier", {}).code, 409)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+import unittest
+
+from namoo_overseas_bot.market_data.csv_feed import load_candle_series
+from namoo_overseas_bot.market_data.series import CandleSeries
+from namoo_overseas_bot.market_data.shared import SharedCandleSeries, SharedSeriesHandle, attach_series
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.sweep import build_grid, parse_grid, run_sweep
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _checksum(handle: SharedSeriesHandle) -> tuple[int, float, str]:
+    series = attach_series(handle)
+    return os.getpid(), sum(series.close) + sum(series.timestamps), series[len(series) - 1].timestamp
+
+
+class SharedCandleSeriesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.series = load_candle_series("data/sample_us_stock.csv", symbol="AAPL")
+
+    def test_attached_series_is_a_view_of_one_copy(self) -> None:
+        with SharedCandleSeries(self.series) as shared:
+            self.assertEqual(shared.nbytes, len(self.series) * 48)
+            first, second = attach_series(shared.handle), attach_series(shared.handle)
+            self.assertEqual(list(first), list(self.series))
+            self.assertEqual(first.timestamp_format, self.series.timestamp_format)
+
+            first.close[0] = -1.0
+            self.assertEqual(second.close[0], -1.0)
+            self.assertNotEqual(self.series.close[0], -1.0)
+        self.assertTrue(shared.closed)
+        with self.assertRaises(FileNotFoundError):
+            attach_series(shared.handle)
+
+    def test_per_row_timestamp_labels_are_attached(self) -> None:
+        series = CandleSeries.from_candles(
+            Candle(symbol="AAPL", timestamp=ts, open=1.0, high=1.0, low=1.0, close=1.0, volume=1.0)
+            for ts in ("2024-03-08T09:30:00-05:00", "2024-03-11T09:30:00-04:00")
+        )
+        with SharedCandleSeries(series) as shared:
+            self.assertEqual(list(attach_series(shared.handle)), list(series))
+
+    def test_empty_series(self) -> None:
+        with SharedCandleSeries(CandleSeries.empty("AAPL")) as shared:
+            self.assertEqual(len(attach_series(shared.handle)), 0)
+
+    def test_worker_processes_attach_without_a_copy_in_the_task(self) -> None:
+        with SharedCandleSeries(self.series) as shared:
+            try:
+                with ProcessPoolExecutor(max_workers=2) as executor:
+                    results = list(executor.map(_checksum, [shared.handle] * 4))
+            except (OSError, PermissionError):
+                self.skipTest("process pools are not permitted in this environment")
+        expected = sum(self.series.close) + sum(self.series.timestamps)
+        self.assertTrue(all(pid != os.getpid() for pid, _, _ in results))
+        self.assertEqual({(total, last) for _, total, last in results}, {(expected, self.series.timestamp_at(-1))})
+
+    def test_block_is_removed_when_the_publisher_is_killed(self) -> None:
+        script = (
+            "import os, sys\n"
+            "from namoo_overseas_bot.market_data.csv_feed import load_candle_series\n"
+            "from namoo_overseas_bot.market_data.shared import SharedCandleSeries\n"
+            "shared = SharedCandleSeries(load_candle_series('data/sample_us_stock.csv', symbol='AAPL'))\n"
+            "print(shared.handle.name, flush=True)\n"
+            "os._exit(1)\n"
+        )
+        env = {**os.environ, "PYTHONPATH": str(SRC)}
+        done = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60)
+        name = done.stdout.strip()
+        self.assertTrue(name, done.stderr)
+        handle = SharedSeriesHandle(name=name, symbol="AAPL", timestamp_format="", rows=0)
+
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                attach_series(handle)
+            except FileNotFoundError:
+                break
+            if time.monotonic() > deadline:
+                self.fail(f"shared memory block {name} outlived its publisher")
+            time.sleep(0.05)
+
+
+class SharedMemorySweepTests(unittest.TestCase):
+    def test_parallel_sweep_over_shared_series_matches_serial(self) -> None:
+        series = load_candle_series("data/sample_us_stock.csv", symbol="AAPL")
+        grid = build_grid(parse_grid("2:6"), parse_grid("5:12"), [1])
+        options: dict = {"symbol": "AAPL", "initial_cash_usd": 10_000, "vectorized": False}
+        serial = run_sweep(series, grid, workers=1, **options)
+        try:
+            parallel = run_sweep(series, grid, workers=2, chunksize=5, **options)
+        except (OSError, PermissionError):
+            self.skipTest("process pools are not permitted in this environment")
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.api_server import BotApiServer
+from namoo_overseas_bot.runtime.async_http import http_request
+from namoo_overseas_bot.runtime.async_runtime import AsyncBotRuntime
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.runtime.status_snapshot import StatusPublisher
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+def _bot(*, tick_seconds: float = 60) -> PaperTradingBot:
+    candles = [
+        Candle(
+            symbol="AAPL",
+            timestamp=f"2026-01-{idx + 1:02d}",
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for idx, close in enumerate([100, 101, 102, 103, 99, 98])
+    ]
+    return PaperTradingBot(
+        broker=PaperBroker(initial_cash_usd=10_000),
+        strategy=SmaCrossStrategy(short_window=2, long_window=3),
+        notifier=NoOpNotifier(),
+        symbol="AAPL",
+        quantity=1,
+        candles=candles,
+        tick_seconds=tick_seconds,
+        max_position_qty=1,
+    )
+
+
+def _get(url: str, headers: dict[str, str] | None = None) -> tuple[int, dict[str, str], bytes]:
+    req = urllib.request.Request(url=url, headers=headers or {}, method="GET")
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return resp.status, dict(resp.headers), resp.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, dict(exc.headers), exc.read()
+
+
+class StatusPublisherTests(unittest.TestCase):
+    def test_version_moves_only_when_payload_changes(self) -> None:
+        publisher = StatusPublisher()
+        first = publisher.publish({"loop_count": 1})
+        same = publisher.publish({"loop_count": 1})
+        second = publisher.publish({"loop_count": 2})
+
+        self.assertIs(first, same)
+        self.assertEqual((first.version, second.version), (1, 2))
+        self.assertNotEqual(first.etag, second.etag)
+        self.assertEqual(json.loads(second.body), {"loop_count": 2, "version": 2})
+
+    def test_wait_for_change_returns_immediately_for_stale_version(self) -> None:
+        publisher = StatusPublisher()
+        publisher.publish({"a": 1})
+        started = time.perf_counter()
+        self.assertEqual(publisher.wait_for_change(0, timeout=5).version, 1)
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_wait_for_change_wakes_on_publish_and_times_out(self) -> None:
+        publisher = StatusPublisher()
+        publisher.publish({"a": 1})
+        self.assertEqual(publisher.wait_for_change(1, timeout=0.05).version, 1)
+
+        timer = threading.Timer(0.05, publisher.publish, args=({"a": 2},))
+        timer.start()
+        self.assertEqual(publisher.wait_for_change(1, timeout=5).version, 2)
+        timer.join()
+
+    def test_subscribers_see_every_new_snapshot_until_unsubscribed(self) -> None:
+        publisher = StatusPublisher()
+        seen: list[int] = []
+        unsubscribe = publisher.subscribe(lambda snapshot: seen.append(snapshot.version))
+        publisher.publish({"a": 1})
+        publisher.publish({"a": 2})
+        unsubscribe()
+        publisher.publish({"a": 3})
+        self.assertEqual(seen, [1, 2])
+
+    def test_bot_publishes_after_each_state_change(self) -> None:
+        bot = _bot()
+        version = bot.status_publisher.latest.version
+        bot.process_next_candle()
+        bot.pause()
+        latest = bot.status_publisher.latest
+        self.assertEqual(latest.version, version + 2)
+        payload = json.loads(latest.body)
+        self.assertEqual(payload.pop("version"), latest.version)
+        self.assertEqual(payload, bot.status())
+
+
+class StatusEndpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot = _bot()
+        try:
+            self.server = BotApiServer(
+                bot=self.bot,
+                host="127.0.0.1",
+                port=0,
+                status_snapshots=self.bot.status_publisher,
+            )
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.server.server_address
+        self.base_url = f"http://{host}:{port}"
+        self.addCleanup(self.server.shutdown)
+
+    def test_status_serves_snapshot_with_etag_and_304(self) -> None:
+        code, headers, body = _get(f"{self.base_url}/status")
+        self.assertEqual(code, 200)
+        self.assertEqual(body, self.bot.status_publisher.latest.body)
+        etag = headers["ETag"]
+
+        code, _, body = _get(f"{self.base_url}/status", {"If-None-Match": etag})
+        self.assertEqual((code, body), (304, b""))
+
+        self.bot.process_next_candle()
+        code, headers, _ = _get(f"{self.base_url}/status", {"If-None-Match": etag})
+        self.assertEqual(code, 200)
+        self.assertNotEqual(headers["ETag"], etag)
+
+    def test_long_poll_wakes_on_next_change(self) -> None:
+        version = self.bot.status_publisher.latest.version
+        timer = threading.Timer(0.1, self.bot.process_next_candle)
+        timer.start()
+        started = time.perf_counter()
+        code, headers, body = _get(f"{self.base_url}/status?since={version}&timeout=5")
+        timer.join()
+
+        self.assertEqual(code, 200)
+        self.assertLess(time.perf_counter() - started, 4)
+        self.assertEqual(int(headers["X-Status-Version"]), version + 1)
+        self.assertEqual(json.loads(body)["loop_count"], 1)
+
+    def test_long_poll_times_out_with_current_snapshot(self) -> None:
+        version = self.bot.status_publisher.latest.version
+        code, headers, _ = _get(f"{self.base_url}/status?since={version}&timeout=0.05")
+        self.assertEqual(code, 200)
+        self.assertEqual(int(headers["X-Status-Version"]), version)
+
+    def test_invalid_since_is_rejected(self) -> None:
+        code, _, _ = _get(f"{self.base_url}/status?since=abc")
+        self.assertEqual(code, 400)
+
+
+class AsyncStatusLongPollTests(unittest.IsolatedAsyncioTestCase):
+    async def test_long_poll_does_not_block_the_event_loop(self) -> None:
+        bot = _bot(tick_seconds=60)
+        runtime = AsyncBotRuntime(
+            bot=bot, host="127.0.0.1", port=0, status_snapshots=bot.status_publisher
+        )
+        try:
+            await runtime.start()
+        except PermissionError:
+            self.skipTest("socket bind is not permitted in this environment")
+        host, port = runtime.server_address
+        base_url = f"http://{host}:{port}"
+        # Let the trading task run its first tick before picking the version to wait on.
+        await asyncio.sleep(0.05)
+
+        version = bot.status_publisher.latest.version
+        poll = asyncio.create_task(
+            http_request("GET", f"{base_url}/status?since={version}&timeout=5", timeout=10)
+        )
+        await asyncio.sleep(0.05)
+        self.assertFalse(poll.done())
+
+        # Other requests are still served while the long-poll is parked.
+        status, _ = await http_request("POST", f"{base_url}/pause", timeout=2)
+        self.assertEqual(status, 200)
+
+        status, body = await asyncio.wait_for(poll, timeout=2)
+        self.assertEqual(status, 200)
+        self.assertTrue(json.loads(body)["paused"])
+
+        bot.stop()
+        await asyncio.wait_for(runtime.wait_stopped(), timeout=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
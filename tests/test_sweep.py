@@ -0,0 +1,97 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.csv_feed import load_candles
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.sweep import build_grid, parse_grid, run_sweep, write_results_csv
+
+
+class ParseGridTests(unittest.TestCase):
+    def test_inclusive_range_and_list(self) -> None:
+        self.assertEqual(parse_grid("2:6:2"), [2, 4, 6])
+        self.assertEqual(parse_grid("3:5"), [3, 4, 5])
+        self.assertEqual(parse_grid("3, 5,8"), [3, 5, 8])
+
+    def test_rejects_bad_step(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_grid("1:5:0")
+
+    def test_build_grid_skips_invalid_pairs(self) -> None:
+        grid = build_grid([2, 5], [3, 5], [1])
+        pairs = [(p.short_window, p.long_window) for p in grid]
+        self.assertEqual(pairs, [(2, 3), (2, 5)])
+
+
+class RunSweepTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.candles = load_candles("data/sample_us_stock.csv", symbol="AAPL")
+        self.grid = build_grid(parse_grid("2:6"), parse_grid("5:12"), [1, 2])
+
+    def test_matches_engine_and_is_ranked(self) -> None:
+        results = run_sweep(
+            self.candles,
+            self.grid,
+            symbol="AAPL",
+            initial_cash_usd=10_000,
+            workers=1,
+            vectorized=False,
+        )
+        self.assertEqual(len(results), len(self.grid))
+        equities = [r.equity for r in results]
+        self.assertEqual(equities, sorted(equities, reverse=True))
+
+        best = results[0]
+        expected = TradingEngine(
+            broker=PaperBroker(initial_cash_usd=10_000),
+            strategy=SmaCrossStrategy(short_window=best.short_window, long_window=best.long_window),
+            symbol="AAPL",
+            quantity=best.quantity,
+        ).run(self.candles)
+        self.assertEqual(best.equity, expected.equity)
+        self.assertEqual(best.trades, expected.trades)
+
+    def test_process_pool_matches_serial(self) -> None:
+        serial = run_sweep(
+            self.candles,
+            self.grid,
+            symbol="AAPL",
+            initial_cash_usd=10_000,
+            workers=1,
+            vectorized=False,
+        )
+        try:
+            parallel = run_sweep(
+                self.candles,
+                self.grid,
+                symbol="AAPL",
+                initial_cash_usd=10_000,
+                workers=2,
+                chunksize=5,
+                vectorized=False,
+            )
+        except (OSError, PermissionError):
+            self.skipTest("process pools are not permitted in this environment")
+        self.assertEqual(parallel, serial)
+
+    def test_write_results_csv(self) -> None:
+        results = run_sweep(
+            self.candles,
+            self.grid[:3],
+            symbol="AAPL",
+            initial_cash_usd=10_000,
+            workers=1,
+            vectorized=False,
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sweep.csv"
+            write_results_csv(results, path)
+            lines = path.read_text(encoding="utf-8").splitlines()
+        self.assertTrue(lines[0].startswith("rank,short_window,long_window,quantity"))
+        self.assertEqual(len(lines), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import threading
+import time
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.brokers.throttle import ORDER, QUERY, ThrottledBroker
+from namoo_overseas_bot.metrics import BotMetrics
+from namoo_overseas_bot.models import Order, Side
+
+
+def _buy(qty: int = 1) -> Order:
+    return Order(symbol="AAPL", side=Side.BUY, qty=qty)
+
+
+class ThrottledBrokerTests(unittest.TestCase):
+    def test_burst_then_paced_instead_of_rejected(self) -> None:
+        broker = ThrottledBroker(PaperBroker(initial_cash_usd=1_000.0), orders_per_second=20, burst=2)
+        started = time.monotonic()
+        for _ in range(6):
+            broker.submit_order(_buy(), price=1.0, timestamp="t")
+        elapsed = time.monotonic() - started
+
+        self.assertGreaterEqual(elapsed, 0.18)
+        self.assertEqual(broker.inner.position_qty("AAPL"), 6)
+        stats = broker.stats()[ORDER]
+        self.assertEqual(stats.calls, 6)
+        self.assertGreaterEqual(stats.delayed, 3)
+        self.assertGreater(stats.max_wait_seconds, 0.02)
+        self.assertEqual(broker.stats()[QUERY].calls, 0)
+
+    def test_queries_do_not_spend_order_capacity(self) -> None:
+        broker = ThrottledBroker(
+            PaperBroker(initial_cash_usd=1_000.0), orders_per_second=100, queries_per_second=1, burst=1
+        )
+        broker.cash_balance()
+        waiter = threading.Thread(target=broker.cash_balance)
+        waiter.start()
+        self.addCleanup(waiter.join)
+
+        started = time.monotonic()
+        broker.submit_order(_buy(), price=1.0, timestamp="t")
+        self.assertLess(time.monotonic() - started, 0.3)
+        self.assertEqual(broker.queue_depth(QUERY), 1)
+
+    def test_orders_jump_ahead_of_queries_on_a_shared_limit(self) -> None:
+        broker = ThrottledBroker(PaperBroker(initial_cash_usd=1_000.0), requests_per_second=5, burst=1)
+        broker.positions()
+        finished: list[str] = []
+        query = threading.Thread(target=lambda: (broker.account_snapshot(), finished.append(QUERY)))
+        order = threading.Thread(
+            target=lambda: (broker.submit_order(_buy(), 1.0, "t"), finished.append(ORDER))
+        )
+        query.start()
+        time.sleep(0.05)
+        order.start()
+        query.join(5)
+        order.join(5)
+
+        self.assertEqual(finished, [ORDER, QUERY])
+        self.assertEqual(broker.queue_depth(ORDER), 0)
+
+    def test_delegates_state_and_records_wait_histogram(self) -> None:
+        metrics = BotMetrics()
+        inner = PaperBroker(initial_cash_usd=1_000.0)
+        broker = ThrottledBroker(
+            inner, orders_per_second=1_000, queries_per_second=1_000, wait_histogram=metrics.throttle_wait_seconds
+        )
+        broker.submit_orders([_buy(2)], {"AAPL": 10.0}, "t")
+        self.assertEqual(broker.account_snapshot(), inner.account_snapshot())
+        self.assertEqual(broker.export_state(), inner.export_state())
+
+        rendered = metrics.render()
+        self.assertIn('namoo_broker_throttle_wait_seconds_count{kind="order"} 1', rendered)
+        self.assertIn('namoo_broker_throttle_wait_seconds_count{kind="query"} 1', rendered)
+
+    def test_unlimited_lanes_still_count_calls(self) -> None:
+        broker = ThrottledBroker(PaperBroker(initial_cash_usd=1_000.0))
+        broker.cash_balance()
+        broker.position_qty("AAPL")
+        self.assertEqual(broker.stats()[QUERY].calls, 2)
+        self.assertEqual(broker.stats()[QUERY].mean_wait_seconds, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import time
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.feed import ReplayFeed
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.notifiers.noop import NoOpNotifier
+from namoo_overseas_bot.runtime.api_server import ApiRouter
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+from namoo_overseas_bot.tracing import StageTracer, format_summary
+
+CLOSES = [100, 101, 102, 103, 99, 98, 97, 104]
+
+
+def _candles() -> list[Candle]:
+    return [
+        Candle(
+            symbol="AAPL",
+            timestamp=f"2026-01-{idx + 1:02d}",
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for idx, close in enumerate(CLOSES)
+    ]
+
+
+def _bot(tracer: StageTracer | None) -> PaperTradingBot:
+    return PaperTradingBot(
+        broker=PaperBroker(initial_cash_usd=10_000),
+        strategy=SmaCrossStrategy(short_window=2, long_window=3),
+        notifier=NoOpNotifier(),
+        symbol="AAPL",
+        quantity=1,
+        candles=_candles(),
+        tick_seconds=60,
+        max_position_qty=1,
+        tracer=tracer,
+    )
+
+
+class _SlowFeed(ReplayFeed):
+    def poll(self) -> Candle | None:
+        time.sleep(0.02)
+        return super().poll()
+
+
+def _engine(tracer: StageTracer | None) -> TradingEngine:
+    return TradingEngine(
+        broker=PaperBroker(initial_cash_usd=10_000),
+        strategy=SmaCrossStrategy(short_window=2, long_window=3),
+        symbol="AAPL",
+        quantity=1,
+        tracer=tracer,
+    )
+
+
+class StageTracerTests(unittest.TestCase):
+    def test_ring_buffer_keeps_last_ticks(self) -> None:
+        tracer = StageTracer(capacity=3)
+        for idx in range(5):
+            tracer.record(
+                symbol="AAPL",
+                candle_timestamp=str(idx),
+                signal="hold",
+                total_seconds=0.001 * (idx + 1),
+                stages={"strategy": 0.001},
+            )
+
+        traces = tracer.recent()
+        self.assertEqual([t.candle_timestamp for t in traces], ["2", "3", "4"])
+        self.assertEqual([t.seq for t in tracer.recent(limit=1)], [5])
+
+        summary = tracer.summary()
+        self.assertEqual(summary["total"]["count"], 3)
+        self.assertAlmostEqual(summary["total"]["max_seconds"], 0.005)
+        self.assertAlmostEqual(summary["strategy"]["mean_seconds"], 0.001)
+        self.assertIn("strategy", format_summary(summary))
+
+    def test_rejects_non_positive_capacity(self) -> None:
+        with self.assertRaises(ValueError):
+            StageTracer(capacity=0)
+
+
+class BotTracingTests(unittest.TestCase):
+    def test_each_tick_records_its_stages(self) -> None:
+        tracer = StageTracer()
+        bot = _bot(tracer)
+        for _ in CLOSES:
+            bot.process_next_candle()
+
+        traces = tracer.recent()
+        self.assertEqual(len(traces), len(CLOSES))
+        for trace in traces:
+            self.assertTrue({"fetch", "strategy", "state", "notify"} <= set(trace.stages))
+            self.assertGreaterEqual(trace.total_seconds, sum(trace.stages.values()) * 0.999)
+
+        filled = [t for t in traces if "broker" in t.stages]
+        self.assertEqual(len(filled), bot.status()["trades"])
+        self.assertTrue(all(t.signal in {"buy", "sell"} for t in filled))
+
+    def test_fetch_stage_includes_the_feed_poll(self) -> None:
+        tracer = StageTracer()
+        bot = PaperTradingBot(
+            broker=PaperBroker(initial_cash_usd=10_000),
+            strategy=SmaCrossStrategy(short_window=2, long_window=3),
+            notifier=NoOpNotifier(),
+            symbol="AAPL",
+            quantity=1,
+            tick_seconds=60,
+            max_position_qty=1,
+            feed=_SlowFeed(_candles()),
+            tracer=tracer,
+        )
+        bot.process_next_candle()
+
+        (trace,) = tracer.recent()
+        self.assertGreaterEqual(trace.stages["fetch"], 0.02)
+
+
+class EngineTracingTests(unittest.TestCase):
+    def test_one_trace_per_bar_and_same_result(self) -> None:
+        tracer = StageTracer()
+        traced = _engine(tracer).run(_candles())
+        plain = _engine(None).run(_candles())
+
+        self.assertEqual(traced, plain)
+        traces = tracer.recent()
+        self.assertEqual([t.candle_timestamp for t in traces], [c.timestamp for c in _candles()])
+        self.assertEqual(sum("broker" in t.stages for t in traces), traced.trades)
+
+
+class DebugTraceEndpointTests(unittest.TestCase):
+    def test_requires_token(self) -> None:
+        tracer = StageTracer()
+        router = ApiRouter(_bot(tracer), telegram_commands=None, api_token="secret", tracer=tracer)
+        self.assertEqual(router.handle("GET", "/debug/trace", {}).code, 401)
+
+    def test_conflict_when_tracing_is_off(self) -> None:
+        router = ApiRouter(_bot(None), telegram_commands=None, api_token="")
+        self.assertEqual(router.handle("GET", "/debug/trace", {}).code, 409)
+
+    def test_returns_recent_ticks(self) -> None:
+        tracer = StageTracer()
+        bot = _bot(tracer)
+        for _ in range(4):
+            bot.process_next_candle()
+        router = ApiRouter(bot, telegram_commands=None, api_token="", tracer=tracer)
+
+        response = router.handle("GET", "/debug/trace?limit=2", {})
+        self.assertEqual(response.code, 200)
+        self.assertEqual([t["seq"] for t in response.payload["ticks"]], [3, 4])
+        self.assertEqual(response.payload["summary"]["total"]["count"], 4)
+
+        self.assertEqual(router.handle("GET", "/debug/trace?limit=x", {}).code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
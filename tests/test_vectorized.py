@@ -0,0 +1,115 @@
+import random
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.engine import TradingEngine
+from namoo_overseas_bot.market_data.csv_feed import load_candles
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+try:
+    import numpy as np
+
+    from namoo_overseas_bot.vectorized import VectorizedSmaBacktest
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
+
+def _candles(closes: list[float]) -> list[Candle]:
+    return [
+        Candle(
+            symbol="AAPL",
+            timestamp=f"t{idx}",
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for idx, close in enumerate(closes)
+    ]
+
+
+def _random_walk(n: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    price = 100.0
+    closes: list[float] = []
+    for _ in range(n):
+        price = max(1.0, price + rng.gauss(0, 1))
+        closes.append(round(price, 2))
+    return closes
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class VectorizedSmaBacktestTests(unittest.TestCase):
+    def _assert_matches_loop(
+        self,
+        candles: list[Candle],
+        *,
+        short_window: int,
+        long_window: int,
+        quantity: int = 1,
+        initial_cash_usd: float = 100_000.0,
+    ) -> None:
+        loop = TradingEngine(
+            broker=PaperBroker(initial_cash_usd=initial_cash_usd),
+            strategy=SmaCrossStrategy(short_window=short_window, long_window=long_window),
+            symbol="AAPL",
+            quantity=quantity,
+        ).run(candles, record_equity=True)
+        vectorized = VectorizedSmaBacktest(
+            short_window=short_window,
+            long_window=long_window,
+            quantity=quantity,
+            initial_cash_usd=initial_cash_usd,
+        ).run(candles)
+
+        self.assertEqual(vectorized.trades, loop.trades)
+        self.assertEqual(vectorized.cash, loop.cash)
+        self.assertEqual(vectorized.position_qty, loop.position_qty)
+        self.assertEqual(vectorized.last_price, loop.last_price)
+        self.assertEqual(vectorized.equity, loop.equity)
+        self.assertEqual(list(vectorized.equity_curve), loop.equity_curve)
+
+    def test_matches_loop_engine_on_sample_csv(self) -> None:
+        candles = load_candles("data/sample_us_stock.csv", symbol="AAPL")
+        self._assert_matches_loop(candles, short_window=5, long_window=20, initial_cash_usd=10_000)
+        self._assert_matches_loop(candles, short_window=2, long_window=3, quantity=3)
+
+    def test_matches_loop_engine_on_random_walk(self) -> None:
+        candles = _candles(_random_walk(5000, seed=3))
+        for short_window, long_window in [(2, 3), (5, 20), (20, 100)]:
+            self._assert_matches_loop(
+                candles,
+                short_window=short_window,
+                long_window=long_window,
+                quantity=2,
+            )
+
+    def test_first_sell_signal_without_position_is_skipped(self) -> None:
+        candles = _candles([10, 9, 8, 7, 8, 9, 10, 11, 9, 7])
+        self._assert_matches_loop(candles, short_window=2, long_window=3)
+
+    def test_insufficient_cash_raises_like_paper_broker(self) -> None:
+        backtest = VectorizedSmaBacktest(
+            short_window=2,
+            long_window=3,
+            quantity=20,
+            initial_cash_usd=50,
+        )
+        with self.assertRaises(ValueError):
+            backtest.run(_candles([1, 2, 3, 4, 5]))
+
+    def test_empty_series(self) -> None:
+        result = VectorizedSmaBacktest(
+            short_window=2,
+            long_window=3,
+            quantity=1,
+            initial_cash_usd=1000,
+        ).run([])
+        self.assertEqual(result.trades, 0)
+        self.assertEqual(result.equity, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
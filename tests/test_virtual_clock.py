@@ -0,0 +1,153 @@
+from pathlib import Path
+import tempfile
+import threading
+import time
+import unittest
+
+from namoo_overseas_bot.brokers.paper import PaperBroker
+from namoo_overseas_bot.market_data.feed import ReplayFeed
+from namoo_overseas_bot.models import Candle
+from namoo_overseas_bot.runtime.checkpoint import CheckpointStore
+from namoo_overseas_bot.runtime.clock import VirtualClock
+from namoo_overseas_bot.runtime.paper_bot import PaperTradingBot
+from namoo_overseas_bot.strategies.sma_cross import SmaCrossStrategy
+
+
+class _RecordingNotifier:
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def send(self, message: str) -> None:
+        self.messages.append(message)
+
+
+CLOSES = [10, 11, 12, 13, 9, 8, 7, 14, 15, 16, 6, 5] * 50
+
+
+def _candles() -> list[Candle]:
+    return [
+        Candle("AAPL", f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}", c, c, c, c, 1)
+        for i, c in enumerate(CLOSES)
+    ]
+
+
+def _bot(feed: ReplayFeed, clock: VirtualClock | None, notifier: _RecordingNotifier) -> PaperTradingBot:
+    return PaperTradingBot(
+        broker=PaperBroker(initial_cash_usd=10_000),
+        strategy=SmaCrossStrategy(short_window=2, long_window=3),
+        notifier=notifier,
+        symbol="AAPL",
+        quantity=1,
+        feed=feed,
+        tick_seconds=3600,
+        max_position_qty=1,
+        clock=clock,
+    )
+
+
+def _wait_stopped(bot: PaperTradingBot, timeout: float = 10) -> None:
+    stopped = threading.Event()
+    bot.add_state_listener(lambda: bot.stopped and stopped.set())
+    if not bot.stopped:
+        stopped.wait(timeout)
+
+
+class VirtualClockTests(unittest.TestCase):
+    def test_full_speed_advances_without_sleeping(self) -> None:
+        clock = VirtualClock(start=100.0)
+        event = threading.Event()
+        started = time.monotonic()
+        for _ in range(1_000):
+            self.assertFalse(clock.wait(event, 3600))
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(clock.now(), 100.0 + 3_600_000)
+
+        event.set()
+        self.assertTrue(clock.wait(event, 3600))
+        self.assertEqual(clock.now(), 100.0 + 3_600_000)
+
+    def test_speed_multiplier_scales_real_waits(self) -> None:
+        clock = VirtualClock(speed=100)
+        event = threading.Event()
+        started = time.monotonic()
+        self.assertFalse(clock.wait(event, 5))
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        self.assertEqual(clock.now(), 5)
+
+        threading.Timer(0.05, event.set).start()
+        self.assertTrue(clock.wait(event, 3600))
+        self.assertLess(clock.now(), 3600)
+
+        with self.assertRaises(ValueError):
+            VirtualClock(speed=0)
+
+
+class FastForwardReplayTests(unittest.TestCase):
+    def test_replay_runs_hours_of_ticks_in_moments_and_stops_at_the_end(self) -> None:
+        notifier = _RecordingNotifier()
+        fast = _bot(ReplayFeed(_candles(), loop=False), VirtualClock(), notifier)
+        snapshots: list[int] = []
+        fast.status_publisher.subscribe(lambda snapshot: snapshots.append(snapshot.version))
+
+        started = time.monotonic()
+        fast.start()
+        _wait_stopped(fast)
+        self.assertTrue(fast.stopped)
+        self.assertLess(time.monotonic() - started, 10)
+
+        # Same trading, notifications and status as stepping the bot by hand.
+        stepped_notifier = _RecordingNotifier()
+        stepped = _bot(ReplayFeed(_candles(), loop=False), None, stepped_notifier)
+        for _ in range(len(CLOSES)):
+            stepped.run_once()
+        stepped.run_once()
+
+        status = fast.status()
+        self.assertEqual(status["loop_count"], len(CLOSES))
+        self.assertFalse(status["running"])
+        for key in ("trades", "cash", "position_qty", "last_candle_timestamp"):
+            self.assertEqual(status[key], stepped.status()[key])
+        self.assertEqual(notifier.messages[1:], stepped_notifier.messages)
+        self.assertIn("[완료]", notifier.messages[-2])
+        self.assertGreaterEqual(len(snapshots), len(CLOSES))
+
+    def test_paused_max_speed_replay_waits_instead_of_spinning(self) -> None:
+        clock = VirtualClock()
+        bot = _bot(ReplayFeed(_candles(), loop=False), clock, _RecordingNotifier())
+        on_price = bot.strategy.on_price
+
+        def pause_on_the_50th_bar(price: float):  # type: ignore[no-untyped-def]
+            if bot.status()["loop_count"] == 49:
+                bot.pause()
+            return on_price(price)
+
+        bot.strategy.on_price = pause_on_the_50th_bar  # type: ignore[method-assign]
+        bot.start()
+        time.sleep(0.2)
+        paused_at = clock.now()
+        time.sleep(0.2)
+        self.assertEqual(clock.now(), paused_at)
+        self.assertEqual(bot.status()["loop_count"], 50)
+
+        bot.resume()
+        _wait_stopped(bot)
+        self.assertEqual(bot.status()["loop_count"], len(CLOSES))
+
+    def test_resumed_replay_continues_from_the_checkpointed_bar(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = CheckpointStore(Path(tmp) / "ck.json", interval_seconds=3600)
+            first = _bot(ReplayFeed(_candles(), loop=False), VirtualClock(), _RecordingNotifier())
+            for _ in range(100):
+                first.run_once()
+            self.assertTrue(store.save(first))
+
+            resumed = _bot(ReplayFeed(_candles(), loop=False), VirtualClock(), _RecordingNotifier())
+            store.restore(resumed)
+            resumed.start()
+            _wait_stopped(resumed)
+
+        self.assertEqual(resumed.status()["loop_count"], len(CLOSES))
+
+
+if __name__ == "__main__":
+    unittest.main()